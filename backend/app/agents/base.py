@@ -1,16 +1,46 @@
 # backend/app/agents/base.py
 from google.adk.models.google_llm import Gemini
 from google.adk.tools import FunctionTool
+from google.adk.models.base_llm import BaseLlm
 from ..core.config import settings
 from ..llm.retry_config import retry_config
+from ..llm.rate_limiter import RateLimitedGemini, gemini_rate_limiters
+from ..llm.fake_llm import FakeLlm
+from ..llm.cassette import RecordingLlm, replay_from_settings
+from ..llm.model_registry import ModelRegistry, parse_agent_tiers, parse_tiers
 from ..tools import wellness_tools, productivity_tools, quiz_tools, interview_tools
 
-# 1. Initialize Model
-gemini_model = Gemini(
-    model="gemini-2.5-flash", 
-    retry_options=retry_config, 
-    api_key=settings.GOOGLE_API_KEY
+# 1. Initialize Models (paced by their model's rate limiter unless disabled;
+#    LLM_BACKEND=fake swaps in the offline stand-in, replay serves cassettes)
+def build_model(model_id: str) -> BaseLlm:
+    if settings.LLM_BACKEND == "fake":
+        llm = FakeLlm.from_settings(model_id)
+    elif settings.LLM_BACKEND == "replay":
+        llm = replay_from_settings(model_id)
+    else:
+        model_class = RateLimitedGemini if settings.GEMINI_RATE_LIMIT_ENABLED else Gemini
+        llm = model_class(
+            model=model_id, 
+            retry_options=retry_config, 
+            api_key=settings.GOOGLE_API_KEY
+        )
+    if settings.LLM_CASSETTE_RECORD:
+        llm = RecordingLlm(model=llm.model, inner=llm, cassette_dir=settings.LLM_CASSETTE_DIR)
+    return llm
+
+# Agents are defined on the default tier's model; SynergyAIRunner applies the
+# per-agent routing (AGENT_MODEL_TIERS) to every workflow it registers
+model_registry = ModelRegistry(
+    tiers=parse_tiers(settings.MODEL_TIERS),
+    agent_tiers=parse_agent_tiers(settings.AGENT_MODEL_TIERS),
+    default_tier=settings.DEFAULT_MODEL_TIER,
+    factory=build_model
 )
+# Tiers may carry their own rate limit budget; limiters are per model id
+for tier in model_registry.tiers.values():
+    if tier.rpm or tier.tpm:
+        gemini_rate_limiters.configure(tier.model, tier.rpm, tier.tpm)
+gemini_model = model_registry.model(model_registry.tiers[settings.DEFAULT_MODEL_TIER].model)
 
 # 2. Initialize Function Tools
 wellness_tool = FunctionTool(wellness_tools.get_personalized_wellness_tip)
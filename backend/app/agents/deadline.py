@@ -0,0 +1,183 @@
+"""
+Deadline-aware parallel agent.
+
+A per-request deadline is carried in a context variable (set by the runner),
+so it reaches every sub-agent task without going through session state.
+"""
+import json
+import time
+import asyncio
+import hashlib
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import AsyncGenerator, Dict, List, Optional
+
+from google.adk.agents import ParallelAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+from google.adk.utils.context_utils import Aclosing
+
+from ..services import metrics
+from ..services.response_cache import normalize_text
+
+logger = logging.getLogger(__name__)
+
+# time.monotonic() value by which the current request must be answered
+request_deadline: ContextVar[Optional[float]] = ContextVar("request_deadline", default=None)
+
+# Session state key listing the sections that were not produced in time
+MISSING_SECTIONS_KEY = "missing_sections"
+
+# Session state keys for section reuse: the input fingerprint each stored
+# section was produced from, and the sections the last run kept as they were
+SECTION_INPUTS_KEY = "section_inputs"
+REUSED_SECTIONS_KEY = "reused_sections"
+
+def branch_context(agent, sub_agent, ctx: InvocationContext) -> InvocationContext:
+    """Isolated branch ("<branch>.<agent>.<sub_agent>") for a sub-agent, as ParallelAgent builds it.
+
+    Kept here rather than importing ADK's private helper, which can change
+    in any release.
+    """
+    branch_ctx = ctx.model_copy()
+    suffix = f"{agent.name}.{sub_agent.name}"
+    branch_ctx.branch = f"{ctx.branch}.{suffix}" if ctx.branch else suffix
+    return branch_ctx
+
+
+deadline_misses = metrics.registry.counter(
+    "synergy_agent_deadline_misses_total", "Sub-agents cancelled or failed at the request deadline",
+    ("workflow", "agent"))
+sections_reused = metrics.registry.counter(
+    "synergy_agent_sections_reused_total", "Sub-agents skipped because their inputs had not changed",
+    ("workflow", "agent"))
+
+
+def input_fingerprint(state, keys: List[str]) -> Optional[str]:
+    """Hash of the state values a sub-agent depends on (None if any is absent)."""
+    values = []
+    for key in keys:
+        if key not in state:
+            return None
+        value = state[key]
+        values.append(normalize_text(value) if isinstance(value, str) else value)
+    return hashlib.sha256(json.dumps(values, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+@contextmanager
+def deadline_scope(seconds: float):
+    """Give everything run inside the block a deadline `seconds` from now (<= 0: none)."""
+    token = request_deadline.set(time.monotonic() + seconds if seconds > 0 else None)
+    try:
+        yield
+    finally:
+        request_deadline.reset(token)
+
+
+class DeadlineParallelAgent(ParallelAgent):
+    """ParallelAgent that stops waiting for stragglers at the request deadline.
+
+    Sub-agents run concurrently as in ParallelAgent. When the deadline minus
+    `reserve_seconds` (time kept back for the agents that run afterwards)
+    passes, unfinished sub-agents are cancelled. A sub-agent that raises is
+    treated the same way instead of failing the whole request.
+
+    The agent always ends with one state update: `missing_sections` lists
+    the output keys (from `section_keys`, sub-agent name -> output key) that
+    were not produced, and each missing key is set to a short placeholder so
+    downstream prompts can still be filled and never read a stale value.
+
+    Sub-agents listed in `input_keys` (sub-agent name -> the state keys its
+    output depends on) are skipped when the session already holds their
+    section from a run with the same inputs; the stored section is reused
+    as is and listed in `reused_sections`.
+    """
+
+    section_keys: Dict[str, str] = {}
+    input_keys: Dict[str, List[str]] = {}
+    reserve_seconds: float = 0.0
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        deadline = request_deadline.get()
+        cutoff = None if deadline is None else deadline - self.reserve_seconds
+
+        state = ctx.session.state
+        previous = state.get(SECTION_INPUTS_KEY) or {}
+        fingerprints = {
+            agent.name: input_fingerprint(state, self.input_keys[agent.name])
+            for agent in self.sub_agents if agent.name in self.input_keys
+        }
+        reused = [
+            agent.name for agent in self.sub_agents
+            if fingerprints.get(agent.name) is not None
+            and previous.get(agent.name) == fingerprints[agent.name]
+            and self.section_keys.get(agent.name) in state
+        ]
+        to_run = [agent for agent in self.sub_agents if agent.name not in reused]
+        for name in reused:
+            sections_reused.inc(self.root_agent.name, name)
+
+        queue: asyncio.Queue = asyncio.Queue()
+        failed = set()
+
+        async def drive(sub_agent):
+            try:
+                branch_ctx = branch_context(self, sub_agent, ctx)
+                async with Aclosing(sub_agent.run_async(branch_ctx)) as agen:
+                    async for event in agen:
+                        # Wait for the runner to consume the event, as ParallelAgent does
+                        resume = asyncio.Event()
+                        await queue.put((event, resume))
+                        await resume.wait()
+            except Exception as e:
+                logger.warning("%s failed inside %s: %s", sub_agent.name, self.name, e)
+                failed.add(sub_agent.name)
+            finally:
+                queue.put_nowait((sub_agent.name, None))
+
+        tasks = [asyncio.create_task(drive(sub_agent)) for sub_agent in to_run]
+        pending = {sub_agent.name for sub_agent in to_run}
+        try:
+            while pending:
+                timeout = None if cutoff is None else cutoff - time.monotonic()
+                if timeout is not None and timeout <= 0:
+                    break
+                try:
+                    item, resume = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if resume is None:
+                    pending.discard(item)
+                    continue
+                yield item
+                resume.set()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        missing = [agent.name for agent in to_run if agent.name in pending or agent.name in failed]
+        # Only sections that were actually produced can be reused next time
+        inputs = {
+            name: fingerprint for name, fingerprint in fingerprints.items()
+            if fingerprint is not None and name not in missing
+        }
+        state_delta = {
+            MISSING_SECTIONS_KEY: [self.section_keys.get(name, name) for name in missing],
+            REUSED_SECTIONS_KEY: [self.section_keys.get(name, name) for name in reused],
+            SECTION_INPUTS_KEY: inputs
+        }
+        for name in missing:
+            deadline_misses.inc(self.root_agent.name, name)
+            key = self.section_keys.get(name)
+            if key:
+                reason = "did not finish in time" if name in pending else "failed"
+                state_delta[key] = f"(Unavailable: the {name} specialist {reason}.)"
+
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            actions=EventActions(state_delta=state_delta)
+        )
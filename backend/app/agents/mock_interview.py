@@ -1,13 +1,19 @@
 from google.adk.agents import LlmAgent
 from .base import gemini_model
+from ..core.config import settings
 from ..prompts.prompt_loader import load_prompt # Import the loader
 
+# With compaction on, the conversation reaches the agents through the bounded
+# {interview_context} state (see services/interview_memory.py), not the full history
+history_mode = "none" if settings.MOCK_INTERVIEW_COMPACTION else "default"
+
 # 1. Interactive Interviewer
 # This agent runs in a loop, asking one question at a time
 interactive_interviewer = LlmAgent(
     model=gemini_model,
     name="MockInterviewerAgent",
     instruction=load_prompt("interactive_interviewer.yaml"),
+    include_contents=history_mode,
     tools=[], 
     output_key="interview_transcript_segment"
 )
@@ -18,6 +24,7 @@ interview_evaluator = LlmAgent(
     model=gemini_model,
     name="EvaluatorAgent",
     instruction=load_prompt("interview_evaluator.yaml"),
+    include_contents=history_mode,
     tools=[], 
     output_key="final_interview_summary"
 )
\ No newline at end of file
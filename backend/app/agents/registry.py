@@ -0,0 +1,32 @@
+"""
+Agent Registry
+Where each runnable agent/workflow is defined. Nothing is imported until a
+key is loaded, so an agent's module (its LlmAgents, prompts and model) is
+only built when a request first needs it.
+"""
+import importlib
+from typing import Dict
+
+from google.adk.agents import BaseAgent
+
+# Runner key -> "module:attribute" inside app.agents
+AGENTS: Dict[str, str] = {
+    "daily_workflow": "workflows:daily_workflow",
+    "interview_workflow": "workflows:interview_workflow",
+    "interview_research": "workflows:interview_research_workflow",
+    "interview_personalizer": "workflows:interview_personalizer",
+    "quiz_workflow": "workflows:quiz_workflow",
+    "simple_job_search": "workflows:simple_job_search",
+    "interactive_interviewer": "mock_interview:interactive_interviewer",
+    "interview_evaluator": "mock_interview:interview_evaluator",
+    "resume_agent": "resume_agent:resume_agent",
+    "judge_agent": "judge_agent:judge_agent",
+}
+
+
+def load_agent(key: str) -> BaseAgent:
+    """Import the agent registered under `key`, routed to its tier's model."""
+    module, _, attribute = AGENTS[key].partition(":")
+    agent = getattr(importlib.import_module(f"{__package__}.{module}"), attribute)
+    from .base import model_registry
+    return model_registry.apply(agent)
@@ -0,0 +1,79 @@
+"""
+Tool + template agent.
+
+Some specialists are dominated by a single function tool: the LLM call only
+decides the tool's arguments and wraps its result in a few sentences. When
+the arguments are already known (they are in session state), the tool can be
+called directly and its result rendered through a template, skipping the
+model round trip entirely.
+"""
+import logging
+from typing import Any, AsyncGenerator, Callable, Dict, Optional
+
+from google.genai import types
+from google.adk.agents import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+from google.adk.utils.context_utils import Aclosing
+
+from ..services import metrics
+
+logger = logging.getLogger(__name__)
+
+template_agent_runs = metrics.registry.counter(
+    "synergy_template_agent_runs_total", "Tool + template agent runs by path (template, fallback)",
+    ("agent", "path"))
+
+
+class ToolTemplateAgent(BaseAgent):
+    """Calls `tool` with arguments read from session state and writes the
+    rendered `template` (str.format over the tool's result) to `output_key`.
+
+    `state_args` maps tool parameter -> state key. If a state key is absent
+    or None, or the tool raises or reports a non-success status, the
+    `fallback` agent (normally the LLM agent this one replaces) runs
+    instead; without a fallback the error is raised.
+    """
+
+    tool: Callable[..., Dict[str, Any]]
+    template: str
+    output_key: str
+    state_args: Dict[str, str] = {}
+    fallback: Optional[BaseAgent] = None
+
+    def __init__(self, **kwargs):
+        fallback = kwargs.get("fallback")
+        if fallback is not None:
+            kwargs.setdefault("sub_agents", [fallback])
+        super().__init__(**kwargs)
+
+    def render(self, state) -> str:
+        missing = [key for key in self.state_args.values() if state.get(key) is None]
+        if missing:
+            raise KeyError(f"state has no {', '.join(missing)}")
+        result = self.tool(**{arg: state[key] for arg, key in self.state_args.items()})
+        if result.get("status", "success") != "success":
+            raise RuntimeError(f"{self.tool.__name__} returned status {result.get('status')}")
+        return self.template.format(**result).strip()
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        try:
+            text = self.render(ctx.session.state)
+        except Exception as e:
+            if self.fallback is None:
+                raise
+            logger.info("%s falling back to %s: %s", self.name, self.fallback.name, e)
+            template_agent_runs.inc(self.name, "fallback")
+            async with Aclosing(self.fallback.run_async(ctx)) as agen:
+                async for event in agen:
+                    yield event
+            return
+
+        template_agent_runs.inc(self.name, "template")
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            content=types.Content(role="model", parts=[types.Part(text=text)]),
+            actions=EventActions(state_delta={self.output_key: text})
+        )
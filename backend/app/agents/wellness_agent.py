@@ -1,6 +1,9 @@
 from google.adk.agents import LlmAgent
 from .base import gemini_model, wellness_tool
+from .template_agent import ToolTemplateAgent
+from ..core.config import settings
 from ..prompts.prompt_loader import load_prompt
+from ..tools import wellness_tools
 # Wellness Agent
 wellness_agent = LlmAgent(
     model=gemini_model,
@@ -8,4 +11,19 @@ wellness_agent = LlmAgent(
     instruction=load_prompt("wellness.yaml"),
     tools=[wellness_tool],
     output_key="wellness_plan"
-)
\ No newline at end of file
+)
+
+# Wellness specialist for the daily plan: with WELLNESS_MODE=template the tip
+# is looked up with the request's stress level and rendered without a model
+# call, falling back to the LLM agent (if enabled) when that is not possible
+if settings.WELLNESS_MODE == "template":
+    wellness_specialist = ToolTemplateAgent(
+        name="WellnessTemplateAgent",
+        tool=wellness_tools.get_personalized_wellness_tip,
+        template=load_prompt("wellness.yaml", "template"),
+        output_key="wellness_plan",
+        state_args={"stress_level": "daily_stress_level"},
+        fallback=wellness_agent if settings.WELLNESS_TEMPLATE_FALLBACK else None
+    )
+else:
+    wellness_specialist = wellness_agent
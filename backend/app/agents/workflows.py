@@ -1,10 +1,12 @@
-from google.adk.agents import ParallelAgent, SequentialAgent, LlmAgent
+from google.adk.agents import SequentialAgent, LlmAgent
 from .study_agent import study_research_agent, study_planner_agent
 from .job_search_agent import job_search_agent, web_search_agent_simple, job_coordinator_agent_simple
-from .wellness_agent import wellness_agent
+from .wellness_agent import wellness_specialist
 from .interview_agent import interview_search_agent, interview_agent, interview_planner_agent
 from .quiz_agent import quiz_agent
 from .base import gemini_model
+from .deadline import DeadlineParallelAgent
+from ..core.config import settings
 from ..prompts.prompt_loader import load_prompt  # <--- Import Loader
 
 # 1. Planner Agent (The Finalizer)
@@ -23,14 +25,27 @@ study_workflow = SequentialAgent(
     sub_agents=[study_research_agent, study_planner_agent],
 )
 
-# Daily Parallel Execution
-daily_parallel_agents = ParallelAgent(
+# Daily Parallel Execution (stragglers are cancelled at the request deadline,
+# keeping DAILY_PLAN_PLANNER_RESERVE_SECONDS for the planner). On a resubmit in
+# the same session, specialists whose inputs did not change keep their section.
+daily_parallel_agents = DeadlineParallelAgent(
     name="DailySpecialists",
     sub_agents=[
         study_workflow, 
         job_search_agent, 
-        wellness_agent
+        wellness_specialist
     ],
+    section_keys={
+        "StudyWorkflow": "study_plan",
+        "JobSearchAgent": "job_plan",
+        wellness_specialist.name: "wellness_plan"
+    },
+    input_keys={
+        "StudyWorkflow": ["daily_goals"],
+        "JobSearchAgent": ["daily_goals"],
+        wellness_specialist.name: ["daily_goals", "daily_stress_level"]
+    } if settings.DAILY_PLAN_REUSE_SECTIONS else {},
+    reserve_seconds=settings.DAILY_PLAN_PLANNER_RESERVE_SECONDS,
 )
 
 # Final Daily Workflow
@@ -49,6 +64,16 @@ interview_workflow = SequentialAgent(
     ], 
 )
 
+# Interview research only (steps 1-2), run when the research store has no
+# fresh entry for a company/role (or to pre-warm it)
+interview_research_workflow = SequentialAgent(
+    name="InterviewResearchWorkflow",
+    sub_agents=[interview_search_agent.clone(), interview_agent.clone()],
+)
+
+# Personalization only (step 3), fed stored research through session state
+interview_personalizer = interview_planner_agent.clone()
+
 # Quiz Workflow
 quiz_workflow = SequentialAgent(
     name="QuizWorkflow",
@@ -0,0 +1,103 @@
+"""
+API Middleware
+"""
+import time
+from typing import Awaitable, Callable, Dict, Tuple
+
+from starlette.routing import Match
+
+from ..services import metrics
+from ..services.usage import current_endpoint
+
+
+class EndpointContextMiddleware:
+    """Records the request path so agent runs can attribute token usage to it.
+
+    Plain ASGI (no BaseHTTPMiddleware), so the context variable is set in the
+    same task that runs the endpoint and streaming responses are untouched.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = current_endpoint.set(f"{scope.get('method', '')} {scope['path']}".strip())
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            current_endpoint.reset(token)
+
+
+class WarmUpGateMiddleware:
+    """Holds API requests until the startup warm-up (see main.py) is done.
+
+    The worker binds and answers "/" and /metrics right away while the
+    runner is built in a background thread; requests under `prefix` wait
+    for it without blocking the event loop.
+    """
+
+    def __init__(self, app, wait: Callable[[], Awaitable[None]], prefix: str = "/api"):
+        self.app = app
+        self.wait = wait
+        self.prefix = prefix
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith(self.prefix):
+            await self.wait()
+        await self.app(scope, receive, send)
+
+
+class MetricsMiddleware:
+    """Request counters, in-flight gauges and latency histograms per route.
+
+    Routes are labelled by their template (unknown paths as "unmatched") so
+    the label set stays bounded. Path -> template lookups are cached.
+    """
+
+    MAX_CACHED_PATHS = 1024
+
+    def __init__(self, app):
+        self.app = app
+        self._templates: Dict[Tuple[str, str], str] = {}
+
+    def _route_template(self, scope) -> str:
+        key = (scope.get("method", ""), scope["path"])
+        template = self._templates.get(key)
+        if template is None:
+            template = "unmatched"
+            for route in scope["app"].router.routes:
+                match, _ = route.matches(scope)
+                if match == Match.FULL:
+                    template = getattr(route, "path", scope["path"])
+                    break
+            if len(self._templates) >= self.MAX_CACHED_PATHS:
+                self._templates.clear()
+            self._templates[key] = template
+        return template
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not metrics.registry.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        route = self._route_template(scope)
+        method = scope.get("method", "")
+        status = "500"
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+            await send(message)
+
+        metrics.http_in_progress.inc(route, method)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            metrics.http_in_progress.dec(route, method)
+            metrics.http_duration.observe(time.perf_counter() - started, route, method)
+            metrics.http_requests.inc(route, method, status)
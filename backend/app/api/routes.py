@@ -2,8 +2,12 @@
 API Routes for Synergy AI Platform
 """
 import json
-from fastapi import APIRouter, HTTPException, Depends
-from typing import Dict, List
+import asyncio
+import inspect
+from contextlib import asynccontextmanager
+from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.responses import JSONResponse, StreamingResponse
+from typing import Awaitable, Callable, Dict, List, Optional
 
 # Import Pydantic Models
 from ..models.requests import (
@@ -15,11 +19,19 @@ from ..models.requests import (
     MockContinueRequest, 
     MockEvaluateRequest,
     ResumeAnalysisRequest,
-    EvalRequest
+    EvalRequest,
+    QuizBatchRequest,
+    EvalBatchRequest
 )
 
 # Import Service
-from ..services.adk_runner import SynergyAIRunner
+from ..services.lazy_runner import LazyRunner
+from ..services.streaming import stream_frames, sse_encode
+from ..services.usage import parse_pricing, estimate_cost
+from ..services.admission import AdmissionScheduler, AdmissionRejected, parse_weights
+from ..services.jobs import JobManager, JobStore, JobQueueFull
+from ..services.batch import run_batch
+from ..core.config import settings
 from ..models.requests import ResumeAnalysisRequest # Add this to imports
 
 # Initialize Router
@@ -27,8 +39,137 @@ router = APIRouter()
 
 # Initialize Runner
 # In a highly concurrent production env, you might use Depends() for dependency injection,
-# but for this architecture, instantiating it here is efficient.
-runner = SynergyAIRunner()
+# but for this architecture, a shared handle is efficient. The runner (and the
+# ADK stack behind it) is built on first use; main.py builds it at startup.
+runner = LazyRunner()
+
+# Bounds concurrent LLM-bound requests; endpoint classes are weighted so
+# interactive interview turns are admitted ahead of batch-like workflows
+admission = AdmissionScheduler(
+    max_concurrent=settings.ADMISSION_MAX_CONCURRENT,
+    weights=parse_weights(settings.ADMISSION_WEIGHTS),
+    max_wait_seconds=settings.ADMISSION_MAX_WAIT_SECONDS,
+    max_queue=settings.ADMISSION_MAX_QUEUE,
+    max_queued_per_user=settings.ADMISSION_MAX_QUEUED_PER_USER
+) if settings.ADMISSION_ENABLED else None
+
+# Long-running workflows can also be submitted as background jobs and polled;
+# each running job holds a "batch" admission slot like the synchronous routes
+jobs = JobManager(
+    store=JobStore(settings.JOB_DB_PATH),
+    max_workers=settings.JOB_WORKERS,
+    max_queue=settings.JOB_MAX_QUEUE,
+    ttl_seconds=settings.JOB_TTL_SECONDS,
+    admission=admission,
+    admission_timeout=settings.JOB_ADMISSION_TIMEOUT_SECONDS
+)
+jobs.register("daily-plan", lambda request: runner.run_daily_plan(**request))
+jobs.register("interview-prep", lambda request: runner.run_interview_prep(**request))
+jobs.register("job-search", lambda request: runner.quick_job_search(**request))
+
+# The judge endpoint has no user; its requests share one fairness bucket
+EVALUATOR_USER = "evaluator"
+
+def rejected(e: AdmissionRejected) -> HTTPException:
+    return HTTPException(status_code=429, detail=e.reason, headers={"Retry-After": str(e.retry_after)})
+
+@asynccontextmanager
+async def admitted(endpoint_class: str, user_id: str):
+    """Hold an admission slot for the request, or fail fast with 429 + Retry-After."""
+    if admission is None:
+        yield
+        return
+    try:
+        async with admission.slot(endpoint_class, user_id):
+            yield
+    except AdmissionRejected as e:
+        raise rejected(e)
+
+class ClosingStreamingResponse(StreamingResponse):
+    """StreamingResponse that runs `on_close` however sending it ends.
+
+    Cleanup in the body generator's `finally` is not enough: Starlette can
+    cancel the send before the body is first iterated (e.g. a disconnect
+    during http.response.start), and a generator that never started never
+    runs its `finally`.
+    """
+
+    def __init__(self, content, on_close: Callable[[], Awaitable[None]], **kwargs):
+        super().__init__(content, **kwargs)
+        self.on_close = on_close
+
+    async def __call__(self, scope, receive, send):
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            await self.on_close()
+
+async def sse_response(run, endpoint_class: str, user_id: str) -> StreamingResponse:
+    """Stream a runner coroutine to the client as Server-Sent Events.
+
+    Admission happens before the stream opens (so a 429 is a plain response)
+    and the slot is held until the response has been sent or abandoned.
+    """
+    started = None
+    if admission is not None:
+        try:
+            started = await admission.acquire(endpoint_class, user_id)
+        except AdmissionRejected as e:
+            run.close()
+            raise rejected(e)
+    frames = stream_frames(run)
+
+    async def close():
+        try:
+            # Cancels the run if it is still going; closes it if it never started
+            await frames.aclose()
+            if inspect.getcoroutinestate(run) == inspect.CORO_CREATED:
+                run.close()
+        finally:
+            if started is not None:
+                admission.release(endpoint_class, started)
+
+    return ClosingStreamingResponse(
+        sse_encode(frames),
+        on_close=close,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+async def ndjson_batch_response(items: list, run_item, concurrency: Optional[int], user_id: str) -> StreamingResponse:
+    """Run a batch and stream one JSON line per item as it completes, then a summary line.
+
+    At most BATCH_CONCURRENCY items run at a time, and each item is admitted
+    on its own as a "batch" class request for the user, so batches count
+    against the global concurrency bound item by item. An item that is shed
+    waits for the scheduler's Retry-After and queues again; one that is not
+    admitted within BATCH_ADMISSION_TIMEOUT_SECONDS fails with a 429 record.
+    """
+    if len(items) > settings.BATCH_MAX_ITEMS:
+        raise HTTPException(status_code=413, detail=f"A batch can hold at most {settings.BATCH_MAX_ITEMS} items")
+    limit = min(concurrency or settings.BATCH_CONCURRENCY, settings.BATCH_CONCURRENCY)
+    if admission is not None:
+        run_unadmitted = run_item
+
+        async def run_item(item):
+            try:
+                started = await admission.acquire_with_backoff(
+                    "batch", user_id, settings.BATCH_ADMISSION_TIMEOUT_SECONDS
+                )
+            except AdmissionRejected as e:
+                return {"success": False, "error": f"Rejected by admission (429): {e.reason}",
+                        "retry_after": e.retry_after}
+            try:
+                return await run_unadmitted(item)
+            finally:
+                admission.release("batch", started)
+    records = run_batch(items, run_item, limit)
+
+    async def lines():
+        async for record in records:
+            yield json.dumps(record, default=str) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
 
 # =========================================================================
 # 📅 DAILY PLANNER ROUTES
@@ -36,21 +177,32 @@ runner = SynergyAIRunner()
 @router.post("/daily-plan")
 async def create_daily_plan(request: DailyPlanRequest):
     """Create daily plan using ADK agents"""
-    try:
-        result = await runner.run_daily_plan(
-            user_id=request.user_id,
-            goals=request.goals,
-            session_id=request.session_id,
-            stress_level=request.stress_level
-        )
+    async with admitted("batch", request.user_id):
+        try:
+            result = await runner.run_daily_plan(
+                user_id=request.user_id,
+                goals=request.goals,
+                session_id=request.session_id,
+                stress_level=request.stress_level
+            )
         
-        if result["success"]:
-            return result
-        else:
-            raise HTTPException(status_code=500, detail=result.get("error", "Unknown error"))
+            if result["success"]:
+                return result
+            else:
+                raise HTTPException(status_code=500, detail=result.get("error", "Unknown error"))
             
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/daily-plan/stream")
+async def stream_daily_plan(request: DailyPlanRequest):
+    """Stream the daily plan workflow as Server-Sent Events"""
+    return await sse_response(runner.run_daily_plan(
+        user_id=request.user_id,
+        goals=request.goals,
+        session_id=request.session_id,
+        stress_level=request.stress_level
+    ), "batch", request.user_id)
 
 # =========================================================================
 # 💼 INTERVIEW PREP ROUTES (PLANNING)
@@ -58,21 +210,32 @@ async def create_daily_plan(request: DailyPlanRequest):
 @router.post("/interview-prep")
 async def create_interview_prep(request: InterviewRequest):
     """Create interview preparation using ADK agents"""
-    try:
-        result = await runner.run_interview_prep(
-            user_id=request.user_id,
-            role=request.role,
-            company=request.company,
-            description=request.description
-        )
+    async with admitted("batch", request.user_id):
+        try:
+            result = await runner.run_interview_prep(
+                user_id=request.user_id,
+                role=request.role,
+                company=request.company,
+                description=request.description
+            )
         
-        if result["success"]:
-            return result
-        else:
-            raise HTTPException(status_code=500, detail=result.get("error", "Unknown error"))
+            if result["success"]:
+                return result
+            else:
+                raise HTTPException(status_code=500, detail=result.get("error", "Unknown error"))
             
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/interview-prep/stream")
+async def stream_interview_prep(request: InterviewRequest):
+    """Stream the interview preparation workflow as Server-Sent Events"""
+    return await sse_response(runner.run_interview_prep(
+        user_id=request.user_id,
+        role=request.role,
+        company=request.company,
+        description=request.description
+    ), "batch", request.user_id)
 
 # =========================================================================
 # 🧠 QUIZ ROUTES
@@ -80,21 +243,47 @@ async def create_interview_prep(request: InterviewRequest):
 @router.post("/quiz")
 async def generate_quiz(request: QuizRequest):
     """Generate quiz using ADK agents"""
-    try:
-        result = await runner.run_quiz_generation(
-            user_id=request.user_id,
-            topic=request.topic,
-            notes=request.notes,
-            difficulty=request.difficulty
-        )
+    async with admitted("batch", request.user_id):
+        try:
+            result = await runner.run_quiz_generation(
+                user_id=request.user_id,
+                topic=request.topic,
+                notes=request.notes,
+                difficulty=request.difficulty
+            )
         
-        if result["success"]:
-            return result
-        else:
-            raise HTTPException(status_code=500, detail=result.get("error", "Unknown error"))
+            if result["success"]:
+                return result
+            else:
+                raise HTTPException(status_code=500, detail=result.get("error", "Unknown error"))
             
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/quiz/batch")
+async def generate_quiz_batch(request: QuizBatchRequest):
+    """Generate many quizzes; results stream back as NDJSON in completion order"""
+    return await ndjson_batch_response(
+        request.items,
+        lambda item: runner.run_quiz_generation(
+            user_id=request.user_id,
+            topic=item.topic,
+            notes=item.notes,
+            difficulty=item.difficulty
+        ),
+        request.concurrency,
+        request.user_id
+    )
+
+@router.post("/quiz/stream")
+async def stream_quiz(request: QuizRequest):
+    """Stream quiz generation as Server-Sent Events"""
+    return await sse_response(runner.run_quiz_generation(
+        user_id=request.user_id,
+        topic=request.topic,
+        notes=request.notes,
+        difficulty=request.difficulty
+    ), "batch", request.user_id)
 
 # =========================================================================
 # 🔍 JOB SEARCH ROUTES
@@ -102,22 +291,34 @@ async def generate_quiz(request: QuizRequest):
 @router.post("/job-search")
 async def run_job_search(request: JobSearchRequest):
     """Run JobSearchAgent for finding relevant job listings."""
-    try:
-        result = await runner.quick_job_search(
-            user_id=request.user_id,
-            role=request.role,
-            level=request.level,
-            experience=request.experience, 
-            location=request.location
-        )
+    async with admitted("standard", request.user_id):
+        try:
+            result = await runner.quick_job_search(
+                user_id=request.user_id,
+                role=request.role,
+                level=request.level,
+                experience=request.experience, 
+                location=request.location
+            )
 
-        if result["success"]:
-            return result
-        else:
-            raise HTTPException(status_code=500, detail=result.get("error", "Job search failed"))
+            if result["success"]:
+                return result
+            else:
+                raise HTTPException(status_code=500, detail=result.get("error", "Job search failed"))
+
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
 
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+@router.post("/job-search/stream")
+async def stream_job_search(request: JobSearchRequest):
+    """Stream the job search workflow as Server-Sent Events"""
+    return await sse_response(runner.quick_job_search(
+        user_id=request.user_id,
+        role=request.role,
+        level=request.level,
+        experience=request.experience,
+        location=request.location
+    ), "standard", request.user_id)
 
 # =========================================================================
 # 🎤 MOCK INTERVIEW ROUTES (INTERACTIVE)
@@ -125,84 +326,284 @@ async def run_job_search(request: JobSearchRequest):
 @router.post("/mock-interview/start")
 async def start_mock_interview(request: MockStartRequest):
     """Starts a new interactive mock interview session."""
-    try:
-        result = await runner.start_mock_interview(
-            user_id=request.user_id,
-            role=request.role,
-            company=request.company,
-            common_topics=request.common_topics
-        )
-        if result["success"]:
-            return result
-        else:
-            raise HTTPException(status_code=500, detail=result.get("error", "Failed to start interview"))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    async with admitted("interactive", request.user_id):
+        try:
+            result = await runner.start_mock_interview(
+                user_id=request.user_id,
+                role=request.role,
+                company=request.company,
+                common_topics=request.common_topics
+            )
+            if result["success"]:
+                return result
+            else:
+                raise HTTPException(status_code=500, detail=result.get("error", "Failed to start interview"))
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/mock-interview/start/stream")
+async def stream_start_mock_interview(request: MockStartRequest):
+    """Stream the first interviewer question as Server-Sent Events"""
+    return await sse_response(runner.start_mock_interview(
+        user_id=request.user_id,
+        role=request.role,
+        company=request.company,
+        common_topics=request.common_topics
+    ), "interactive", request.user_id)
 
 @router.post("/mock-interview/continue")
 async def continue_mock_interview(request: MockContinueRequest):
     """Sends a user response to an ongoing session and gets the next question."""
-    try:
-        result = await runner.continue_mock_interview(
-            user_id=request.user_id,
-            session_id=request.session_id,
-            user_response=request.user_response
-        )
-        if result["success"]:
-            return result
-        else:
-            raise HTTPException(status_code=500, detail=result.get("error", "Session error"))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    async with admitted("interactive", request.user_id):
+        try:
+            result = await runner.continue_mock_interview(
+                user_id=request.user_id,
+                session_id=request.session_id,
+                user_response=request.user_response
+            )
+            if result["success"]:
+                return result
+            else:
+                raise HTTPException(status_code=500, detail=result.get("error", "Session error"))
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/mock-interview/continue/stream")
+async def stream_continue_mock_interview(request: MockContinueRequest):
+    """Stream the next interviewer question as Server-Sent Events"""
+    return await sse_response(runner.continue_mock_interview(
+        user_id=request.user_id,
+        session_id=request.session_id,
+        user_response=request.user_response
+    ), "interactive", request.user_id)
 
 @router.post("/mock-interview/evaluate")
 async def evaluate_interview(request: MockEvaluateRequest):
     """Ends the session and runs the Interview Evaluator Agent."""
-    try:
-        result = await runner.evaluate_interview(
-            user_id=request.user_id,
-            session_id=request.session_id
-        )
-        if result["success"]:
-            return result
-        else:
-            raise HTTPException(status_code=500, detail=result.get("error", "Evaluation failed"))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    async with admitted("interactive", request.user_id):
+        try:
+            result = await runner.evaluate_interview(
+                user_id=request.user_id,
+                session_id=request.session_id
+            )
+            if result["success"]:
+                return result
+            else:
+                raise HTTPException(status_code=500, detail=result.get("error", "Evaluation failed"))
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/mock-interview/evaluate/stream")
+async def stream_evaluate_interview(request: MockEvaluateRequest):
+    """Stream the interview evaluation as Server-Sent Events"""
+    return await sse_response(runner.evaluate_interview(
+        user_id=request.user_id,
+        session_id=request.session_id
+    ), "interactive", request.user_id)
     
 @router.post("/resume-analyze")
 async def analyze_resume(request: ResumeAnalysisRequest):
     """Analyze Resume vs Job Description"""
-    try:
-        result = await runner.run_resume_analysis(
-            user_id=request.user_id,
-            resume_text=request.resume_text,
-            jd=request.job_description
-        )
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    async with admitted("standard", request.user_id):
+        try:
+            result = await runner.run_resume_analysis(
+                user_id=request.user_id,
+                resume_text=request.resume_text,
+                jd=request.job_description
+            )
+            return result
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/resume-analyze/stream")
+async def stream_analyze_resume(request: ResumeAnalysisRequest):
+    """Stream the resume analysis as Server-Sent Events"""
+    return await sse_response(runner.run_resume_analysis(
+        user_id=request.user_id,
+        resume_text=request.resume_text,
+        jd=request.job_description
+    ), "standard", request.user_id)
 
 @router.post("/evaluate")
 async def evaluate_response(request: EvalRequest):
     """Run LLM-as-a-Judge"""
-    return await runner.run_quality_check(request.user_prompt, request.ai_response)
+    async with admitted("standard", EVALUATOR_USER):
+        return await runner.run_quality_check(request.user_prompt, request.ai_response)
+
+@router.post("/evaluate/batch")
+async def evaluate_response_batch(request: EvalBatchRequest):
+    """Grade many responses with LLM-as-a-Judge; results stream back as NDJSON"""
+    return await ndjson_batch_response(
+        request.items,
+        lambda item: runner.run_quality_check(item.user_prompt, item.ai_response),
+        request.concurrency,
+        EVALUATOR_USER
+    )
+
+@router.post("/evaluate/stream")
+async def stream_evaluate_response(request: EvalRequest):
+    """Stream the LLM-as-a-Judge evaluation as Server-Sent Events"""
+    return await sse_response(runner.run_quality_check(request.user_prompt, request.ai_response), "standard", EVALUATOR_USER)
+
+# =========================================================================
+# ⏳ BACKGROUND JOB ROUTES
+# =========================================================================
+async def submit_job(kind: str, request) -> JSONResponse:
+    try:
+        job = await jobs.submit(kind, request.user_id, request.model_dump())
+    except JobQueueFull as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+    job["poll_url"] = f"/api/jobs/{job['job_id']}"
+    return JSONResponse(status_code=202, content=job)
+
+@router.post("/jobs/daily-plan", status_code=202)
+async def submit_daily_plan_job(request: DailyPlanRequest):
+    """Queue a daily plan and return a job id immediately"""
+    return await submit_job("daily-plan", request)
+
+@router.post("/jobs/interview-prep", status_code=202)
+async def submit_interview_prep_job(request: InterviewRequest):
+    """Queue an interview preparation and return a job id immediately"""
+    return await submit_job("interview-prep", request)
+
+@router.post("/jobs/job-search", status_code=202)
+async def submit_job_search_job(request: JobSearchRequest):
+    """Queue a job search and return a job id immediately"""
+    return await submit_job("job-search", request)
+
+@router.get("/jobs/stats")
+async def get_job_stats():
+    """Worker pool and queue counters"""
+    return jobs.stats()
+
+@router.get("/jobs/{job_id}")
+async def get_job(
+    job_id: str,
+    wait: float = Query(0, ge=0, description="Long-poll: seconds to wait for the job to finish")
+):
+    """Job status and, once finished, its result (kept for JOB_TTL_SECONDS)"""
+    job = await jobs.wait(job_id, min(wait, settings.JOB_LONG_POLL_MAX_SECONDS))
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found or expired")
+    return job
 
 @router.get("/traces")
-async def get_traces():
-    """Get observability logs"""
-    traces = []
+async def get_traces(
+    agent: Optional[str] = None,
+    status: Optional[str] = None,
+    since: Optional[str] = Query(None, description="ISO timestamp, inclusive"),
+    until: Optional[str] = Query(None, description="ISO timestamp, exclusive"),
+    cursor: Optional[int] = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(10, ge=1, le=500)
+):
+    """Get observability logs (newest page first, pass next_cursor for older pages)"""
+    return await asyncio.to_thread(
+        runner.trace_store.query,
+        agent=agent,
+        status=status,
+        since=since,
+        until=until,
+        cursor=cursor,
+        limit=limit
+    )
+
+@router.get("/usage")
+async def get_usage(
+    group_by: str = Query("agent", description="agent, workflow, user_id, endpoint or model"),
+    since: Optional[str] = Query(None, description="ISO timestamp, inclusive"),
+    until: Optional[str] = Query(None, description="ISO timestamp, exclusive"),
+    workflow: Optional[str] = None,
+    user_id: Optional[str] = None,
+    endpoint: Optional[str] = None
+):
+    """Token usage and estimated cost, aggregated per agent/workflow/user/endpoint"""
     try:
-        with open("/app/data/agent_traces.jsonl", "r") as f:
-            for line in f:
-                traces.append(json.loads(line))
-        return {"traces": traces[-10:]} # Return last 10 runs
-    except FileNotFoundError:
-        return {"traces": []}
+        groups = await asyncio.to_thread(
+            runner.trace_store.aggregate_usage,
+            group_by=group_by,
+            since=since,
+            until=until,
+            filters={"workflow": workflow, "user_id": user_id, "endpoint": endpoint}
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    pricing = parse_pricing(settings.MODEL_PRICING)
+    total_cost = 0.0
+    for group in groups:
+        group["estimated_cost_usd"] = estimate_cost(group, pricing)
+        total_cost += group["estimated_cost_usd"] or 0.0
+    return {
+        "group_by": group_by,
+        "groups": groups,
+        "total_tokens": sum(group["total_tokens"] or 0 for group in groups),
+        "estimated_cost_usd": round(total_cost, 6)
+    }
+
+@router.get("/traces/stats")
+async def get_trace_stats():
+    """Trace writer counters (queued, written, dropped, rotations)"""
+    return runner.trace_sink.stats()
 
 # =========================================================================
 # ℹ️ SYSTEM INFO
 # =========================================================================
+@router.get("/cache/stats")
+async def get_cache_stats():
+    """Response cache hit/miss counters per workflow"""
+    return runner.response_cache.stats()
+
+@router.get("/search-cache/stats")
+async def get_search_cache_stats():
+    """Search cache entries and hit/stale/miss counters per domain"""
+    if runner.search_cache is None:
+        return {"enabled": False}
+    return await asyncio.to_thread(runner.search_cache.stats)
+
+@router.get("/context-cache/stats")
+async def get_context_cache_stats():
+    """Context cache handles: live handles, cached tokens, hits vs. registrations"""
+    if runner.context_cache is None:
+        return {"enabled": False}
+    return runner.context_cache.stats()
+
+@router.get("/interview-research/stats")
+async def get_interview_research_stats():
+    """Stored company/role research: entries, fresh entries, reuse counts"""
+    if runner.interview_research is None:
+        return {"enabled": False}
+    return await asyncio.to_thread(runner.interview_research.stats)
+
+@router.get("/sessions/stats")
+async def get_session_stats():
+    """Session bootstrap counters (cache hits, DB lookups, creates)"""
+    stats = runner.sessions.stats()
+    if hasattr(runner.session_service, "stats"):
+        stats["writer"] = runner.session_service.stats()
+    return stats
+
+@router.get("/admission/stats")
+async def get_admission_stats():
+    """Admission scheduler state: active slots, queue depth per class, shed counts"""
+    return admission.stats() if admission is not None else {"enabled": False}
+
+@router.get("/rate-limit/stats")
+async def get_rate_limit_stats():
+    """Gemini client-side limiters per model: current rate multiplier, throttles, time spent waiting"""
+    from ..llm.rate_limiter import gemini_rate_limiters
+    return gemini_rate_limiters.stats()
+
+@router.get("/coalescing/stats")
+async def get_coalescing_stats():
+    """Single-flight counters: runs executed vs. runs saved by coalescing"""
+    return runner.single_flight.stats()
+
+@router.get("/models")
+async def get_model_routing():
+    """Model tiers and which agents are routed to which tier"""
+    from ..agents.base import model_registry
+    return model_registry.describe()
+
 @router.get("/agents")
 async def list_agents():
     """List all available agents"""
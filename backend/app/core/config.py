@@ -1,4 +1,5 @@
 import os
+from typing import Optional
 from pydantic_settings import BaseSettings
 from dotenv import load_dotenv
 
@@ -10,4 +11,170 @@ class Settings(BaseSettings):
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///synergy_ai.db")
     APP_ENV: str = os.getenv("APP_ENV", "development")
 
+    # Session DB tuning (SQLite only): pragmas, bounded pool, single batched writer
+    SESSION_DB_TUNED: bool = os.getenv("SESSION_DB_TUNED", "true").lower() == "true"
+    SESSION_DB_SYNCHRONOUS: str = os.getenv("SESSION_DB_SYNCHRONOUS", "NORMAL")
+    SESSION_DB_BUSY_TIMEOUT_MS: int = int(os.getenv("SESSION_DB_BUSY_TIMEOUT_MS", "5000"))
+    SESSION_DB_CACHE_SIZE_KB: int = int(os.getenv("SESSION_DB_CACHE_SIZE_KB", "20000"))
+    SESSION_DB_POOL_SIZE: int = int(os.getenv("SESSION_DB_POOL_SIZE", "5"))
+    SESSION_DB_MAX_OVERFLOW: int = int(os.getenv("SESSION_DB_MAX_OVERFLOW", "5"))
+    SESSION_DB_POOL_TIMEOUT_SECONDS: float = float(os.getenv("SESSION_DB_POOL_TIMEOUT_SECONDS", "30"))
+    SESSION_DB_WRITE_BATCH_SIZE: int = int(os.getenv("SESSION_DB_WRITE_BATCH_SIZE", "64"))
+    SESSION_DB_WRITE_QUEUE_SIZE: int = int(os.getenv("SESSION_DB_WRITE_QUEUE_SIZE", "10000"))
+
+    # Mock interview context compaction (last K exchanges verbatim + rolling summary)
+    MOCK_INTERVIEW_COMPACTION: bool = os.getenv("MOCK_INTERVIEW_COMPACTION", "true").lower() == "true"
+    MOCK_INTERVIEW_KEEP_TURNS: int = int(os.getenv("MOCK_INTERVIEW_KEEP_TURNS", "4"))
+    MOCK_INTERVIEW_CONTEXT_TOKENS: int = int(os.getenv("MOCK_INTERVIEW_CONTEXT_TOKENS", "1500"))
+
+    # Bounded in-process cache of session keys known to exist
+    SESSION_CACHE_MAX_KEYS: int = int(os.getenv("SESSION_CACHE_MAX_KEYS", "10000"))
+
+    # Response cache (comma-separated opt-in list: quiz, interview_prep, job_search)
+    RESPONSE_CACHE_WORKFLOWS: str = os.getenv("RESPONSE_CACHE_WORKFLOWS", "quiz,interview_prep,job_search")
+    RESPONSE_CACHE_MAX_ENTRIES: int = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "1000"))
+    RESPONSE_CACHE_TTL_SECONDS: int = int(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "21600"))
+    RESPONSE_CACHE_SIMILARITY: float = float(os.getenv("RESPONSE_CACHE_SIMILARITY", "0.85"))
+
+    # Search cache in front of the google_search agents (agent -> domain, TTL per domain;
+    # entries are served stale for STALE_RATIO x TTL more while being refreshed)
+    SEARCH_CACHE_ENABLED: bool = os.getenv("SEARCH_CACHE_ENABLED", "true").lower() == "true"
+    SEARCH_CACHE_DB_PATH: str = os.getenv("SEARCH_CACHE_DB_PATH", "/app/data/search_cache.db")
+    SEARCH_CACHE_MAX_ENTRIES: int = int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "5000"))
+    SEARCH_CACHE_AGENTS: str = os.getenv(
+        "SEARCH_CACHE_AGENTS",
+        "JobSearchAgent:jobs,WebSearchAgentSimple:jobs,InterviewSearchAgent:interview,StudyResearchAgent:study"
+    )
+    SEARCH_CACHE_TTLS: str = os.getenv("SEARCH_CACHE_TTLS", "jobs:3600,interview:604800,study:259200")
+    SEARCH_CACHE_STALE_RATIO: float = float(os.getenv("SEARCH_CACHE_STALE_RATIO", "1.0"))
+
+    # Shared interview research per (company, role); fresh entries skip the search
+    # and processing steps (pre-warm with scripts/prewarm_interview_research.py)
+    INTERVIEW_RESEARCH_ENABLED: bool = os.getenv("INTERVIEW_RESEARCH_ENABLED", "true").lower() == "true"
+    INTERVIEW_RESEARCH_DB_PATH: str = os.getenv("INTERVIEW_RESEARCH_DB_PATH", "/app/data/interview_research.db")
+    INTERVIEW_RESEARCH_TTL_SECONDS: float = float(os.getenv("INTERVIEW_RESEARCH_TTL_SECONDS", "604800"))
+
+    # Single-flight: identical concurrent requests share one agent run
+    COALESCE_WORKFLOWS: str = os.getenv("COALESCE_WORKFLOWS", "quiz,interview_prep,job_search")
+
+    # Agent traces (written in the background, rotated and gzipped)
+    TRACE_FILE_PATH: str = os.getenv("TRACE_FILE_PATH", "/app/data/agent_traces.jsonl")
+    TRACE_DB_PATH: str = os.getenv("TRACE_DB_PATH", "/app/data/agent_traces.db")
+    TRACE_QUEUE_SIZE: int = int(os.getenv("TRACE_QUEUE_SIZE", "10000"))
+    TRACE_BATCH_SIZE: int = int(os.getenv("TRACE_BATCH_SIZE", "200"))
+    TRACE_FLUSH_INTERVAL_SECONDS: float = float(os.getenv("TRACE_FLUSH_INTERVAL_SECONDS", "1.0"))
+    TRACE_ROTATE_MAX_BYTES: int = int(os.getenv("TRACE_ROTATE_MAX_BYTES", str(50 * 1024 * 1024)))
+    TRACE_ROTATE_MAX_AGE_SECONDS: int = int(os.getenv("TRACE_ROTATE_MAX_AGE_SECONDS", "86400"))
+    TRACE_BACKUP_COUNT: int = int(os.getenv("TRACE_BACKUP_COUNT", "7"))
+
+    # Daily plan latency budget: specialists still running at
+    # (budget - planner reserve) are cancelled and the plan is built from the rest
+    DAILY_PLAN_BUDGET_SECONDS: float = float(os.getenv("DAILY_PLAN_BUDGET_SECONDS", "60"))
+    DAILY_PLAN_PLANNER_RESERVE_SECONDS: float = float(os.getenv("DAILY_PLAN_PLANNER_RESERVE_SECONDS", "20"))
+    # Resubmitting a daily plan in the same session reruns only the specialists
+    # whose inputs (goals, stress level) changed, then the planner
+    DAILY_PLAN_REUSE_SECTIONS: bool = os.getenv("DAILY_PLAN_REUSE_SECTIONS", "true").lower() == "true"
+    # Wellness section of the daily plan: "template" renders the wellness tool's
+    # tip without a model call, "llm" runs the WellnessAgent. With the fallback
+    # on, the template path hands over to the LLM agent when it cannot run
+    WELLNESS_MODE: str = os.getenv("WELLNESS_MODE", "template")
+    WELLNESS_TEMPLATE_FALLBACK: bool = os.getenv("WELLNESS_TEMPLATE_FALLBACK", "true").lower() == "true"
+
+    # Background jobs (/api/jobs/*)
+    JOB_DB_PATH: str = os.getenv("JOB_DB_PATH", "/app/data/jobs.db")
+    JOB_WORKERS: int = int(os.getenv("JOB_WORKERS", "4"))
+    JOB_MAX_QUEUE: int = int(os.getenv("JOB_MAX_QUEUE", "100"))
+    JOB_TTL_SECONDS: int = int(os.getenv("JOB_TTL_SECONDS", "3600"))
+    JOB_LONG_POLL_MAX_SECONDS: float = float(os.getenv("JOB_LONG_POLL_MAX_SECONDS", "30"))
+    # How long a job that the admission scheduler keeps shedding is retried before it fails
+    JOB_ADMISSION_TIMEOUT_SECONDS: float = float(os.getenv("JOB_ADMISSION_TIMEOUT_SECONDS", "300"))
+
+    # Batch endpoints (/api/quiz/batch, /api/evaluate/batch)
+    BATCH_MAX_ITEMS: int = int(os.getenv("BATCH_MAX_ITEMS", "500"))
+    BATCH_CONCURRENCY: int = int(os.getenv("BATCH_CONCURRENCY", "8"))
+    # How long a batch item that the admission scheduler keeps shedding is retried before it fails
+    BATCH_ADMISSION_TIMEOUT_SECONDS: float = float(os.getenv("BATCH_ADMISSION_TIMEOUT_SECONDS", "30"))
+
+    # Admission control in front of the runner (429 + Retry-After when overloaded)
+    ADMISSION_ENABLED: bool = os.getenv("ADMISSION_ENABLED", "true").lower() == "true"
+    ADMISSION_MAX_CONCURRENT: int = int(os.getenv("ADMISSION_MAX_CONCURRENT", "8"))
+    ADMISSION_WEIGHTS: str = os.getenv("ADMISSION_WEIGHTS", "interactive:6,standard:3,batch:1")
+    ADMISSION_MAX_WAIT_SECONDS: float = float(os.getenv("ADMISSION_MAX_WAIT_SECONDS", "20"))
+    ADMISSION_MAX_QUEUE: int = int(os.getenv("ADMISSION_MAX_QUEUE", "200"))
+    ADMISSION_MAX_QUEUED_PER_USER: int = int(os.getenv("ADMISSION_MAX_QUEUED_PER_USER", "10"))
+
+    # Client-side pacing for Gemini calls: one budget per model, shared by all
+    # agents on it (MODEL_TIERS can set a tier's own rpm/tpm)
+    GEMINI_RATE_LIMIT_ENABLED: bool = os.getenv("GEMINI_RATE_LIMIT_ENABLED", "true").lower() == "true"
+    GEMINI_RPM: float = float(os.getenv("GEMINI_RPM", "1000"))
+    GEMINI_TPM: float = float(os.getenv("GEMINI_TPM", "1000000"))
+    GEMINI_RATE_LIMIT_BACKOFF_SECONDS: float = float(os.getenv("GEMINI_RATE_LIMIT_BACKOFF_SECONDS", "5"))
+    GEMINI_RATE_LIMIT_MAX_RETRIES: int = int(os.getenv("GEMINI_RATE_LIMIT_MAX_RETRIES", "3"))
+    GEMINI_ESTIMATED_OUTPUT_TOKENS: int = int(os.getenv("GEMINI_ESTIMATED_OUTPUT_TOKENS", "1000"))
+    GEMINI_BASE_URL: str = os.getenv("GEMINI_BASE_URL", "")
+
+    # Model routing: agents run on DEFAULT_MODEL_TIER unless AGENT_MODEL_TIERS
+    # ("AgentName:tier,...") says otherwise. MODEL_TIERS (JSON) adds or replaces
+    # tiers: {"tier": {"model": ..., "max_output_tokens": ..., "temperature": ...,
+    # "rpm": ..., "tpm": ...}}; built in are "standard" (gemini-2.5-flash) and
+    # "light" (gemini-2.5-flash-lite). rpm/tpm default to GEMINI_RPM/GEMINI_TPM,
+    # which are budgets per model
+    DEFAULT_MODEL_TIER: str = os.getenv("DEFAULT_MODEL_TIER", "standard")
+    AGENT_MODEL_TIERS: str = os.getenv(
+        "AGENT_MODEL_TIERS", "JobSearchCoordinatorSimple:light,InterviewPlannerAgent:light,QualityJudgeAgent:light"
+    )
+    MODEL_TIERS: str = os.getenv("MODEL_TIERS", "")
+
+    # LLM backend: "gemini", "fake" (offline stand-in for load tests, local dev)
+    # or "replay" (serve recorded cassettes)
+    LLM_BACKEND: str = os.getenv("LLM_BACKEND", "gemini")
+    # Fake backend behaviour; distributions are "fixed:a", "uniform:a,b", "normal:mean,sd" or "lognormal:median,sigma"
+    FAKE_LLM_LATENCY: str = os.getenv("FAKE_LLM_LATENCY", "lognormal:1.0,0.5")
+    # Per-model latency overrides, e.g. {"gemini-2.5-flash-lite": "lognormal:0.5,0.5"};
+    # models not listed use FAKE_LLM_LATENCY
+    FAKE_LLM_MODEL_LATENCY: str = os.getenv("FAKE_LLM_MODEL_LATENCY", "")
+    FAKE_LLM_SEARCH_LATENCY: str = os.getenv("FAKE_LLM_SEARCH_LATENCY", "uniform:0.5,1.5")
+    FAKE_LLM_OUTPUT_TOKENS: str = os.getenv("FAKE_LLM_OUTPUT_TOKENS", "uniform:200,600")
+    FAKE_LLM_ERROR_RATE: float = float(os.getenv("FAKE_LLM_ERROR_RATE", "0"))
+    FAKE_LLM_ERROR_CODES: str = os.getenv("FAKE_LLM_ERROR_CODES", "429,503")
+    FAKE_LLM_TOOL_SCRIPT: str = os.getenv("FAKE_LLM_TOOL_SCRIPT", "")
+    FAKE_LLM_STREAM_CHUNK_TOKENS: int = int(os.getenv("FAKE_LLM_STREAM_CHUNK_TOKENS", "20"))
+    FAKE_LLM_SEED: Optional[int] = int(os.getenv("FAKE_LLM_SEED")) if os.getenv("FAKE_LLM_SEED") else None
+
+    # Cassettes: LLM_CASSETTE_RECORD appends every call of the configured backend to
+    # LLM_CASSETTE_DIR/<workflow>.jsonl; LLM_BACKEND=replay serves them back
+    LLM_CASSETTE_RECORD: bool = os.getenv("LLM_CASSETTE_RECORD", "false").lower() == "true"
+    LLM_CASSETTE_DIR: str = os.getenv("LLM_CASSETTE_DIR", "/app/data/cassettes")
+    LLM_REPLAY_LATENCY_SCALE: float = float(os.getenv("LLM_REPLAY_LATENCY_SCALE", "1"))  # 1 = as recorded, 0 = none
+    LLM_REPLAY_ON_MISS: str = os.getenv("LLM_REPLAY_ON_MISS", "error")  # error | fake
+
+    # Context caching of stable request prefixes (system instruction + tools, and
+    # parts the caller marks stable such as the resume). Gemini only caches
+    # prefixes of CONTEXT_CACHE_MIN_TOKENS or more; smaller ones are sent as is.
+    # Backend "auto" uses Gemini's cached contents with LLM_BACKEND=gemini and
+    # the in-process fake otherwise. Empty CONTEXT_CACHE_AGENTS = every agent
+    CONTEXT_CACHE_ENABLED: bool = os.getenv("CONTEXT_CACHE_ENABLED", "true").lower() == "true"
+    CONTEXT_CACHE_BACKEND: str = os.getenv("CONTEXT_CACHE_BACKEND", "auto")  # auto | gemini | fake
+    CONTEXT_CACHE_AGENTS: str = os.getenv("CONTEXT_CACHE_AGENTS", "")
+    CONTEXT_CACHE_TTL_SECONDS: float = float(os.getenv("CONTEXT_CACHE_TTL_SECONDS", "3600"))
+    CONTEXT_CACHE_MIN_TOKENS: int = int(os.getenv("CONTEXT_CACHE_MIN_TOKENS", "1024"))
+    CONTEXT_CACHE_MAX_ENTRIES: int = int(os.getenv("CONTEXT_CACHE_MAX_ENTRIES", "500"))
+
+    # Startup: the runner (ADK, models, agents) is built in a worker thread.
+    # "background" lets the worker bind meanwhile (API requests wait for it),
+    # "blocking" finishes it before binding. STARTUP_WARM_UP_AGENTS also builds
+    # every agent/workflow up front instead of on first use
+    STARTUP_WARM_UP_MODE: str = os.getenv("STARTUP_WARM_UP_MODE", "background")
+    STARTUP_WARM_UP_AGENTS: bool = os.getenv("STARTUP_WARM_UP_AGENTS", "true").lower() == "true"
+
+    # Prometheus-style /metrics endpoint
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+
+    # USD per 1M tokens, used by /api/usage to estimate cost
+    MODEL_PRICING: str = os.getenv(
+        "MODEL_PRICING",
+        '{"gemini-2.5-flash": {"input": 0.30, "output": 2.50, "cached": 0.075}, '
+        '"gemini-2.5-flash-lite": {"input": 0.10, "output": 0.40, "cached": 0.025}}'
+    )
+
 settings = Settings()
\ No newline at end of file
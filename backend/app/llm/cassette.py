@@ -0,0 +1,240 @@
+"""
+Record/replay LLM backend.
+
+Recording wraps the configured model and appends every request/response
+pair to a cassette file per workflow (JSON lines). Replaying serves those
+responses by request fingerprint, with the recorded timing or none at all,
+so workflows can be benchmarked offline and deterministically.
+"""
+import os
+import re
+import json
+import time
+import glob
+import asyncio
+import hashlib
+import logging
+import threading
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, AsyncGenerator, Dict, List, Optional
+
+from pydantic import PrivateAttr
+
+from google.genai import errors as genai_errors
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+
+from ..core.config import settings
+from ..services.usage import current_workflow
+
+logger = logging.getLogger(__name__)
+
+_AGENT_LABEL = "adk_agent_name"
+
+# Values that differ between otherwise identical runs (tool results, which
+# can be random, timestamps, generated ids) are masked before hashing
+_VOLATILE = [
+    (re.compile(r"(tool returned result: ).*?(\"\}|$)"), r"\1<result>\2"),
+    (re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?([+-]\d{2}:\d{2}|Z)?"), "<timestamp>"),
+    (re.compile(r"\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b"), "<uuid>"),
+    (re.compile(r"\b([a-z]+)_[0-9a-f]{8,32}\b"), r"\1_<id>"),
+]
+
+
+class CassetteMiss(LookupError):
+    """No recorded interaction matches a request being replayed."""
+
+
+def _strip_ids(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "response" in value and "name" in value:
+            # A function_response part: keep which tool answered, not what it said
+            return {"name": value["name"]}
+        return {k: _strip_ids(v) for k, v in value.items() if k not in ("id", "thought_signature")}
+    if isinstance(value, list):
+        return [_strip_ids(v) for v in value]
+    return value
+
+
+def canonical_request(llm_request: LlmRequest) -> Dict:
+    """The parts of a request that decide the model's answer, in a stable form."""
+    config = llm_request.config
+    labels = (config.labels if config is not None else None) or {}
+    system = config.system_instruction if config is not None else None
+    return {
+        "model": llm_request.model,
+        "agent": labels.get(_AGENT_LABEL),
+        "system_instruction": system if isinstance(system, str) or system is None else
+                              _strip_ids(system.model_dump(mode="json", exclude_none=True)),
+        "contents": _strip_ids([c.model_dump(mode="json", exclude_none=True) for c in llm_request.contents or []]),
+        "tools": sorted(llm_request.tools_dict),
+        "builtin_tools": sorted(
+            name for tool in (config.tools if config is not None else None) or []
+            for name in ("google_search",) if getattr(tool, name, None) is not None
+        ),
+        "response_schema": bool(config is not None and (config.response_schema or config.response_json_schema)),
+    }
+
+
+def fingerprint(request: Dict) -> str:
+    """Hash of a canonical request. Contents are compared as a multiset:
+    parallel branches that finish in a different order than when recorded
+    (e.g. the daily specialists feeding the planner) still match."""
+    contents = sorted(json.dumps(c, sort_keys=True, ensure_ascii=False) for c in request["contents"])
+    text = json.dumps({**request, "contents": contents}, sort_keys=True, ensure_ascii=False)
+    for pattern, replacement in _VOLATILE:
+        text = pattern.sub(replacement, text)
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def _error_record(error: Exception) -> Optional[Dict]:
+    if isinstance(error, genai_errors.APIError):
+        return {"code": error.code, "body": error.details}
+    return None
+
+
+def _raise_recorded(error: Dict):
+    body = error.get("body") or {}
+    if error["code"] < 500:
+        raise genai_errors.ClientError(error["code"], body)
+    raise genai_errors.ServerError(error["code"], body)
+
+
+class RecordingLlm(BaseLlm):
+    """Passes calls through to `inner` and appends each interaction to
+    `<cassette_dir>/<workflow>.jsonl` with per-response time offsets.
+    API errors are recorded too, so throttling and failures replay."""
+
+    inner: BaseLlm
+    cassette_dir: str
+
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        request = canonical_request(llm_request)
+        workflow = current_workflow.get()
+        responses, error = [], None
+        started = time.monotonic()
+        try:
+            async for response in self.inner.generate_content_async(llm_request, stream):
+                responses.append({
+                    "offset": round(time.monotonic() - started, 4),
+                    "response": response.model_dump(mode="json", exclude_none=True)
+                })
+                yield response
+        except Exception as e:
+            error = _error_record(e)
+            if error is None:
+                raise
+            error["offset"] = round(time.monotonic() - started, 4)
+            raise
+        finally:
+            record = {
+                "fingerprint": fingerprint(request),
+                "workflow": workflow,
+                "agent": request["agent"],
+                "model": self.inner.model,
+                "stream": stream,
+                "recorded_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "request": request,
+                "responses": responses,
+                "error": error
+            }
+            # Interactions cut short by a cancelled request are not replayable.
+            # The append is a single small write, done inline so it survives cancellation.
+            if error is not None or (responses and not responses[-1]["response"].get("partial")):
+                self._append(workflow, record)
+
+    def _append(self, workflow: str, record: Dict):
+        path = os.path.join(self.cassette_dir, f"{re.sub(r'[^A-Za-z0-9_.-]', '_', workflow)}.jsonl")
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            os.makedirs(self.cassette_dir, exist_ok=True)
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(line)
+
+
+class ReplayLlm(BaseLlm):
+    """Serves recorded interactions from every cassette in `cassette_dir`.
+
+    Requests are matched by fingerprint; repeated identical requests get the
+    recorded interactions in order (cycling when they run out). Responses
+    are released at their recorded offsets times `latency_scale` (1 = as
+    recorded, 0 = immediately). A request with no recording raises
+    CassetteMiss, or is answered by `fallback` when one is set.
+    """
+
+    model: str = "gemini-2.5-flash"
+    cassette_dir: str
+    latency_scale: float = 1.0
+    fallback: Optional[BaseLlm] = None
+
+    _interactions: Dict[str, List[Dict]] = PrivateAttr()
+    _served: Dict[str, int] = PrivateAttr(default_factory=lambda: defaultdict(int))
+    _hits: int = PrivateAttr(default=0)
+    _misses: int = PrivateAttr(default=0)
+
+    def model_post_init(self, __context: Any):
+        self._interactions = defaultdict(list)
+        for path in sorted(glob.glob(os.path.join(self.cassette_dir, "*.jsonl"))):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        record = json.loads(line)
+                        self._interactions[record["fingerprint"]].append(record)
+        logger.info("Loaded %d recorded interactions from %s",
+                    sum(len(v) for v in self._interactions.values()), self.cassette_dir)
+
+    def stats(self) -> Dict:
+        return {"interactions": sum(len(v) for v in self._interactions.values()),
+                "hits": self._hits, "misses": self._misses}
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        request = canonical_request(llm_request)
+        key = fingerprint(request)
+        recorded = self._interactions.get(key)
+        if not recorded:
+            self._misses += 1
+            if self.fallback is not None:
+                async for response in self.fallback.generate_content_async(llm_request, stream):
+                    yield response
+                return
+            raise CassetteMiss(f"No recorded interaction for agent '{request['agent']}' (fingerprint {key[:12]})")
+
+        self._hits += 1
+        record = recorded[self._served[key] % len(recorded)]
+        self._served[key] += 1
+
+        started = time.monotonic()
+        for item in record["responses"]:
+            if item["response"].get("partial") and not stream:
+                continue
+            await self._wait_until(started, item["offset"])
+            yield LlmResponse.model_validate(item["response"])
+        if record.get("error"):
+            await self._wait_until(started, record["error"].get("offset", 0.0))
+            _raise_recorded(record["error"])
+
+    async def _wait_until(self, started: float, offset: float):
+        delay = started + offset * self.latency_scale - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def replay_from_settings(model: str = "gemini-2.5-flash") -> ReplayLlm:
+    fallback = None
+    if settings.LLM_REPLAY_ON_MISS == "fake":
+        from .fake_llm import FakeLlm
+        fallback = FakeLlm.from_settings(model)
+    return ReplayLlm(
+        model=model,
+        cassette_dir=settings.LLM_CASSETTE_DIR,
+        latency_scale=settings.LLM_REPLAY_LATENCY_SCALE,
+        fallback=fallback
+    )
@@ -0,0 +1,291 @@
+"""
+Context caching.
+
+Long, stable request prefixes (an agent's system instruction and tools, a
+user's resume) are registered once with the provider's cached-content API
+and referenced by handle afterwards, so repeated requests only send and pay
+full price for what changed. Handles are shared across requests and users
+until their TTL runs out; prefixes below the provider's minimum size are
+never cached.
+"""
+import json
+import time
+import asyncio
+import hashlib
+import logging
+from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from google import genai
+from google.genai import types
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models.llm_request import LlmRequest
+from google.adk.plugins.base_plugin import BasePlugin
+
+from ..core.config import settings
+from ..services import metrics
+
+logger = logging.getLogger(__name__)
+
+# Leading parts of the new user message that stay the same across requests
+# (e.g. the resume when one resume is analyzed against many job descriptions)
+stable_prefix_parts: ContextVar[int] = ContextVar("stable_prefix_parts", default=0)
+
+context_cache_requests = metrics.registry.counter(
+    "synergy_context_cache_requests_total", "Model calls by context cache outcome (hit, created, skipped, error)",
+    ("agent", "outcome"))
+
+
+@contextmanager
+def stable_prefix(parts: int):
+    """Mark the first `parts` parts of the message sent inside the block as cacheable."""
+    token = stable_prefix_parts.set(parts)
+    try:
+        yield
+    finally:
+        stable_prefix_parts.reset(token)
+
+
+def estimate_tokens(system_instruction, contents: List[types.Content]) -> int:
+    chars = len(system_instruction) if isinstance(system_instruction, str) else 0
+    for content in contents:
+        chars += sum(len(part.text or "") for part in content.parts or [])
+    return chars // 4
+
+
+@dataclass
+class CacheHandle:
+    name: str
+    expires_at: float
+    tokens: int
+    hits: int = 0
+
+
+class GeminiCacheBackend:
+    """Creates and deletes Gemini cached contents (client.aio.caches)."""
+
+    def __init__(self, client: genai.Client):
+        self.client = client
+
+    async def create(self, model: str, system_instruction, contents: List[types.Content],
+                     tools, tool_config, ttl_seconds: float, display_name: str) -> CacheHandle:
+        cached = await self.client.aio.caches.create(
+            model=model,
+            config=types.CreateCachedContentConfig(
+                system_instruction=system_instruction,
+                contents=contents or None,
+                tools=tools or None,
+                tool_config=tool_config,
+                ttl=f"{int(ttl_seconds)}s",
+                display_name=display_name
+            )
+        )
+        usage = cached.usage_metadata
+        tokens = (usage.total_token_count if usage is not None else None) or estimate_tokens(system_instruction, contents)
+        expires_at = cached.expire_time.timestamp() if cached.expire_time is not None else time.time() + ttl_seconds
+        return CacheHandle(name=cached.name, expires_at=expires_at, tokens=tokens)
+
+    async def delete(self, name: str):
+        await self.client.aio.caches.delete(name=name)
+
+
+class FakeCacheBackend:
+    """In-process stand-in for the cached-content API (tests, fake/replay backends).
+
+    `cached_tokens` plays the server side: FakeLlm reads it to report
+    cached_content_token_count for requests that reference a handle.
+    """
+
+    _tokens: Dict[str, int] = {}
+
+    async def create(self, model: str, system_instruction, contents: List[types.Content],
+                     tools, tool_config, ttl_seconds: float, display_name: str) -> CacheHandle:
+        tokens = estimate_tokens(system_instruction, contents)
+        name = f"cachedContents/fake-{hashlib.sha256(f'{model}{time.time()}{display_name}'.encode()).hexdigest()[:16]}"
+        FakeCacheBackend._tokens[name] = tokens
+        return CacheHandle(name=name, expires_at=time.time() + ttl_seconds, tokens=tokens)
+
+    async def delete(self, name: str):
+        FakeCacheBackend._tokens.pop(name, None)
+
+    @classmethod
+    def cached_tokens(cls, name: Optional[str]) -> int:
+        return cls._tokens.get(name, 0) if name else 0
+
+
+class ContextCacheManager:
+    """Keeps one cached-content handle per distinct prefix.
+
+    A handle is reused until `refresh_margin` seconds before it expires;
+    after that the next request registers the prefix again. Concurrent
+    requests for a prefix that is being registered wait for that one
+    registration. Prefixes the provider refused are not retried for
+    `failure_backoff` seconds. At most `max_entries` handles are kept; the
+    least recently used ones are deleted at the provider.
+    """
+
+    def __init__(self, backend, ttl_seconds: float = 3600, min_tokens: int = 1024,
+                 max_entries: int = 500, refresh_margin: float = 60, failure_backoff: float = 300):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.min_tokens = min_tokens
+        self.max_entries = max_entries
+        self.refresh_margin = refresh_margin
+        self.failure_backoff = failure_backoff
+
+        self._handles: "OrderedDict[str, CacheHandle]" = OrderedDict()
+        self._creating: Dict[str, asyncio.Future] = {}
+        self._failed: Dict[str, float] = {}
+        self._tasks = set()
+        self._stats = defaultdict(int)
+
+    @staticmethod
+    def key(model: str, system_instruction, contents: List[types.Content], tools, tool_config) -> str:
+        def dump(value):
+            if value is None:
+                return None
+            if isinstance(value, list):
+                return [dump(v) for v in value]
+            return value.model_dump(mode="json", exclude_none=True) if hasattr(value, "model_dump") else value
+        raw = json.dumps([model, dump(system_instruction), dump(contents), dump(tools), dump(tool_config)],
+                         sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    async def get_or_create(self, agent: str, model: str, system_instruction, contents: List[types.Content],
+                            tools, tool_config) -> Optional[CacheHandle]:
+        """Handle for the prefix, registering it if needed; None if it is not cacheable."""
+        if estimate_tokens(system_instruction, contents) < self.min_tokens:
+            self._count(agent, "skipped")
+            return None
+        key = self.key(model, system_instruction, contents, tools, tool_config)
+        now = time.time()
+
+        handle = self._handles.get(key)
+        if handle is not None and handle.expires_at - self.refresh_margin > now:
+            self._handles.move_to_end(key)
+            handle.hits += 1
+            self._count(agent, "hit")
+            return handle
+        if self._failed.get(key, 0) > now:
+            self._count(agent, "skipped")
+            return None
+
+        pending = self._creating.get(key)
+        if pending is not None:
+            handle = await asyncio.shield(pending)
+            self._count(agent, "hit" if handle is not None else "skipped")
+            return handle
+
+        future = asyncio.get_running_loop().create_future()
+        self._creating[key] = future
+        handle = None
+        try:
+            handle = await self.backend.create(
+                model, system_instruction, contents, tools, tool_config,
+                self.ttl_seconds, f"synergy-{agent}"[:128]
+            )
+            self._handles[key] = handle
+            self._evict()
+            self._count(agent, "created")
+        except Exception as e:
+            logger.warning("Could not create a context cache for %s: %s", agent, e)
+            self._failed[key] = now + self.failure_backoff
+            self._count(agent, "error")
+        finally:
+            del self._creating[key]
+            future.set_result(handle)
+        return handle
+
+    def _evict(self):
+        while len(self._handles) > self.max_entries:
+            _, handle = self._handles.popitem(last=False)
+            self._delete(handle.name)
+        now = time.time()
+        for key in [key for key, handle in self._handles.items() if handle.expires_at <= now]:
+            del self._handles[key]
+
+    def _delete(self, name: str):
+        async def delete():
+            try:
+                await self.backend.delete(name)
+            except Exception as e:
+                logger.debug("Could not delete context cache %s: %s", name, e)
+        task = asyncio.create_task(delete())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _count(self, agent: str, outcome: str):
+        context_cache_requests.inc(agent, outcome)
+        self._stats[outcome] += 1
+
+    def stats(self) -> Dict:
+        now = time.time()
+        live = [handle for handle in self._handles.values() if handle.expires_at > now]
+        return {
+            "backend": type(self.backend).__name__,
+            "handles": len(live),
+            "cached_tokens": sum(handle.tokens for handle in live),
+            "handle_hits": sum(handle.hits for handle in live),
+            "ttl_seconds": self.ttl_seconds,
+            "min_tokens": self.min_tokens,
+            **{outcome: self._stats[outcome] for outcome in ("hit", "created", "skipped", "error")}
+        }
+
+
+class ContextCachePlugin(BasePlugin):
+    """ADK plugin that moves each request's stable prefix into a cached content.
+
+    The prefix is the system instruction and tools, plus the leading parts
+    of the first user message when the caller marked them with
+    `stable_prefix`. When a handle is available the request references it
+    (config.cached_content) and no longer carries the prefix itself; the
+    provider then reports the prefix as cached_content_token_count, which
+    ends up in the usage rows behind /api/usage.
+    """
+
+    def __init__(self, manager: ContextCacheManager, agents: Optional[set] = None):
+        super().__init__(name="synergy_context_cache")
+        self.manager = manager
+        self.agents = agents
+
+    async def before_model_callback(self, *, callback_context: CallbackContext, llm_request: LlmRequest):
+        agent = callback_context.agent_name
+        config = llm_request.config
+        if (self.agents and agent not in self.agents) or config is None or config.cached_content:
+            return None
+
+        contents = list(llm_request.contents or [])
+        prefix: List[types.Content] = []
+        parts = stable_prefix_parts.get()
+        if parts and contents and contents[0].role == "user" and len(contents[0].parts or []) > parts:
+            first = contents[0]
+            prefix = [types.Content(role="user", parts=first.parts[:parts])]
+            contents[0] = types.Content(role="user", parts=first.parts[parts:])
+
+        handle = await self.manager.get_or_create(
+            agent, llm_request.model, config.system_instruction, prefix, config.tools, config.tool_config
+        )
+        if handle is None:
+            return None
+        llm_request.contents = contents
+        config.cached_content = handle.name
+        config.system_instruction = None
+        config.tools = None
+        config.tool_config = None
+        return None
+
+
+def build_cache_backend():
+    """CONTEXT_CACHE_BACKEND; "auto" only talks to Gemini when the real model does."""
+    backend = settings.CONTEXT_CACHE_BACKEND
+    if backend == "auto":
+        backend = "gemini" if settings.LLM_BACKEND == "gemini" else "fake"
+    if backend == "fake":
+        return FakeCacheBackend()
+    return GeminiCacheBackend(genai.Client(
+        api_key=settings.GOOGLE_API_KEY,
+        http_options=types.HttpOptions(base_url=settings.GEMINI_BASE_URL or None)
+    ))
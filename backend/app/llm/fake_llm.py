@@ -0,0 +1,260 @@
+"""
+Offline fake LLM backend.
+
+Stands in for Gemini (LLM_BACKEND=fake) so the FastAPI + ADK orchestration
+can be exercised and load-tested without an API key or network access.
+Latency, output size, tool calls and errors are all configurable; nothing
+here is meant to produce useful answers.
+"""
+import json
+import random
+import asyncio
+import logging
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
+
+from pydantic import PrivateAttr
+
+from google.genai import types
+from google.genai import errors as genai_errors
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+
+from ..core.config import settings
+from .context_cache import FakeCacheBackend
+
+logger = logging.getLogger(__name__)
+
+_AGENT_LABEL = "adk_agent_name"
+
+_WORDS = (
+    "plan", "focus", "review", "practice", "schedule", "goal", "session", "notes",
+    "break", "topic", "interview", "role", "skills", "project", "summary", "next"
+)
+
+
+class Distribution:
+    """A sampler parsed from specs like "fixed:0.5", "uniform:0.2,1.0",
+    "normal:1.0,0.2" or "lognormal:1.0,0.5" (median, sigma). Samples are
+    never negative."""
+
+    KINDS = ("fixed", "uniform", "normal", "lognormal")
+
+    def __init__(self, spec: str):
+        kind, _, args = spec.strip().partition(":")
+        kind = kind.strip().lower()
+        try:
+            params = [float(a) for a in args.split(",") if a.strip()]
+        except ValueError:
+            raise ValueError(f"Invalid distribution '{spec}'")
+        needed = 1 if kind == "fixed" else 2
+        if kind not in self.KINDS or len(params) != needed:
+            raise ValueError(f"Invalid distribution '{spec}' (expected one of {', '.join(self.KINDS)})")
+        self.spec = spec
+        self.kind = kind
+        self.params = params
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "fixed":
+            value = self.params[0]
+        elif self.kind == "uniform":
+            value = rng.uniform(*self.params)
+        elif self.kind == "normal":
+            value = rng.gauss(*self.params)
+        else:
+            median, sigma = self.params
+            value = median * rng.lognormvariate(0.0, sigma) if median > 0 else 0.0
+        return max(0.0, value)
+
+
+def parse_tool_script(raw: str) -> Optional[Dict[str, List[Dict]]]:
+    """FAKE_LLM_TOOL_SCRIPT: agent name ("*" for any other agent) -> tool calls.
+
+    Each call is a tool name or {"name": ..., "args": {...}}. Empty means
+    "auto": every function tool the agent has is called once per turn.
+    """
+    if not raw.strip():
+        return None
+    script = {}
+    for agent, calls in json.loads(raw).items():
+        script[agent] = [{"name": c, "args": None} if isinstance(c, str) else
+                         {"name": c["name"], "args": c.get("args")} for c in calls]
+    return script
+
+
+def _sample_args(declaration: types.FunctionDeclaration) -> Dict[str, Any]:
+    """Placeholder arguments for every required parameter of a declared tool."""
+    schema = declaration.parameters
+    if schema is None or not schema.properties:
+        return {}
+    args = {}
+    for name in schema.required or schema.properties:
+        kind = schema.properties[name].type
+        if kind == types.Type.INTEGER:
+            args[name] = 5
+        elif kind == types.Type.NUMBER:
+            args[name] = 0.5
+        elif kind == types.Type.BOOLEAN:
+            args[name] = True
+        elif kind == types.Type.ARRAY:
+            args[name] = []
+        else:
+            args[name] = f"sample {name}"
+    return args
+
+
+def _uses_google_search(llm_request: LlmRequest) -> bool:
+    tools = llm_request.config.tools if llm_request.config is not None else None
+    return any(getattr(tool, "google_search", None) is not None for tool in tools or [])
+
+
+def _prompt_tokens(llm_request: LlmRequest) -> int:
+    chars = 0
+    for content in llm_request.contents or []:
+        for part in content.parts or []:
+            chars += len(part.text or "")
+    config = llm_request.config
+    if config is not None and isinstance(config.system_instruction, str):
+        chars += len(config.system_instruction)
+    return max(1, chars // 4)
+
+
+class FakeLlm(BaseLlm):
+    """Offline stand-in for Gemini with scripted behaviour.
+
+    Per call: sleep for a sample of `latency` (plus `search_latency` when
+    the agent has google_search, which Gemini runs server-side), fail with a
+    Gemini-shaped 429/5xx at `error_rate`, otherwise answer with filler text
+    of a sampled token count and matching usage metadata. Streaming splits
+    the answer into partial chunks spread across the latency.
+
+    Before answering, an agent with function tools gets one turn of
+    function calls (from `tool_script`, or every tool once when the script
+    is empty), so FunctionTool execution is part of the measured path.
+    """
+
+    model: str = "gemini-2.5-flash"
+    latency: str = "lognormal:1.0,0.5"
+    search_latency: str = "uniform:0.5,1.5"
+    output_tokens: str = "uniform:200,600"
+    error_rate: float = 0.0
+    error_codes: List[int] = [429, 503]
+    tool_script: str = ""
+    stream_chunk_tokens: int = 20
+    seed: Optional[int] = None
+
+    _latency: Distribution = PrivateAttr()
+    _search_latency: Distribution = PrivateAttr()
+    _output_tokens: Distribution = PrivateAttr()
+    _script: Optional[Dict[str, List[Dict]]] = PrivateAttr()
+    _rng: random.Random = PrivateAttr()
+    _calls: int = PrivateAttr(default=0)
+    _errors: int = PrivateAttr(default=0)
+
+    def model_post_init(self, __context: Any):
+        self._latency = Distribution(self.latency)
+        self._search_latency = Distribution(self.search_latency)
+        self._output_tokens = Distribution(self.output_tokens)
+        self._script = parse_tool_script(self.tool_script)
+        self._rng = random.Random(self.seed)
+
+    @classmethod
+    def from_settings(cls, model: str = "gemini-2.5-flash") -> "FakeLlm":
+        model_latency = json.loads(settings.FAKE_LLM_MODEL_LATENCY) if settings.FAKE_LLM_MODEL_LATENCY.strip() else {}
+        return cls(
+            model=model,
+            latency=model_latency.get(model, settings.FAKE_LLM_LATENCY),
+            search_latency=settings.FAKE_LLM_SEARCH_LATENCY,
+            output_tokens=settings.FAKE_LLM_OUTPUT_TOKENS,
+            error_rate=settings.FAKE_LLM_ERROR_RATE,
+            error_codes=[int(c) for c in settings.FAKE_LLM_ERROR_CODES.split(",") if c.strip()],
+            tool_script=settings.FAKE_LLM_TOOL_SCRIPT,
+            stream_chunk_tokens=settings.FAKE_LLM_STREAM_CHUNK_TOKENS,
+            seed=settings.FAKE_LLM_SEED
+        )
+
+    def stats(self) -> Dict:
+        return {"calls": self._calls, "injected_errors": self._errors}
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        self._calls += 1
+        delay = self._latency.sample(self._rng)
+        if _uses_google_search(llm_request):
+            delay += self._search_latency.sample(self._rng)
+
+        if self.error_codes and self._rng.random() < self.error_rate:
+            await asyncio.sleep(delay * self._rng.random())
+            self._errors += 1
+            raise self._error(self._rng.choice(self.error_codes))
+
+        # A referenced context cache counts towards the prompt, as in Gemini's usage metadata
+        cached_tokens = FakeCacheBackend.cached_tokens(
+            llm_request.config.cached_content if llm_request.config is not None else None
+        )
+        prompt_tokens = _prompt_tokens(llm_request) + cached_tokens
+        calls = self._tool_calls(llm_request)
+        if calls:
+            await asyncio.sleep(delay)
+            parts = [types.Part(function_call=types.FunctionCall(name=name, args=args)) for name, args in calls]
+            yield self._response(parts, prompt_tokens, 10 * len(parts), cached_tokens)
+            return
+
+        tokens = max(1, int(self._output_tokens.sample(self._rng)))
+        words = [self._rng.choice(_WORDS) for _ in range(tokens)]
+        if stream:
+            chunks = [words[i:i + self.stream_chunk_tokens] for i in range(0, tokens, self.stream_chunk_tokens)]
+            for chunk in chunks:
+                await asyncio.sleep(delay / len(chunks))
+                yield LlmResponse(
+                    content=types.Content(role="model", parts=[types.Part(text=" ".join(chunk) + " ")]),
+                    partial=True
+                )
+        else:
+            await asyncio.sleep(delay)
+        yield self._response([types.Part(text=" ".join(words))], prompt_tokens, tokens, cached_tokens)
+
+    def _tool_calls(self, llm_request: LlmRequest) -> List[Tuple[str, Dict]]:
+        """Function calls for this turn; none once the tools have answered."""
+        contents = llm_request.contents or []
+        if contents and any(part.function_response for part in contents[-1].parts or []):
+            return []
+        tools = {
+            name: tool for name, tool in llm_request.tools_dict.items()
+            if tool._get_declaration() is not None
+        }
+        if not tools:
+            return []
+        if self._script is None:
+            planned = [{"name": name, "args": None} for name in tools]
+        else:
+            labels = llm_request.config.labels if llm_request.config is not None else None
+            agent = (labels or {}).get(_AGENT_LABEL)
+            planned = self._script.get(agent, self._script.get("*", []))
+        calls = []
+        for call in planned:
+            tool = tools.get(call["name"])
+            if tool is None:
+                logger.warning("Scripted tool '%s' is not available to this agent", call["name"])
+                continue
+            calls.append((call["name"], call["args"] if call["args"] is not None else _sample_args(tool._get_declaration())))
+        return calls
+
+    def _response(self, parts: List[types.Part], prompt_tokens: int, output_tokens: int,
+                  cached_tokens: int = 0) -> LlmResponse:
+        return LlmResponse(
+            content=types.Content(role="model", parts=parts),
+            usage_metadata=types.GenerateContentResponseUsageMetadata(
+                prompt_token_count=prompt_tokens,
+                cached_content_token_count=cached_tokens or None,
+                candidates_token_count=output_tokens,
+                total_token_count=prompt_tokens + output_tokens
+            )
+        )
+
+    @staticmethod
+    def _error(code: int) -> genai_errors.APIError:
+        status = {429: "RESOURCE_EXHAUSTED", 500: "INTERNAL", 503: "UNAVAILABLE", 504: "DEADLINE_EXCEEDED"}
+        body = {"error": {"code": code, "status": status.get(code, "UNKNOWN"), "message": "Injected by the fake LLM"}}
+        return genai_errors.ClientError(code, body) if code < 500 else genai_errors.ServerError(code, body)
@@ -0,0 +1,109 @@
+"""
+Per-agent model routing.
+
+Every LLM agent is assigned a tier (agent name -> tier, with a default),
+and every tier names a model plus optional generation settings. Heavy
+research steps can stay on the standard model while formatting steps run
+on a lighter, cheaper one. Tiers and the agent map come from settings, so
+routing changes need no code changes.
+"""
+import json
+import logging
+from dataclasses import dataclass, asdict
+from typing import Callable, Dict, Optional
+
+from google.genai import types
+from google.adk.agents import BaseAgent, LlmAgent
+from google.adk.models.base_llm import BaseLlm
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ModelTier:
+    model: str
+    max_output_tokens: Optional[int] = None
+    temperature: Optional[float] = None
+    # Client-side rate limit budget for the tier's model (default GEMINI_RPM / GEMINI_TPM)
+    rpm: Optional[float] = None
+    tpm: Optional[float] = None
+
+
+DEFAULT_TIERS = {
+    "standard": ModelTier(model="gemini-2.5-flash"),
+    "light": ModelTier(model="gemini-2.5-flash-lite", max_output_tokens=4096, temperature=0.4),
+}
+
+
+def parse_tiers(raw: str) -> Dict[str, ModelTier]:
+    """MODEL_TIERS: {"tier": {"model": ..., "max_output_tokens": ..., "temperature": ..., "rpm": ..., "tpm": ...}},
+    merged over DEFAULT_TIERS (a tier given here replaces the default one)."""
+    tiers = dict(DEFAULT_TIERS)
+    for name, spec in (json.loads(raw) if raw.strip() else {}).items():
+        tiers[name] = ModelTier(**spec)
+    return tiers
+
+
+def parse_agent_tiers(raw: str) -> Dict[str, str]:
+    """AGENT_MODEL_TIERS: "JobSearchCoordinatorSimple:light,QualityJudgeAgent:light"."""
+    pairs = {}
+    for part in raw.split(","):
+        name, _, tier = part.partition(":")
+        if name.strip() and tier.strip():
+            pairs[name.strip()] = tier.strip()
+    return pairs
+
+
+class ModelRegistry:
+    """Resolves agent names to model instances and generation config.
+
+    `factory` builds the BaseLlm for a model id (Gemini, fake, replay...);
+    one instance per model id is shared by every agent on it.
+    """
+
+    def __init__(self, tiers: Dict[str, ModelTier], agent_tiers: Dict[str, str],
+                 default_tier: str, factory: Callable[[str], BaseLlm]):
+        unknown = {tier for tier in [default_tier, *agent_tiers.values()] if tier not in tiers}
+        if unknown:
+            raise ValueError(f"Unknown model tier(s): {', '.join(sorted(unknown))}")
+        self.tiers = tiers
+        self.agent_tiers = agent_tiers
+        self.default_tier = default_tier
+        self._factory = factory
+        self._models: Dict[str, BaseLlm] = {}
+
+    def model(self, model_id: str) -> BaseLlm:
+        llm = self._models.get(model_id)
+        if llm is None:
+            llm = self._models[model_id] = self._factory(model_id)
+        return llm
+
+    def tier_for(self, agent_name: str) -> str:
+        return self.agent_tiers.get(agent_name, self.default_tier)
+
+    def apply(self, root_agent: BaseAgent) -> BaseAgent:
+        """Point every LlmAgent in the tree at its tier's model and settings."""
+        agents = [root_agent]
+        while agents:
+            agent = agents.pop()
+            agents.extend(agent.sub_agents)
+            if not isinstance(agent, LlmAgent):
+                continue
+            tier = self.tiers[self.tier_for(agent.name)]
+            agent.model = self.model(tier.model)
+            overrides = {
+                key: value for key, value in
+                (("max_output_tokens", tier.max_output_tokens), ("temperature", tier.temperature))
+                if value is not None
+            }
+            if overrides:
+                config = agent.generate_content_config or types.GenerateContentConfig()
+                agent.generate_content_config = config.model_copy(update=overrides)
+        return root_agent
+
+    def describe(self) -> Dict:
+        return {
+            "default_tier": self.default_tier,
+            "tiers": {name: asdict(tier) for name, tier in sorted(self.tiers.items())},
+            "agents": dict(sorted(self.agent_tiers.items()))
+        }
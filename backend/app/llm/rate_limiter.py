@@ -0,0 +1,258 @@
+"""
+Adaptive rate limiting for Gemini calls.
+
+Gemini quotas are per model, so there is one limiter per model id, shared
+by every agent on that model. Each paces requests against
+requests-per-minute and tokens-per-minute budgets and adapts the budget
+with AIMD: a 429 / RESOURCE_EXHAUSTED halves it and pauses new calls to
+that model, and while calls keep succeeding it grows back by a small step
+per second.
+"""
+import re
+import time
+import asyncio
+import logging
+from functools import cached_property
+from typing import AsyncGenerator, Dict, Optional
+
+from google.genai import Client, types
+from google.genai import errors as genai_errors
+from google.adk.models.google_llm import Gemini
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveRateLimiter:
+    """Token-bucket pacing for RPM and TPM with an AIMD rate multiplier.
+
+    Both budgets are enforced with GCRA (the "virtual scheduling" form of a
+    token bucket): each call reserves its cost by pushing a theoretical
+    arrival time forward, then sleeps until its reservation is due. The
+    reservation happens without any await, so no lock is needed and callers
+    are served in arrival order. Up to `burst_seconds` worth of budget can
+    be spent at once.
+
+    `rate` scales both budgets. A throttle multiplies it by
+    `decrease_factor` (at most once per `decrease_cooldown` seconds, so a
+    burst of simultaneous 429s counts as one signal) and blocks new calls
+    for the server's retry delay or `backoff_seconds`. Successful calls add
+    `increase_step` back at most once per `increase_interval` seconds, up
+    to 1.0, so recovery is a slow ramp rather than a jump.
+    """
+
+    def __init__(
+        self,
+        rpm: float,
+        tpm: float,
+        burst_seconds: float = 2.0,
+        min_rate: float = 0.05,
+        increase_step: float = 0.05,
+        increase_interval: float = 1.0,
+        decrease_factor: float = 0.5,
+        decrease_cooldown: float = 5.0,
+        backoff_seconds: float = 5.0
+    ):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.burst_seconds = burst_seconds
+        self.min_rate = min_rate
+        self.increase_step = increase_step
+        self.increase_interval = increase_interval
+        self.decrease_factor = decrease_factor
+        self.decrease_cooldown = decrease_cooldown
+        self.backoff_seconds = backoff_seconds
+
+        self.rate = 1.0
+        self._request_tat = 0.0
+        self._token_tat = 0.0
+        self._blocked_until = 0.0
+        self._last_decrease = float("-inf")
+        self._last_change = float("-inf")
+
+        self.requests = 0
+        self.throttles = 0
+        self.waited_seconds = 0.0
+
+    # ------------------------------------------------------------------
+    # Pacing
+    # ------------------------------------------------------------------
+    async def acquire(self, estimated_tokens: int = 0):
+        """Wait until a call costing ~`estimated_tokens` fits both budgets."""
+        started = time.monotonic()
+        due = self._reserve(started, estimated_tokens)
+        while True:
+            now = time.monotonic()
+            wait = max(due, self._blocked_until) - now
+            if wait <= 0:
+                break
+            await asyncio.sleep(wait)
+        self.requests += 1
+        self.waited_seconds += time.monotonic() - started
+
+    def _reserve(self, now: float, tokens: int) -> float:
+        request_interval = 60.0 / (self.rpm * self.rate)
+        token_interval = 60.0 / (self.tpm * self.rate)
+
+        self._request_tat = max(self._request_tat, now) + request_interval
+        self._token_tat = max(self._token_tat, now) + tokens * token_interval
+
+        # A call is due once its reservation is within the burst allowance
+        return max(self._request_tat, self._token_tat) - self.burst_seconds
+
+    def record_success(self, estimated_tokens: int, actual_tokens: Optional[int]):
+        """Settle the token estimate against real usage and grow the rate."""
+        if actual_tokens is not None:
+            token_interval = 60.0 / (self.tpm * self.rate)
+            self._token_tat += (actual_tokens - estimated_tokens) * token_interval
+        now = time.monotonic()
+        if self.rate < 1.0 and now - self._last_change >= self.increase_interval:
+            self.rate = min(1.0, self.rate + self.increase_step)
+            self._last_change = now
+
+    def record_throttle(self, retry_after: Optional[float] = None):
+        """The server said 429: shrink the budget and pause new calls."""
+        now = time.monotonic()
+        self.throttles += 1
+        if now - self._last_decrease >= self.decrease_cooldown:
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+            self._last_decrease = self._last_change = now
+            # Drop the burst allowance too, so the next calls trickle in
+            self._request_tat = max(self._request_tat, now + self.burst_seconds)
+            self._token_tat = max(self._token_tat, now + self.burst_seconds)
+        self._blocked_until = max(self._blocked_until, now + (retry_after or self.backoff_seconds))
+        logger.info("Gemini rate limited; rate now %.2f of budget", self.rate)
+
+    def stats(self) -> dict:
+        return {
+            "rate": round(self.rate, 3),
+            "effective_rpm": round(self.rpm * self.rate, 1),
+            "effective_tpm": round(self.tpm * self.rate),
+            "blocked_for_seconds": round(max(0.0, self._blocked_until - time.monotonic()), 2),
+            "requests": self.requests,
+            "throttles": self.throttles,
+            "waited_seconds": round(self.waited_seconds, 2)
+        }
+
+
+class RateLimiterPool:
+    """One AdaptiveRateLimiter per model id, created on first use.
+
+    Models use the default `rpm`/`tpm` budget unless `configure()` gave
+    them their own (MODEL_TIERS "rpm"/"tpm", see agents/base.py).
+    """
+
+    def __init__(self, rpm: float, tpm: float, **options):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.options = options
+        self._budgets: Dict[str, tuple] = {}
+        self._limiters: Dict[str, AdaptiveRateLimiter] = {}
+
+    def configure(self, model: str, rpm: Optional[float] = None, tpm: Optional[float] = None):
+        """Give `model` its own budget (None keeps the default for that dimension)."""
+        self._budgets[model] = (rpm or self.rpm, tpm or self.tpm)
+        self._limiters.pop(model, None)
+
+    def get(self, model: str) -> AdaptiveRateLimiter:
+        limiter = self._limiters.get(model)
+        if limiter is None:
+            rpm, tpm = self._budgets.get(model, (self.rpm, self.tpm))
+            limiter = self._limiters[model] = AdaptiveRateLimiter(rpm=rpm, tpm=tpm, **self.options)
+        return limiter
+
+    def stats(self) -> Dict:
+        return {model: limiter.stats() for model, limiter in sorted(self._limiters.items())}
+
+
+def is_rate_limited(error: Exception) -> bool:
+    return isinstance(error, genai_errors.APIError) and (
+        error.code == 429 or error.status == "RESOURCE_EXHAUSTED"
+    )
+
+
+def retry_delay(error: genai_errors.APIError) -> Optional[float]:
+    """Server-suggested delay from a Retry-After header or a google.rpc.RetryInfo detail."""
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    try:
+        if headers.get("retry-after"):
+            return float(headers["retry-after"])
+    except (TypeError, ValueError):
+        pass
+    details = error.details if isinstance(error.details, dict) else {}
+    for detail in (details.get("error") or details).get("details") or []:
+        match = re.fullmatch(r"([\d.]+)s", str(detail.get("retryDelay", "")))
+        if match:
+            return float(match.group(1))
+    return None
+
+
+def estimate_tokens(llm_request: LlmRequest) -> int:
+    """Rough prompt + completion size (~4 characters per token) used for TPM pacing."""
+    chars = 0
+    for content in llm_request.contents or []:
+        for part in content.parts or []:
+            chars += len(part.text or "")
+    config = llm_request.config
+    if config is not None and isinstance(config.system_instruction, str):
+        chars += len(config.system_instruction)
+    output = (config.max_output_tokens if config is not None else None) or settings.GEMINI_ESTIMATED_OUTPUT_TOKENS
+    return chars // 4 + output
+
+
+class RateLimitedGemini(Gemini):
+    """Gemini model that paces calls through its model's shared limiter.
+
+    Calls rejected with 429 are retried (up to `GEMINI_RATE_LIMIT_MAX_RETRIES`
+    times) once the limiter's backoff has passed, as long as nothing was
+    streamed to the caller yet. `GEMINI_BASE_URL` points the client at
+    another endpoint, e.g. a local fake for testing.
+    """
+
+    @cached_property
+    def api_client(self) -> Client:
+        return Client(
+            http_options=types.HttpOptions(
+                headers=self._tracking_headers,
+                retry_options=self.retry_options,
+                base_url=settings.GEMINI_BASE_URL or None
+            )
+        )
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        limiter = gemini_rate_limiters.get(self.model)
+        estimate = estimate_tokens(llm_request)
+        attempt = 0
+        while True:
+            await limiter.acquire(estimate)
+            actual_tokens = None
+            yielded = False
+            try:
+                async for response in super().generate_content_async(llm_request, stream):
+                    if response.usage_metadata and response.usage_metadata.total_token_count:
+                        actual_tokens = response.usage_metadata.total_token_count
+                    yielded = True
+                    yield response
+            except Exception as e:
+                if not is_rate_limited(e):
+                    raise
+                limiter.record_throttle(retry_delay(e))
+                if yielded or attempt >= settings.GEMINI_RATE_LIMIT_MAX_RETRIES:
+                    raise
+                attempt += 1
+                continue
+            limiter.record_success(estimate, actual_tokens)
+            return
+
+
+# One limiter per model, shared by every agent in the process
+gemini_rate_limiters = RateLimiterPool(
+    rpm=settings.GEMINI_RPM,
+    tpm=settings.GEMINI_TPM,
+    backoff_seconds=settings.GEMINI_RATE_LIMIT_BACKOFF_SECONDS
+)
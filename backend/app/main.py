@@ -1,10 +1,15 @@
 import os
+import asyncio
 from fastapi import FastAPI
-from fastapi.responses import RedirectResponse
-from .api.routes import router
+from fastapi.responses import RedirectResponse, Response
+from .api.routes import router, runner, jobs
+from .api.middleware import EndpointContextMiddleware, MetricsMiddleware, WarmUpGateMiddleware
+from .services.metrics import registry as metrics_registry
 from .core.config import settings
 
 app = FastAPI(title=settings.PROJECT_NAME)
+app.add_middleware(EndpointContextMiddleware)
+app.add_middleware(MetricsMiddleware)
 
 @app.on_event("startup")
 async def ensure_database_directory():
@@ -34,6 +39,63 @@ async def ensure_database_directory():
         else:
             print(f"✅ Directory '{directory}' already exists.")
 
+async def warm_up():
+    """Build the runner (ADK, models, agents) off the event loop, then start the trace writer."""
+    await asyncio.to_thread(runner.get)
+    # Backfill the trace index from the JSONL file once, then start the background writer
+    try:
+        imported = await asyncio.to_thread(runner.trace_store.import_jsonl, settings.TRACE_FILE_PATH)
+        if imported:
+            print(f"✅ Indexed {imported} existing traces.")
+    except Exception as e:
+        print(f"⚠️ Could not backfill trace index: {e}")
+    runner.trace_sink.start()
+    if settings.STARTUP_WARM_UP_AGENTS:
+        await asyncio.to_thread(runner.runners.warm_up)
+
+async def wait_until_ready():
+    """Wait for the startup warm-up; if it failed, the runner is built on first use instead."""
+    task = getattr(app.state, "warm_up", None)
+    if task is not None and not task.done():
+        try:
+            await asyncio.shield(task)
+        except Exception:
+            pass
+
+app.add_middleware(WarmUpGateMiddleware, wait=wait_until_ready)
+
+@app.on_event("startup")
+async def start_warm_up():
+    """Start building the runner; with STARTUP_WARM_UP_MODE=background the worker binds meanwhile."""
+    app.state.warm_up = asyncio.create_task(warm_up())
+    if settings.STARTUP_WARM_UP_MODE == "blocking":
+        await app.state.warm_up
+
+@app.on_event("startup")
+async def start_job_workers():
+    """Start the background job worker pool."""
+    await jobs.start()
+
+@app.on_event("shutdown")
+async def stop_job_workers():
+    await jobs.stop()
+
+@app.on_event("shutdown")
+async def flush_trace_sink():
+    """Flush queued traces so the tail isn't lost on shutdown."""
+    await wait_until_ready()
+    if runner.built:
+        await runner.trace_sink.stop()
+
+@app.on_event("shutdown")
+async def close_session_writer():
+    """Drain queued session writes before the process exits."""
+    if not runner.built:
+        return
+    close = getattr(runner.session_service, "close", None)
+    if close is not None:
+        await close()
+
 app.include_router(router, prefix="/api")
 
 @app.get("/")
@@ -49,6 +111,11 @@ async def root():
 async def health():
     return {"status": "healthy", "env": settings.APP_ENV}
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus scrape endpoint"""
+    return Response(content=metrics_registry.render(), media_type=metrics_registry.CONTENT_TYPE)
+
 
 if __name__ == "__main__":
     import uvicorn
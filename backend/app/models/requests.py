@@ -1,11 +1,12 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Optional
 
 class DailyPlanRequest(BaseModel):
     user_id: str
     goals: str
     session_id: Optional[str] = None
-    stress_level: Optional[int] = 1
+    # 0 relaxed, 1 stressed, 2 anxious, 3 overwhelmed
+    stress_level: int = Field(1, ge=0, le=3)
 
 class InterviewRequest(BaseModel):
     user_id: str
@@ -49,3 +50,17 @@ class ResumeAnalysisRequest(BaseModel):
 class EvalRequest(BaseModel):
     user_prompt: str
     ai_response: str
+
+class QuizBatchItem(BaseModel):
+    topic: str
+    notes: Optional[str] = ""
+    difficulty: str = "medium"
+
+class QuizBatchRequest(BaseModel):
+    user_id: str
+    items: List[QuizBatchItem] = Field(..., min_length=1)
+    concurrency: Optional[int] = Field(None, ge=1)
+
+class EvalBatchRequest(BaseModel):
+    items: List[EvalRequest] = Field(..., min_length=1)
+    concurrency: Optional[int] = Field(None, ge=1)
@@ -4,14 +4,14 @@ import yaml
 # Get the directory where this script is located
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
-def load_prompt(filename: str) -> str:
-    """Loads a prompt instruction from a YAML file."""
+def load_prompt(filename: str, key: str = 'instruction') -> str:
+    """Loads a prompt instruction (or another top-level key) from a YAML file."""
     file_path = os.path.join(BASE_DIR, filename)
     
     try:
         with open(file_path, 'r') as file:
             data = yaml.safe_load(file)
-            return data.get('instruction', '')
+            return data.get(key, '')
     except FileNotFoundError:
         print(f"⚠️ Warning: Prompt file {filename} not found.")
         return ""
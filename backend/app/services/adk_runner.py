@@ -2,40 +2,146 @@
 Synergy AI Runner Service
 Orchestrates agent execution using Google ADK Runners.
 """
+import time
 import uuid
-import json
+import asyncio
 import logging
-from typing import Dict, List, Optional
+from functools import partial
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 from google.genai import types
 
 # Google ADK imports
 from google.adk.runners import Runner
-from google.adk.sessions import DatabaseSessionService
+from google.adk.agents.run_config import RunConfig, StreamingMode
 from google.adk.memory import InMemoryMemoryService
-from google.adk.plugins.logging_plugin import LoggingPlugin
+from google.adk.sessions.base_session_service import GetSessionConfig
 
 # Application imports
 from ..core.config import settings
-from ..agents.workflows import (
-    daily_workflow, 
-    interview_workflow, 
-    quiz_workflow, 
-    simple_job_search
-)
-from ..agents.mock_interview import interactive_interviewer, interview_evaluator
-from ..agents.resume_agent import resume_agent
-from ..agents.judge_agent import judge_agent 
+from ..agents.registry import AGENTS, load_agent
+from ..llm.context_cache import ContextCacheManager, ContextCachePlugin, build_cache_backend, stable_prefix
+from ..agents.deadline import deadline_scope, MISSING_SECTIONS_KEY, REUSED_SECTIONS_KEY
+from .runner_registry import RunnerRegistry
+from .streaming import event_sink, publish_event
+from .response_cache import ResponseCache, request_key
+from .single_flight import SingleFlight
+from .trace_sink import TraceSink
+from .trace_store import TraceStore
+from .session_bootstrap import SessionBootstrap
+from .session_store import build_session_service
+from .interview_memory import InterviewCompactor
+from .interview_research import InterviewResearchStore, research_key
+from .search_cache import SearchCachePlugin, SearchCacheStore, parse_pairs
+from .usage import UsageCollector, current_workflow, model_name
+from . import metrics
+from .metrics_plugin import MetricsPlugin
+
+logger = logging.getLogger(__name__)
 
 class SynergyAIRunner:
     """Runner for Synergy AI agents"""
     
     def __init__(self):
         # Initialize Core Services
-        # Note: We use the DATABASE_URL from settings
-        self.session_service = DatabaseSessionService(db_url=settings.DATABASE_URL)
+        # Note: We use the DATABASE_URL from settings (tuned for SQLite, see session_store.py)
+        self.session_service = metrics.instrument_session_service(build_session_service(settings.DATABASE_URL))
         self.memory_service = InMemoryMemoryService()
         self.app_name = "synergy_ai_platform"
+
+        # Get-or-create for sessions, with a bounded cache of known keys
+        self.sessions = SessionBootstrap(
+            session_service=self.session_service,
+            app_name=self.app_name,
+            max_keys=settings.SESSION_CACHE_MAX_KEYS
+        )
+
+        # Traces are queued here and written by a background task (see main.py)
+        # to both the JSONL file and the indexed store behind /api/traces
+        self.trace_store = TraceStore(settings.TRACE_DB_PATH)
+        self.trace_sink = TraceSink(
+            path=settings.TRACE_FILE_PATH,
+            max_queue=settings.TRACE_QUEUE_SIZE,
+            batch_size=settings.TRACE_BATCH_SIZE,
+            flush_interval=settings.TRACE_FLUSH_INTERVAL_SECONDS,
+            max_bytes=settings.TRACE_ROTATE_MAX_BYTES,
+            max_age_seconds=settings.TRACE_ROTATE_MAX_AGE_SECONDS,
+            backup_count=settings.TRACE_BACKUP_COUNT,
+            store=self.trace_store
+        )
+
+        # Grounded search responses, shared by every workflow's search agents
+        self.search_cache = SearchCachePlugin(
+            store=SearchCacheStore(settings.SEARCH_CACHE_DB_PATH, max_entries=settings.SEARCH_CACHE_MAX_ENTRIES),
+            domains=parse_pairs(settings.SEARCH_CACHE_AGENTS),
+            ttls={domain: float(ttl) for domain, ttl in parse_pairs(settings.SEARCH_CACHE_TTLS).items()},
+            stale_ratio=settings.SEARCH_CACHE_STALE_RATIO,
+            trace_sink=self.trace_sink
+        ) if settings.SEARCH_CACHE_ENABLED else None
+
+        # Stable prefixes registered with the provider's cached contents
+        self.context_cache = ContextCacheManager(
+            backend=build_cache_backend(),
+            ttl_seconds=settings.CONTEXT_CACHE_TTL_SECONDS,
+            min_tokens=settings.CONTEXT_CACHE_MIN_TOKENS,
+            max_entries=settings.CONTEXT_CACHE_MAX_ENTRIES
+        ) if settings.CONTEXT_CACHE_ENABLED else None
+
+        plugins = []
+        if metrics.registry.enabled:
+            plugins.append(MetricsPlugin())
+        if self.search_cache is not None:
+            plugins.append(self.search_cache)
+        if self.context_cache is not None:
+            agents = {a.strip() for a in settings.CONTEXT_CACHE_AGENTS.split(",") if a.strip()}
+            plugins.append(ContextCachePlugin(self.context_cache, agents=agents or None))
+
+        # Runners are built once per agent/workflow and shared by all requests
+        self.runners = RunnerRegistry(
+            app_name=self.app_name,
+            session_service=self.session_service,
+            memory_service=self.memory_service,
+            plugins=plugins
+        )
+        # Agents are imported and built on first use (see agents/registry.py)
+        for key in AGENTS:
+            self.runners.register(key, partial(load_agent, key))
+
+        # Company/role interview research shared across users
+        self.interview_research = InterviewResearchStore(
+            settings.INTERVIEW_RESEARCH_DB_PATH, ttl_seconds=settings.INTERVIEW_RESEARCH_TTL_SECONDS
+        ) if settings.INTERVIEW_RESEARCH_ENABLED else None
+
+        # Exact + near-duplicate cache for opted-in workflows
+        self.response_cache = ResponseCache(
+            workflows=settings.RESPONSE_CACHE_WORKFLOWS.split(","),
+            max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+            ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+            similarity_threshold=settings.RESPONSE_CACHE_SIMILARITY
+        )
+
+        # Identical in-flight requests attach to a single agent run
+        self.single_flight = SingleFlight()
+        self.coalesce_workflows = {w.strip() for w in settings.COALESCE_WORKFLOWS.split(",") if w.strip()}
+
+        # author -> model id per workflow, resolved lazily for usage rows
+        self._usage_models: Dict[str, Dict[str, str]] = {}
+        
+        # Queue depths, read when /metrics is scraped
+        metrics.registry.callback_gauge(
+            "synergy_trace_queue_depth", "Traces waiting for the background writer",
+            lambda: self.trace_sink.stats()["queued"]
+        )
+        metrics.registry.callback_gauge(
+            "synergy_session_write_queue_depth", "Session writes waiting for the serialized writer",
+            lambda: self.session_service.stats()["queued_writes"] if hasattr(self.session_service, "stats") else None
+        )
+
+        # Keeps mock interview context bounded (None = replay full history)
+        self.interview_compactor = InterviewCompactor(
+            keep_turns=settings.MOCK_INTERVIEW_KEEP_TURNS,
+            max_context_tokens=settings.MOCK_INTERVIEW_CONTEXT_TOKENS
+        ) if settings.MOCK_INTERVIEW_COMPACTION else None
         
         # Stress level mapping
         self.stress_levels = {
@@ -45,37 +151,120 @@ class SynergyAIRunner:
             3: "OVERWHELMED"
         }
 
-    def _get_runner(self, agent) -> Runner:
-        """Helper to instantiate a Runner for a specific agent/workflow"""
-        return Runner(
-            agent=agent,
+    def _get_runner(self, key: str) -> Runner:
+        """Helper to fetch the shared Runner for a specific agent/workflow"""
+        return self.runners.get(key)
+
+    async def _run_agent(self, key: str, user_id: str, session_id: str, message: types.Content,
+                         state_delta: Optional[Dict] = None) -> Optional[str]:
+        """Run an agent/workflow and return the text of its last final response.
+
+        When the caller is streaming (see services/streaming.py), the run uses
+        SSE mode and every event is published to the stream as it arrives.
+        Token usage reported on the events is recorded per sub-agent, also
+        for runs that fail or are cancelled part way.
+        """
+        runner = self._get_runner(key)
+        sink = event_sink.get()
+        run_config = RunConfig(streaming_mode=StreamingMode.SSE) if sink is not None else None
+        started = set()
+        usage = UsageCollector(key, user_id, session_id)
+        workflow = runner.agent.name
+        metrics.workflow_in_progress.inc(workflow)
+        started_at = time.perf_counter()
+        status = "error"
+        workflow_token = current_workflow.set(key)
+
+        final_text = None
+        try:
+            async for event in runner.run_async(
+                user_id=user_id,
+                session_id=session_id,
+                new_message=message,
+                state_delta=state_delta,
+                run_config=run_config
+            ):
+                usage.add(event)
+                if sink is not None:
+                    publish_event(sink, event, started)
+                if event.is_final_response() and event.content and event.content.parts:
+                    final_text = event.content.parts[0].text
+            status = "ok"
+        except asyncio.CancelledError:
+            status = "cancelled"
+            raise
+        finally:
+            current_workflow.reset(workflow_token)
+            metrics.workflow_in_progress.dec(workflow)
+            metrics.workflow_duration.observe(time.perf_counter() - started_at, workflow)
+            metrics.workflow_runs.inc(workflow, status)
+            self._record_usage(key, runner, usage)
+        return final_text
+
+    def _record_usage(self, key: str, runner: Runner, usage: UsageCollector):
+        if not usage.by_agent:
+            return
+        models = self._usage_models.setdefault(key, {})
+        for author in usage.by_agent:
+            if author not in models:
+                models[author] = model_name(runner.agent, author)
+        self.trace_sink.emit_usage(usage.rows(models))
+
+    async def _run_cached(self, workflow: str, cache_text: str, scope: Tuple, key: str,
+                          user_id: str, session_id: str, message: types.Content,
+                          state_delta: Optional[Dict] = None,
+                          run: Optional[Callable[[], Awaitable[Optional[str]]]] = None
+                          ) -> Tuple[Optional[str], Optional[str]]:
+        """Serve a workflow from the response cache, running the agent on a miss.
+
+        Concurrent misses for the same normalized request are coalesced into
+        one run; the callers that attached to it get tier 'coalesced'. `run`
+        replaces the single agent run for workflows that take several steps.
+        Returns (response_text, tier); the tier is None when this call ran the agent.
+        """
+        cached, tier = self.response_cache.get(workflow, cache_text, scope)
+        if cached is not None:
+            return cached, tier
+
+        async def execute() -> Optional[str]:
+            if run is not None:
+                response_text = await run()
+            else:
+                response_text = await self._run_agent(key, user_id, session_id, message, state_delta)
+            if response_text:
+                self.response_cache.set(workflow, cache_text, response_text, scope)
+            return response_text
+
+        if workflow not in self.coalesce_workflows:
+            return await execute(), None
+
+        response_text, shared = await self.single_flight.do(request_key(workflow, cache_text, scope), execute)
+        return response_text, "coalesced" if shared else None
+    
+    async def _ensure_session(self, user_id: str, session_id: str, new: bool = False):
+        """Helper to ensure a session exists (new=True for freshly generated ids)"""
+        await self.sessions.ensure(user_id, session_id, new=new)
+
+    async def _get_state(self, user_id: str, session_id: str) -> Optional[Dict]:
+        """Helper to read a session's state without loading its event history"""
+        session = await self.session_service.get_session(
             app_name=self.app_name,
-            session_service=self.session_service,
-            memory_service=self.memory_service,
-            plugins=[LoggingPlugin()]
+            user_id=user_id,
+            session_id=session_id,
+            config=GetSessionConfig(num_recent_events=1)
         )
-    
-    async def _ensure_session(self, user_id: str, session_id: str):
-        """Helper to ensure a session exists"""
-        try:
-            await self.session_service.create_session(
-                app_name=self.app_name, 
-                user_id=user_id, 
-                session_id=session_id
-            )
-        except Exception:
-            # Session likely exists, which is fine
-            pass
+        return dict(session.state) if session else None
 
     # =========================================================================
     # 1. DAILY PLANNER WORKFLOW
     # =========================================================================
     async def run_daily_plan(self, user_id: str, goals: str, session_id: str = None, stress_level: int = 1) -> Dict:
         """Run daily planning workflow"""
-        if not session_id:
+        new_session = not session_id
+        if new_session:
             session_id = f"session_{uuid.uuid4().hex[:8]}"
         
-        await self._ensure_session(user_id, session_id)
+        await self._ensure_session(user_id, session_id, new=new_session)
         
         stress_text = self.stress_levels.get(stress_level, "STRESSED")
         
@@ -86,32 +275,39 @@ class SynergyAIRunner:
                 parts=[types.Part(text=f"Create a daily plan for these goals: {goals} and also consider my stress level: {stress_text}")]
             )
             
-            # Initialize Runner with the Daily Workflow
-            runner = self._get_runner(daily_workflow)
-            
-            final_event = None
-            async for event in runner.run_async(
-                user_id=user_id,
-                session_id=session_id,
-                new_message=message
-            ):
-                if event.is_final_response() and event.content and event.content.parts:
-                    final_event = event
+            # Run the Daily Workflow within its latency budget
+            budget = settings.DAILY_PLAN_BUDGET_SECONDS
+            with deadline_scope(budget):
+                # The inputs the specialists' sections are fingerprinted on; an
+                # unknown stress level is stored as None (treated as missing)
+                inputs = {
+                    "daily_goals": goals,
+                    "daily_stress_level": stress_level if stress_level in self.stress_levels else None
+                }
+                response_text = await asyncio.wait_for(
+                    self._run_agent("daily_workflow", user_id, session_id, message, inputs),
+                    timeout=budget if budget > 0 else None
+                )
             
-            if final_event:
-                response_text = final_event.content.parts[0].text
-
+            if response_text:
                 self.log_trace("DailyWorkflow", goals, response_text)
+                state = await self._get_state(user_id, session_id) or {}
+                missing = state.get(MISSING_SECTIONS_KEY) or []
                 
                 return {
                     "success": True,
                     "session_id": session_id,
                     "plan": response_text,
+                    "partial": bool(missing),
+                    "missing_sections": missing,
+                    "reused_sections": state.get(REUSED_SECTIONS_KEY) or [],
                     "user_id": user_id,
                     "timestamp": datetime.now().isoformat()
                 }
             return {"success": False, "error": "No response generated"}
                 
+        except asyncio.TimeoutError:
+            return {"success": False, "error": f"Daily plan did not finish within {budget:g}s"}
         except Exception as e:
             return {"success": False, "error": str(e)}
 
@@ -121,7 +317,7 @@ class SynergyAIRunner:
     async def run_interview_prep(self, user_id: str, role: str, company: str, description: str = None) -> Dict:
         """Run interview preparation workflow"""
         session_id = f"interview_{uuid.uuid4().hex[:8]}"
-        await self._ensure_session(user_id, session_id)
+        await self._ensure_session(user_id, session_id, new=True)
         
         try:
             prompt = f"Prepare for {role} interview at {company}"
@@ -133,26 +329,43 @@ class SynergyAIRunner:
                 parts=[types.Part(text=prompt)]
             )
             
-            runner = self._get_runner(interview_workflow)
+            research_reused = False
+
+            async def run() -> Optional[str]:
+                # Shared research for this company/role, researched from a neutral
+                # company/role-only prompt (never this user's description) on a miss
+                nonlocal research_reused
+                research = await self._stored_research(company, role)
+                research_reused = research is not None
+                if research is None and self.interview_research is not None:
+                    await self.single_flight.do(
+                        f"interview_research\x1f{research_key(company, role)}",
+                        lambda: self.refresh_interview_research(company, role)
+                    )
+                    research = await self._stored_research(company, role, count_hit=False)
+                if research is None:
+                    return await self._run_agent("interview_workflow", user_id, session_id, message)
+                return await self._run_agent("interview_personalizer", user_id, session_id, message, {
+                    "raw_interview_research": research["raw_research"],
+                    "interview_plan": research["interview_plan"]
+                })
             
-            final_event = None
-            async for event in runner.run_async(
-                user_id=user_id,
-                session_id=session_id,
-                new_message=message
-            ):
-                if event.is_final_response() and event.content and event.content.parts:
-                    final_event = event
+            response_text, cache_tier = await self._run_cached(
+                "interview_prep", f"{role}\n{description or ''}", (company,),
+                "interview_workflow", user_id, session_id, message, run=run
+            )
             
-            if final_event:
-                response_text = final_event.content.parts[0].text
-                self.log_trace("InterviewWorkflow", prompt, response_text)
+            if response_text:
+                if not cache_tier:
+                    self.log_trace("InterviewWorkflow", prompt, response_text)
                 return {
                     "success": True,
                     "session_id": session_id,
                     "plan": response_text,
                     "role": role,
                     "company": company,
+                    "cache": cache_tier,
+                    "research_reused": research_reused,
                     "timestamp": datetime.now().isoformat()
                 }
             return {"success": False, "error": "No response generated"}
@@ -160,13 +373,56 @@ class SynergyAIRunner:
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+    async def refresh_interview_research(self, company: str, role: str) -> Dict:
+        """Run the research steps (search + processing) for a company/role and store the result."""
+        if self.interview_research is None:
+            return {"success": False, "error": "Interview research store is disabled"}
+        user_id = "research-prewarm"
+        session_id = f"research_{uuid.uuid4().hex[:8]}"
+        await self._ensure_session(user_id, session_id, new=True)
+        message = types.Content(
+            role="user",
+            parts=[types.Part(text=f"Prepare for {role} interview at {company}")]
+        )
+        try:
+            await self._run_agent("interview_research", user_id, session_id, message)
+            saved = await self._save_research(company, role, user_id, session_id)
+            return {"success": saved, "company": company, "role": role,
+                    **({} if saved else {"error": "Research steps produced no output"})}
+        except Exception as e:
+            return {"success": False, "company": company, "role": role, "error": str(e)}
+
+    async def _stored_research(self, company: str, role: str, count_hit: bool = True) -> Optional[Dict]:
+        if self.interview_research is None:
+            return None
+        try:
+            return await asyncio.to_thread(self.interview_research.get_fresh, company, role, count_hit)
+        except Exception as e:
+            logger.warning("Interview research lookup failed: %s", e)
+            return None
+
+    async def _save_research(self, company: str, role: str, user_id: str, session_id: str) -> bool:
+        """Copy the research steps' outputs from the session into the shared store."""
+        if self.interview_research is None:
+            return False
+        state = await self._get_state(user_id, session_id) or {}
+        raw, plan = state.get("raw_interview_research"), state.get("interview_plan")
+        if not raw or not plan:
+            return False
+        try:
+            await asyncio.to_thread(self.interview_research.put, company, role, raw, plan)
+            return True
+        except Exception as e:
+            logger.warning("Could not store interview research for %s / %s: %s", company, role, e)
+            return False
+
     # =========================================================================
     # 3. QUIZ WORKFLOW
     # =========================================================================
     async def run_quiz_generation(self, user_id: str, topic: str, notes: str = "", difficulty: str = "medium") -> Dict:
         """Run quiz generation workflow"""
         session_id = f"quiz_{uuid.uuid4().hex[:8]}"
-        await self._ensure_session(user_id, session_id)
+        await self._ensure_session(user_id, session_id, new=True)
         
         try:
             prompt = (
@@ -180,21 +436,14 @@ class SynergyAIRunner:
                 parts=[types.Part(text=prompt)]
             )
             
-            runner = self._get_runner(quiz_workflow)
-            
-            final_event = None
-            async for event in runner.run_async(
-                user_id=user_id,
-                session_id=session_id,
-                new_message=message
-            ):
-                if event.is_final_response() and event.content and event.content.parts:
-                    final_event = event
+            response_text, cache_tier = await self._run_cached(
+                "quiz", f"{topic}\n{notes}", (difficulty,),
+                "quiz_workflow", user_id, session_id, message
+            )
             
-            if final_event:
-                response_text = final_event.content.parts[0].text
-
-                self.log_trace("QuizWorkflow", prompt, response_text)
+            if response_text:
+                if not cache_tier:
+                    self.log_trace("QuizWorkflow", prompt, response_text)
 
                 return {
                     "success": True,
@@ -202,6 +451,7 @@ class SynergyAIRunner:
                     "quiz": response_text,
                     "topic": topic,
                     "difficulty": difficulty,
+                    "cache": cache_tier,
                     "timestamp": datetime.now().isoformat()
                 }
             return {"success": False, "error": "No response generated"}
@@ -215,10 +465,7 @@ class SynergyAIRunner:
     async def start_mock_interview(self, user_id: str, role: str, company: str, common_topics: List[str]) -> Dict:
         """Starts a new interactive session and sets initial context."""
         session_id = f"mock_{uuid.uuid4().hex[:8]}"
-        await self._ensure_session(user_id, session_id)
-        
-        # We need a dedicated runner for the interactive agent
-        runner = self._get_runner(interactive_interviewer)
+        await self._ensure_session(user_id, session_id, new=True)
         
         initial_context_message = (
             f"START INTERVIEW for Role: {role}, Company: {company}. "
@@ -230,74 +477,61 @@ class SynergyAIRunner:
             parts=[types.Part(text=initial_context_message)]
         )
         
-        final_event = None
-        async for event in runner.run_async(
-            user_id=user_id,
-            session_id=session_id,
-            new_message=initial_message
-        ):
-            if event.is_final_response() and event.content and event.content.parts:
-                final_event = event
+        state_delta = None
+        if self.interview_compactor:
+            state_delta = self.interview_compactor.start(role, company, common_topics)
+        
+        response_text = await self._run_agent("interactive_interviewer", user_id, session_id, initial_message, state_delta)
 
-        if final_event and final_event.content and final_event.content.parts:
+        if response_text:
             return {
                 "success": True,
                 "session_id": session_id,
-                "response": final_event.content.parts[0].text
+                "response": response_text
             }
         return {"success": False, "error": "Failed to initialize interview"}
 
     async def continue_mock_interview(self, user_id: str, session_id: str, user_response: str) -> Dict:
         """Sends user response and gets the next question."""
-        # Re-instantiate runner for the same session
-        runner = self._get_runner(interactive_interviewer)
-        
         message = types.Content(
             role="user",
             parts=[types.Part(text=user_response)]
         )
         
-        final_event = None
-        async for event in runner.run_async(
-            user_id=user_id,
-            session_id=session_id,
-            new_message=message
-        ):
-            if event.is_final_response() and event.content and event.content.parts:
-                final_event = event
+        # Fold this exchange into the bounded context instead of replaying the whole history
+        state_delta = None
+        if self.interview_compactor:
+            state = await self._get_state(user_id, session_id)
+            if state is None:
+                return {"success": False, "error": f"Session not found: {session_id}"}
+            state_delta = self.interview_compactor.advance(state, user_response)
+        
+        # Reuse the shared interviewer runner for the same session
+        response_text = await self._run_agent("interactive_interviewer", user_id, session_id, message, state_delta)
         
-        if final_event and final_event.content and final_event.content.parts:
+        if response_text:
             return {
                 "success": True,
                 "session_id": session_id,
-                "response": final_event.content.parts[0].text
+                "response": response_text
             }
         return {"success": False, "error": "Session error or completion"}
 
     async def evaluate_interview(self, user_id: str, session_id: str) -> Dict:
         """Evaluates the entire session history using the EvaluatorAgent."""
-        # Use the Evaluator Agent here
-        runner = self._get_runner(interview_evaluator)
-        
         message = types.Content(
             role="user",
             parts=[types.Part(text="Please generate the final evaluation and summary based on the conversation history.")]
         )
         
-        final_event = None
-        async for event in runner.run_async(
-            user_id=user_id,
-            session_id=session_id,
-            new_message=message
-        ):
-            if event.is_final_response() and event.content and event.content.parts:
-                final_event = event
+        # Use the Evaluator Agent here
+        response_text = await self._run_agent("interview_evaluator", user_id, session_id, message)
         
-        if final_event and final_event.content and final_event.content.parts:
+        if response_text:
             return {
                 "success": True,
                 "session_id": session_id,
-                "summary": final_event.content.parts[0].text
+                "summary": response_text
             }
         return {"success": False, "error": "Evaluation failed or session not found"}
 
@@ -307,7 +541,7 @@ class SynergyAIRunner:
     async def quick_job_search(self, user_id: str, role: str, level: str, experience: int, location: str = "") -> Dict:
         """Quick job search using Google"""
         session_id = f"quick_{uuid.uuid4().hex[:8]}"
-        await self._ensure_session(user_id, session_id)
+        await self._ensure_session(user_id, session_id, new=True)
         
         try:
             prompt = f"""
@@ -327,18 +561,12 @@ class SynergyAIRunner:
                 parts=[types.Part(text=prompt)]
             )
             
-            runner = self._get_runner(simple_job_search)
-            
-            final_response = None
-            async for event in runner.run_async(
-                user_id=user_id,
-                session_id=session_id,
-                new_message=message
-            ):
-                if event.is_final_response() and event.content and event.content.parts:
-                    final_response = event.content.parts[0].text
-
-                    self.log_trace("JobSearchWorkflow", prompt, final_response)
+            final_response, cache_tier = await self._run_cached(
+                "job_search", role, (level, experience, location),
+                "simple_job_search", user_id, session_id, message
+            )
+            if final_response and not cache_tier:
+                self.log_trace("JobSearchWorkflow", prompt, final_response)
 
             # Helper to generate example links locally (same as your original logic)
             role_slug = role.replace(' ', '+')
@@ -355,6 +583,7 @@ class SynergyAIRunner:
                 "success": True,
                 "session_id": session_id,
                 "agent_response": final_response,
+                "cache": cache_tier,
                 "direct_links": example_links,
                 "search_tips": [
                     f"Search: '{role} {level} {location}'",
@@ -372,24 +601,17 @@ class SynergyAIRunner:
     async def run_resume_analysis(self, user_id: str, resume_text: str, jd: str) -> Dict:
         """Run ATS Resume Analysis"""
         session_id = f"resume_{uuid.uuid4().hex[:8]}"
-        await self._ensure_session(user_id, session_id)
-        
-        prompt = f"RESUME TEXT:\n{resume_text}\n\nJOB DESCRIPTION:\n{jd}"
+        await self._ensure_session(user_id, session_id, new=True)
         
-        message = types.Content(
-            role="user",
-            parts=[types.Part(text=prompt)]
-        )
-        
-        runner = self._get_runner(resume_agent)
+        # The resume is its own part so it can be context-cached across job descriptions
+        sections = [f"RESUME TEXT:\n{resume_text}\n\n", f"JOB DESCRIPTION:\n{jd}"]
+        message = types.Content(role="user", parts=[types.Part(text=text) for text in sections])
         
-        final_text = ""
-        async for event in runner.run_async(user_id=user_id, session_id=session_id, new_message=message):
-            if event.is_final_response() and event.content:
-                final_text = event.content.parts[0].text
+        with stable_prefix(1):
+            final_text = await self._run_agent("resume_agent", user_id, session_id, message) or ""
                 
         # Optional: Log this for observability
-        # self.log_trace("ResumeAgent", prompt, final_text)
+        # self.log_trace("ResumeAgent", "".join(sections), final_text)
         
         return {
             "success": True, 
@@ -398,7 +620,7 @@ class SynergyAIRunner:
         }
     
     def log_trace(self, agent_name: str, input_text: str, output_text: str):
-        """Simple Observability: Log agent traces to a JSONL file"""
+        """Simple Observability: Queue an agent trace for the JSONL trace file"""
         trace_entry = {
             "timestamp": datetime.now().isoformat(),
             "agent": agent_name,
@@ -407,38 +629,20 @@ class SynergyAIRunner:
             "status": "success"
         }
         
-        # Write to the shared data volume so frontend can read it
-        with open("/app/data/agent_traces.jsonl", "a") as f:
-            f.write(json.dumps(trace_entry) + "\n")
+        # Never touches the disk on the event loop; dropped (and counted) if the queue is full
+        self.trace_sink.emit(trace_entry)
 
     async def run_quality_check(self, user_prompt: str, ai_response: str) -> Dict:
         """Run LLM-as-a-Judge Evaluation"""
         session_id = f"eval_{uuid.uuid4().hex[:8]}"
         # Ensure session exists
-        try:
-            await self.session_service.create_session(
-                app_name=self.app_name, 
-                user_id="evaluator", 
-                session_id=session_id
-            )
-        except Exception:
-            pass
+        await self._ensure_session("evaluator", session_id, new=True)
         
         message = types.Content(
             role="user",
             parts=[types.Part(text=f"User Prompt: {user_prompt}\nAI Response: {ai_response}")]
         )
         
-        runner = self._get_runner(judge_agent)
-        
-        final_text = ""
-        # FIX: Use keyword arguments (user_id=..., session_id=..., new_message=...)
-        async for event in runner.run_async(
-            user_id="evaluator", 
-            session_id=session_id, 
-            new_message=message
-        ):
-            if event.is_final_response() and event.content:
-                final_text = event.content.parts[0].text
+        final_text = await self._run_agent("judge_agent", "evaluator", session_id, message) or ""
                 
         return {"success": True, "evaluation": final_text}
\ No newline at end of file
@@ -0,0 +1,275 @@
+"""
+Admission Scheduler
+Bounds concurrent LLM-bound requests with weighted, per-user fair queueing
+and load shedding.
+"""
+import math
+import time
+import asyncio
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from typing import Callable, Deque, Dict, Optional
+
+from . import metrics
+
+metrics_active = metrics.registry.gauge(
+    "synergy_admission_active", "Requests currently holding an admission slot")
+metrics_queue_depth = metrics.registry.gauge(
+    "synergy_admission_queue_depth", "Requests waiting for an admission slot", ("endpoint_class",))
+metrics_wait = metrics.registry.histogram(
+    "synergy_admission_wait_seconds", "Time spent queued before admission", ("endpoint_class",))
+metrics_requests = metrics.registry.counter(
+    "synergy_admission_requests_total", "Admission decisions by outcome (admitted, shed, timeout)",
+    ("endpoint_class", "outcome"))
+
+
+class AdmissionRejected(Exception):
+    """Raised when a request is shed instead of queued (maps to HTTP 429)."""
+
+    def __init__(self, reason: str, retry_after: int):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class _Waiter:
+    __slots__ = ("endpoint_class", "user_id", "future", "enqueued_at")
+
+    def __init__(self, endpoint_class: str, user_id: str, future: asyncio.Future):
+        self.endpoint_class = endpoint_class
+        self.user_id = user_id
+        self.future = future
+        self.enqueued_at = time.monotonic()
+
+
+class AdmissionScheduler:
+    """Weighted fair admission in front of the runner.
+
+    At most `max_concurrent` requests run at once. The rest wait in one
+    queue per endpoint class; classes are served by stride scheduling, so a
+    class with weight 6 gets six slots for every one a weight-1 class gets
+    while both have work waiting. Inside a class, users are served round
+    robin, so one user's burst cannot starve everybody else.
+
+    A request is rejected up front (AdmissionRejected -> 429) when its
+    estimated queue wait exceeds `max_wait_seconds`, the queue is full or
+    the user already has too many queued requests; a queued request that is
+    still waiting at the deadline is rejected as well. Wait estimates use a
+    moving average of each class's service time.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 8,
+        weights: Optional[Dict[str, float]] = None,
+        max_wait_seconds: float = 20.0,
+        max_queue: int = 200,
+        max_queued_per_user: int = 10,
+        initial_service_seconds: float = 5.0
+    ):
+        self.max_concurrent = max_concurrent
+        self.weights = weights or {"interactive": 6, "standard": 3, "batch": 1}
+        self.max_wait_seconds = max_wait_seconds
+        self.max_queue = max_queue
+        self.max_queued_per_user = max_queued_per_user
+
+        self.active = 0
+        self._queues: Dict[str, "OrderedDict[str, Deque[_Waiter]]"] = {c: OrderedDict() for c in self.weights}
+        self._queued: Dict[str, int] = {c: 0 for c in self.weights}
+        self._queued_by_user: Dict[str, int] = {}
+        self._pass: Dict[str, float] = {c: 0.0 for c in self.weights}
+        self._vtime = 0.0
+        self._service_time: Dict[str, float] = {c: initial_service_seconds for c in self.weights}
+
+        self.admitted = 0
+        self.shed = 0
+        self.timed_out = 0
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    @asynccontextmanager
+    async def slot(self, endpoint_class: str, user_id: str):
+        """Hold one execution slot for the duration of the block."""
+        started = await self.acquire(endpoint_class, user_id)
+        try:
+            yield
+        finally:
+            self.release(endpoint_class, started)
+
+    async def acquire(self, endpoint_class: str, user_id: str) -> float:
+        """Wait for a slot; returns the admission time to pass to `release()`."""
+        if endpoint_class not in self.weights:
+            raise ValueError(f"Unknown endpoint class '{endpoint_class}'")
+
+        if self.active < self.max_concurrent and not self.queue_depth():
+            return self._admit(endpoint_class, 0.0)
+
+        estimate = self.estimate_wait(endpoint_class)
+        if self.queue_depth() >= self.max_queue:
+            self._reject(endpoint_class, "shed")
+            raise AdmissionRejected("Server is at capacity, try again later", self._retry_after(estimate))
+        if self._queued_by_user.get(user_id, 0) >= self.max_queued_per_user:
+            self._reject(endpoint_class, "shed")
+            raise AdmissionRejected("Too many queued requests for this user", self._retry_after(estimate))
+        if estimate > self.max_wait_seconds:
+            self._reject(endpoint_class, "shed")
+            raise AdmissionRejected(
+                f"Estimated wait {estimate:.1f}s exceeds {self.max_wait_seconds:g}s",
+                self._retry_after(estimate)
+            )
+
+        waiter = _Waiter(endpoint_class, user_id, asyncio.get_running_loop().create_future())
+        self._enqueue(waiter)
+        try:
+            await asyncio.wait_for(waiter.future, timeout=self.max_wait_seconds)
+        except asyncio.TimeoutError:
+            self._remove(waiter)
+            self._reject(endpoint_class, "timeout")
+            raise AdmissionRejected(
+                f"Waited {self.max_wait_seconds:g}s without a free slot",
+                self._retry_after(self.estimate_wait(endpoint_class))
+            )
+        except asyncio.CancelledError:
+            # Client went away while queued (or right after being granted)
+            if waiter.future.done() and not waiter.future.cancelled():
+                self.release(endpoint_class, waiter.future.result())
+            else:
+                self._remove(waiter)
+            raise
+        return waiter.future.result()
+
+    async def acquire_with_backoff(self, endpoint_class: str, user_id: str, timeout: float,
+                                   on_backoff: Optional[Callable[[AdmissionRejected], None]] = None) -> float:
+        """`acquire()` for work with no client to send a 429 to (jobs, batch items).
+
+        While the request is shed it waits out the Retry-After and queues
+        again, for up to `timeout` seconds; after that the last
+        AdmissionRejected is raised.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                return await self.acquire(endpoint_class, user_id)
+            except AdmissionRejected as e:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise
+                if on_backoff is not None:
+                    on_backoff(e)
+                await asyncio.sleep(min(e.retry_after, remaining))
+
+    def release(self, endpoint_class: str, started: float):
+        """Give a slot back and hand it to the next waiter."""
+        self.active -= 1
+        elapsed = time.monotonic() - started
+        self._service_time[endpoint_class] = 0.8 * self._service_time[endpoint_class] + 0.2 * elapsed
+        metrics_active.dec()
+        self._dispatch()
+
+    def estimate_wait(self, endpoint_class: str) -> float:
+        """Rough wait for a new request of this class, given the current queues."""
+        busy = {c for c, n in self._queued.items() if n} | {endpoint_class}
+        share = self.weights[endpoint_class] / sum(self.weights[c] for c in busy)
+        ahead = self._queued[endpoint_class] + 1
+        return ahead * self._service_time[endpoint_class] / (self.max_concurrent * share)
+
+    def queue_depth(self) -> int:
+        return sum(self._queued.values())
+
+    def stats(self) -> Dict:
+        return {
+            "active": self.active,
+            "max_concurrent": self.max_concurrent,
+            "queued": dict(self._queued),
+            "estimated_wait_seconds": {c: round(self.estimate_wait(c), 2) for c in self.weights},
+            "admitted": self.admitted,
+            "shed": self.shed,
+            "timed_out": self.timed_out
+        }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _admit(self, endpoint_class: str, waited: float) -> float:
+        self.active += 1
+        self.admitted += 1
+        metrics_active.inc()
+        metrics_requests.inc(endpoint_class, "admitted")
+        metrics_wait.observe(waited, endpoint_class)
+        return time.monotonic()
+
+    def _reject(self, endpoint_class: str, outcome: str):
+        if outcome == "timeout":
+            self.timed_out += 1
+        else:
+            self.shed += 1
+        metrics_requests.inc(endpoint_class, outcome)
+
+    @staticmethod
+    def _retry_after(estimate: float) -> int:
+        return max(1, math.ceil(estimate))
+
+    def _enqueue(self, waiter: _Waiter):
+        cls = waiter.endpoint_class
+        if not self._queued[cls]:
+            # A class coming back from idle must not cash in the turns it skipped
+            self._pass[cls] = max(self._pass[cls], self._vtime)
+        self._queues[cls].setdefault(waiter.user_id, deque()).append(waiter)
+        self._queued[cls] += 1
+        self._queued_by_user[waiter.user_id] = self._queued_by_user.get(waiter.user_id, 0) + 1
+        metrics_queue_depth.inc(cls)
+
+    def _remove(self, waiter: _Waiter):
+        users = self._queues[waiter.endpoint_class]
+        pending = users.get(waiter.user_id)
+        if pending is None or waiter not in pending:
+            return
+        pending.remove(waiter)
+        if not pending:
+            del users[waiter.user_id]
+        self._forget(waiter)
+
+    def _forget(self, waiter: _Waiter):
+        self._queued[waiter.endpoint_class] -= 1
+        metrics_queue_depth.dec(waiter.endpoint_class)
+        remaining = self._queued_by_user.get(waiter.user_id, 1) - 1
+        if remaining:
+            self._queued_by_user[waiter.user_id] = remaining
+        else:
+            self._queued_by_user.pop(waiter.user_id, None)
+
+    def _dispatch(self):
+        while self.active < self.max_concurrent:
+            busy = [c for c, n in self._queued.items() if n]
+            if not busy:
+                return
+            cls = min(busy, key=lambda c: self._pass[c])
+            self._vtime = self._pass[cls]
+            self._pass[cls] += 1.0 / self.weights[cls]
+
+            # Round robin across users: take the head user's oldest request,
+            # then move that user to the back of the line
+            users = self._queues[cls]
+            user_id, pending = next(iter(users.items()))
+            waiter = pending.popleft()
+            if pending:
+                users.move_to_end(user_id)
+            else:
+                del users[user_id]
+            self._forget(waiter)
+
+            if waiter.future.done():
+                continue
+            waiter.future.set_result(self._admit(cls, time.monotonic() - waiter.enqueued_at))
+
+
+def parse_weights(raw: str) -> Dict[str, float]:
+    """Parse "interactive:6,standard:3,batch:1"."""
+    weights = {}
+    for part in raw.split(","):
+        name, _, weight = part.partition(":")
+        if name.strip():
+            weights[name.strip()] = float(weight or 1)
+    return weights
+
@@ -0,0 +1,67 @@
+"""
+Batch Execution
+Fans a list of items out over a bounded number of concurrent runner calls
+and yields per-item results as they complete.
+"""
+import time
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List
+
+
+async def run_batch(
+    items: List[Any],
+    run_item: Callable[[Any], Awaitable[Dict]],
+    concurrency: int
+) -> AsyncIterator[Dict]:
+    """Run `run_item` for every item with at most `concurrency` in flight.
+
+    Yields one `{"event": "item", "index", "success", ...}` record per item in
+    completion order, then a `{"event": "summary"}` record. A failing item
+    (an exception or a `success: False` result) is reported in its own record,
+    with the result's `retry_after` if it has one, and does not stop the rest
+    of the batch. Closing the iterator early (the client went away) cancels
+    the items still running.
+    """
+    started = time.perf_counter()
+    results: asyncio.Queue = asyncio.Queue()
+    next_index = iter(range(len(items)))
+
+    async def worker():
+        for index in next_index:
+            try:
+                result = await run_item(items[index])
+            except Exception as e:
+                record = {"event": "item", "index": index, "success": False, "error": str(e)}
+            else:
+                if isinstance(result, dict) and result.get("success") is False:
+                    record = {"event": "item", "index": index, "success": False,
+                              "error": result.get("error", "Unknown error")}
+                    if "retry_after" in result:
+                        record["retry_after"] = result["retry_after"]
+                else:
+                    record = {"event": "item", "index": index, "success": True, "result": result}
+            results.put_nowait(record)
+
+    # Workers share one index iterator, so at most `concurrency` items run at once
+    workers = [asyncio.create_task(worker()) for _ in range(max(1, min(concurrency, len(items))))]
+    succeeded = failed = 0
+    try:
+        for _ in range(len(items)):
+            record = await results.get()
+            if record["success"]:
+                succeeded += 1
+            else:
+                failed += 1
+            yield record
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    yield {
+        "event": "summary",
+        "total": len(items),
+        "succeeded": succeeded,
+        "failed": failed,
+        "elapsed_seconds": round(time.perf_counter() - started, 3)
+    }
@@ -0,0 +1,133 @@
+"""
+Interview Memory
+Bounded-context compaction for mock interview sessions.
+"""
+from typing import Dict, List
+
+# Session state keys owned by the compactor
+META_KEY = "interview_meta"
+SUMMARY_KEY = "interview_summary"
+RECENT_KEY = "interview_recent"
+TURNS_KEY = "interview_turns"
+CONTEXT_KEY = "interview_context"
+
+# Written by the interviewer agent (output_key) after every turn
+LAST_QUESTION_KEY = "interview_transcript_segment"
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 characters per token for English text)."""
+    return len(text) // 4 + 1
+
+
+def _clip(text: str, limit: int) -> str:
+    text = " ".join((text or "").split())
+    return text if len(text) <= limit else text[:limit - 3].rstrip() + "..."
+
+
+class InterviewCompactor:
+    """Keeps the mock interview context flat as the interview grows.
+
+    The last `keep_turns` question/answer exchanges are kept verbatim; older
+    exchanges are folded into a rolling structured summary (clipped question
+    and answer per exchange). The rendered context is stored in session state
+    as `interview_context`, which the interviewer and evaluator prompts read
+    instead of replaying the whole event history. If the context still
+    exceeds `max_context_tokens`, summary detail is reduced step by step and
+    the oldest summary entries are dropped.
+    """
+
+    # (question chars, answer chars) per summary entry, from richest to leanest
+    _SUMMARY_DETAIL = [(200, 300), (120, 120), (80, 0)]
+
+    def __init__(self, keep_turns: int = 4, max_context_tokens: int = 1500):
+        self.keep_turns = keep_turns
+        self.max_context_tokens = max_context_tokens
+
+    def start(self, role: str, company: str, topics: List[str]) -> Dict:
+        """State delta for a brand new interview."""
+        meta = {"role": role, "company": company, "topics": topics}
+        return {
+            META_KEY: meta,
+            SUMMARY_KEY: [],
+            RECENT_KEY: [],
+            TURNS_KEY: 0,
+            CONTEXT_KEY: self.render(meta, [], [], 0)
+        }
+
+    def advance(self, state: Dict, user_response: str) -> Dict:
+        """State delta for the turn in which the candidate sends `user_response`."""
+        meta = state.get(META_KEY) or {}
+        summary = list(state.get(SUMMARY_KEY) or [])
+        recent = list(state.get(RECENT_KEY) or [])
+        turns = int(state.get(TURNS_KEY) or 0) + 1
+
+        recent.append({
+            "n": turns,
+            "question": state.get(LAST_QUESTION_KEY) or "",
+            "answer": user_response
+        })
+        while len(recent) > self.keep_turns:
+            oldest = recent.pop(0)
+            q_chars, a_chars = self._SUMMARY_DETAIL[0]
+            summary.append({
+                "n": oldest["n"],
+                "question": _clip(oldest["question"], q_chars),
+                "answer": _clip(oldest["answer"], a_chars)
+            })
+
+        return {
+            SUMMARY_KEY: summary,
+            RECENT_KEY: recent,
+            TURNS_KEY: turns,
+            CONTEXT_KEY: self.render(meta, summary, recent, turns)
+        }
+
+    def render(self, meta: Dict, summary: List[Dict], recent: List[Dict], turns: int) -> str:
+        """Render the context, shrinking the summary until it fits the token ceiling."""
+        for q_chars, a_chars in self._SUMMARY_DETAIL:
+            text = self._render(meta, summary, recent, turns, q_chars, a_chars, omitted=0)
+            if estimate_tokens(text) <= self.max_context_tokens:
+                return text
+
+        # Still too long: drop the oldest summary entries
+        q_chars, a_chars = self._SUMMARY_DETAIL[-1]
+        kept = list(summary)
+        while kept:
+            kept.pop(0)
+            text = self._render(meta, kept, recent, turns, q_chars, a_chars, omitted=len(summary) - len(kept))
+            if estimate_tokens(text) <= self.max_context_tokens:
+                return text
+
+        # Last resort: clip the verbatim turns as well
+        budget = max(200, self.max_context_tokens * 4 // max(1, 2 * len(recent) + 2))
+        clipped = [
+            {"n": t["n"], "question": _clip(t["question"], budget), "answer": _clip(t["answer"], budget)}
+            for t in recent
+        ]
+        return self._render(meta, [], clipped, turns, q_chars, a_chars, omitted=len(summary))
+
+    @staticmethod
+    def _render(meta, summary, recent, turns, q_chars, a_chars, omitted) -> str:
+        lines = [
+            f"Role: {meta.get('role', '')} | Company: {meta.get('company', '')}",
+            f"Topics: {', '.join(meta.get('topics') or [])}",
+            f"Questions answered so far: {turns}",
+        ]
+        if summary or omitted:
+            lines.append("")
+            lines.append("Earlier exchanges (summarized):")
+            if omitted:
+                lines.append(f"- ({omitted} earliest exchanges omitted)")
+            for entry in summary:
+                line = f"- Q{entry['n']}: {_clip(entry['question'], q_chars)}"
+                if a_chars:
+                    line += f" | A: {_clip(entry['answer'], a_chars)}"
+                lines.append(line)
+        if recent:
+            lines.append("")
+            lines.append("Recent exchanges (verbatim):")
+            for entry in recent:
+                lines.append(f"Q{entry['n']} (Interviewer): {entry['question']}")
+                lines.append(f"A{entry['n']} (Candidate): {entry['answer']}")
+        return "\n".join(lines)
@@ -0,0 +1,109 @@
+"""
+Interview Research Store
+Company/role interview research (the search and processing steps of the
+interview workflow) kept across users, so requests for popular targets only
+run the final personalization step.
+"""
+import os
+import time
+import sqlite3
+import threading
+from typing import Dict, List, Optional
+
+from .response_cache import normalize_text
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS interview_research (
+    key            TEXT PRIMARY KEY,
+    company        TEXT NOT NULL,
+    role           TEXT NOT NULL,
+    raw_research   TEXT NOT NULL,
+    interview_plan TEXT NOT NULL,
+    researched_at  REAL NOT NULL,
+    fresh_until    REAL NOT NULL,
+    hits           INTEGER NOT NULL DEFAULT 0,
+    last_used_at   REAL
+);
+CREATE INDEX IF NOT EXISTS idx_interview_research_hits ON interview_research (hits);
+"""
+
+
+def research_key(company: str, role: str) -> str:
+    return f"{normalize_text(company)}\x1f{normalize_text(role)}"
+
+
+class InterviewResearchStore:
+    """SQLite table of research per normalized (company, role) (one connection
+    per thread, WAL), used via asyncio.to_thread. Entries are fresh for
+    `ttl_seconds` after they were researched."""
+
+    def __init__(self, path: str, ttl_seconds: float = 604800):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._local = threading.local()
+        self._initialized = False
+        self._init_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5.0)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        if not self._initialized:
+            with self._init_lock:
+                if not self._initialized:
+                    conn.executescript(_SCHEMA)
+                    self._initialized = True
+        return conn
+
+    def get_fresh(self, company: str, role: str, count_hit: bool = True) -> Optional[Dict]:
+        """Return fresh research for the pair, or None. Lookups count as hits unless `count_hit` is False."""
+        now = time.time()
+        key = research_key(company, role)
+        conn = self._connect()
+        row = conn.execute(
+            "SELECT * FROM interview_research WHERE key = ? AND fresh_until > ?", (key, now)
+        ).fetchone()
+        if row is None or not count_hit:
+            return dict(row) if row is not None else None
+        with conn:
+            conn.execute(
+                "UPDATE interview_research SET hits = hits + 1, last_used_at = ? WHERE key = ?", (now, key)
+            )
+        return dict(row)
+
+    def put(self, company: str, role: str, raw_research: str, interview_plan: str):
+        now = time.time()
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "INSERT INTO interview_research "
+                "(key, company, role, raw_research, interview_plan, researched_at, fresh_until) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET raw_research = excluded.raw_research, "
+                "interview_plan = excluded.interview_plan, researched_at = excluded.researched_at, "
+                "fresh_until = excluded.fresh_until",
+                (research_key(company, role), company, role, raw_research, interview_plan,
+                 now, now + self.ttl_seconds)
+            )
+
+    def top(self, limit: int) -> List[Dict]:
+        """Most requested targets, for pre-warming."""
+        rows = self._connect().execute(
+            "SELECT company, role, hits, researched_at, fresh_until FROM interview_research "
+            "ORDER BY hits DESC LIMIT ?", (limit,)
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def stats(self) -> Dict:
+        row = self._connect().execute(
+            "SELECT COUNT(*) AS entries, COALESCE(SUM(fresh_until > ?), 0) AS fresh, "
+            "COALESCE(SUM(hits), 0) AS hits FROM interview_research", (time.time(),)
+        ).fetchone()
+        return {**dict(row), "ttl_seconds": self.ttl_seconds, "top": self.top(10)}
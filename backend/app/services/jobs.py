@@ -0,0 +1,329 @@
+"""
+Background Jobs
+Asynchronous job submission for long-running workflows: a bounded queue, a
+fixed pool of worker tasks and a SQLite table holding status and results.
+"""
+import os
+import json
+import math
+import time
+import uuid
+import asyncio
+import logging
+import sqlite3
+import threading
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from . import metrics
+from .admission import AdmissionRejected
+
+logger = logging.getLogger(__name__)
+
+QUEUED, RUNNING, SUCCEEDED, FAILED = "queued", "running", "succeeded", "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id          TEXT PRIMARY KEY,
+    kind        TEXT NOT NULL,
+    user_id     TEXT,
+    status      TEXT NOT NULL,
+    request     TEXT NOT NULL,
+    result      TEXT,
+    error       TEXT,
+    created_at  REAL NOT NULL,
+    started_at  REAL,
+    finished_at REAL,
+    expires_at  REAL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_expires ON jobs (expires_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status);
+"""
+
+jobs_queued = metrics.registry.gauge("synergy_jobs_queued", "Jobs waiting for a worker", ("kind",))
+jobs_running = metrics.registry.gauge("synergy_jobs_running", "Jobs currently executing", ("kind",))
+jobs_finished = metrics.registry.counter("synergy_jobs_finished_total", "Finished jobs by outcome", ("kind", "status"))
+jobs_rejected = metrics.registry.counter("synergy_jobs_rejected_total", "Submissions refused because the queue was full", ("kind",))
+jobs_queue_wait = metrics.registry.histogram(
+    "synergy_job_queue_wait_seconds", "Time from submission until a worker picked the job up", ("kind",))
+jobs_duration = metrics.registry.histogram("synergy_job_duration_seconds", "Job execution time", ("kind",))
+jobs_admission_backoffs = metrics.registry.counter(
+    "synergy_job_admission_backoffs_total", "Times a job was shed by the admission scheduler and retried", ("kind",))
+
+
+class JobQueueFull(Exception):
+    """Raised when the job queue is at capacity (maps to HTTP 429)."""
+
+    def __init__(self, retry_after: int):
+        super().__init__("Job queue is full, try again later")
+        self.retry_after = retry_after
+
+
+class JobStore:
+    """SQLite table of jobs (one connection per thread, WAL), used via asyncio.to_thread."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        self._initialized = False
+        self._init_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5.0)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        if not self._initialized:
+            with self._init_lock:
+                if not self._initialized:
+                    conn.executescript(_SCHEMA)
+                    self._initialized = True
+        return conn
+
+    def insert(self, job: Dict):
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "INSERT INTO jobs (id, kind, user_id, status, request, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (job["id"], job["kind"], job["user_id"], QUEUED, json.dumps(job["request"]), job["created_at"])
+            )
+
+    def update(self, job_id: str, **fields):
+        columns = ", ".join(f"{name} = ?" for name in fields)
+        values = [json.dumps(v) if name == "result" else v for name, v in fields.items()]
+        conn = self._connect()
+        with conn:
+            conn.execute(f"UPDATE jobs SET {columns} WHERE id = ?", (*values, job_id))
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        row = self._connect().execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        job["request"] = json.loads(job["request"])
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        return job
+
+    def fail_unfinished(self, error: str) -> int:
+        """Mark jobs left queued/running by a previous process as failed."""
+        now = time.time()
+        conn = self._connect()
+        with conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, finished_at = ? WHERE status IN (?, ?)",
+                (FAILED, error, now, QUEUED, RUNNING)
+            )
+        return cursor.rowcount
+
+    def purge_expired(self) -> int:
+        conn = self._connect()
+        with conn:
+            cursor = conn.execute("DELETE FROM jobs WHERE expires_at IS NOT NULL AND expires_at < ?", (time.time(),))
+        return cursor.rowcount
+
+
+class JobManager:
+    """Runs submitted workflows on a fixed pool of worker tasks.
+
+    `submit()` persists the job and returns its id at once; `max_workers`
+    workers take jobs off a queue bounded by `max_queue`. Status, result
+    and error are written to the JobStore on every transition, and finished
+    jobs are kept for `ttl_seconds`. `wait()` implements long-polling with
+    an in-memory event per unfinished job.
+
+    With an `admission` scheduler, each job holds an `endpoint_class` slot
+    for its user while it runs, so jobs share the global LLM concurrency
+    bound and per-user fairness with API requests. A job that is shed stays
+    queued and is retried after the scheduler's Retry-After; if it has not
+    been admitted within `admission_timeout` seconds it fails.
+    """
+
+    def __init__(self, store: JobStore, max_workers: int = 4, max_queue: int = 100, ttl_seconds: int = 3600,
+                 admission=None, endpoint_class: str = "batch", admission_timeout: float = 300):
+        self.store = store
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.ttl_seconds = ttl_seconds
+        self.admission = admission
+        self.endpoint_class = endpoint_class
+        self.admission_timeout = admission_timeout
+
+        self._handlers: Dict[str, Callable[[Dict], Awaitable[Any]]] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._janitor: Optional[asyncio.Task] = None
+        self._done_events: Dict[str, asyncio.Event] = {}
+
+        self.running = 0
+        self.succeeded = 0
+        self.failed = 0
+        self._avg_duration = 30.0
+
+    def register(self, kind: str, handler: Callable[[Dict], Awaitable[Any]]):
+        """Register the coroutine function that executes jobs of `kind` (it gets the request dict)."""
+        self._handlers[kind] = handler
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    async def start(self):
+        """Start the workers (call from the running event loop)."""
+        if self._workers:
+            return
+        interrupted = await asyncio.to_thread(self.store.fail_unfinished, "Interrupted by a server restart")
+        if interrupted:
+            logger.warning("Marked %d unfinished jobs from a previous run as failed", interrupted)
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._workers = [asyncio.create_task(self._work(), name=f"job-worker-{i}") for i in range(self.max_workers)]
+        self._janitor = asyncio.create_task(self._purge_periodically(), name="job-janitor")
+
+    async def stop(self):
+        for task in [*self._workers, self._janitor]:
+            if task is not None:
+                task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    # ------------------------------------------------------------------
+    # API
+    # ------------------------------------------------------------------
+    async def submit(self, kind: str, user_id: str, request: Dict) -> Dict:
+        if kind not in self._handlers:
+            raise ValueError(f"Unknown job kind '{kind}'")
+        if self._queue is None:
+            raise RuntimeError("Job workers are not running")
+        if self._queue.full():
+            jobs_rejected.inc(kind)
+            raise JobQueueFull(self._retry_after())
+
+        job = {
+            "id": f"job_{uuid.uuid4().hex}",
+            "kind": kind,
+            "user_id": user_id,
+            "request": request,
+            "created_at": time.time()
+        }
+        await asyncio.to_thread(self.store.insert, job)
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            # Another submission took the last slot while this one was being stored
+            await asyncio.to_thread(
+                self.store.update, job["id"], status=FAILED, error="Job queue is full",
+                finished_at=time.time(), expires_at=time.time() + self.ttl_seconds
+            )
+            jobs_rejected.inc(kind)
+            raise JobQueueFull(self._retry_after())
+        self._done_events[job["id"]] = asyncio.Event()
+        jobs_queued.inc(kind)
+        return {"job_id": job["id"], "status": QUEUED, "queue_position": self._queue.qsize()}
+
+    async def get(self, job_id: str) -> Optional[Dict]:
+        return await asyncio.to_thread(self.store.get, job_id)
+
+    async def wait(self, job_id: str, timeout: float) -> Optional[Dict]:
+        """Return the job once it has finished or `timeout` seconds have passed."""
+        done = self._done_events.get(job_id)
+        if done is not None and timeout > 0:
+            try:
+                await asyncio.wait_for(done.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        return await self.get(job_id)
+
+    def stats(self) -> Dict:
+        return {
+            "workers": self.max_workers,
+            "running": self.running,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "max_queue": self.max_queue,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "avg_duration_seconds": round(self._avg_duration, 2),
+            "ttl_seconds": self.ttl_seconds
+        }
+
+    # ------------------------------------------------------------------
+    # Workers
+    # ------------------------------------------------------------------
+    def _retry_after(self) -> int:
+        return max(1, math.ceil(self._avg_duration * (self.max_queue / self.max_workers)))
+
+    async def _work(self):
+        while True:
+            job = await self._queue.get()
+            await self._execute(job)
+
+    async def _execute(self, job: Dict):
+        kind, job_id = job["kind"], job["id"]
+        admitted = admission_error = None
+        if self.admission is not None:
+            try:
+                admitted = await self.admission.acquire_with_backoff(
+                    self.endpoint_class, job["user_id"], self.admission_timeout,
+                    on_backoff=lambda _: jobs_admission_backoffs.inc(kind)
+                )
+            except AdmissionRejected as e:
+                admission_error = f"Not admitted within {self.admission_timeout:g}s: {e.reason}"
+        started = time.time()
+        jobs_queued.dec(kind)
+        jobs_running.inc(kind)
+        jobs_queue_wait.observe(started - job["created_at"], kind)
+        self.running += 1
+
+        status, result, error = FAILED, None, None
+        try:
+            if admission_error is not None:
+                error = admission_error
+            else:
+                await asyncio.to_thread(self.store.update, job_id, status=RUNNING, started_at=started)
+                result = await self._handlers[kind](job["request"])
+                if isinstance(result, dict) and result.get("success") is False:
+                    error = result.get("error", "Unknown error")
+                else:
+                    status = SUCCEEDED
+        except asyncio.CancelledError:
+            error = "Cancelled by server shutdown"
+            raise
+        except Exception as e:
+            logger.exception("Job %s (%s) failed", job_id, kind)
+            error = str(e)
+        finally:
+            if admitted is not None:
+                self.admission.release(self.endpoint_class, admitted)
+            finished = time.time()
+            self.running -= 1
+            jobs_running.dec(kind)
+            jobs_finished.inc(kind, status)
+            jobs_duration.observe(finished - started, kind)
+            self._avg_duration = 0.8 * self._avg_duration + 0.2 * (finished - started)
+            if status == SUCCEEDED:
+                self.succeeded += 1
+            else:
+                self.failed += 1
+            try:
+                await asyncio.to_thread(
+                    self.store.update, job_id,
+                    status=status, result=result, error=error,
+                    finished_at=finished, expires_at=finished + self.ttl_seconds
+                )
+            finally:
+                done = self._done_events.pop(job_id, None)
+                if done is not None:
+                    done.set()
+
+    async def _purge_periodically(self):
+        interval = max(1, min(self.ttl_seconds, 300))
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                purged = await asyncio.to_thread(self.store.purge_expired)
+                if purged:
+                    logger.info("Purged %d expired jobs", purged)
+            except Exception as e:
+                logger.error("Failed to purge expired jobs: %s", e)
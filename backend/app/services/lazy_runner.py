@@ -0,0 +1,39 @@
+"""
+Lazy Runner
+Handle to the SynergyAIRunner that builds it on first use.
+
+Building the runner imports Google ADK and google-genai, which takes
+seconds; keeping it off the import path lets a worker import the app and
+bind right away, while main.py builds the runner in a background thread at
+startup.
+"""
+import threading
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from .adk_runner import SynergyAIRunner
+
+
+class LazyRunner:
+    """Forwards attribute access to the SynergyAIRunner, built once (thread-safe)."""
+
+    def __init__(self):
+        self._runner: Optional["SynergyAIRunner"] = None
+        self._lock = threading.Lock()
+
+    @property
+    def built(self) -> bool:
+        return self._runner is not None
+
+    def get(self) -> "SynergyAIRunner":
+        runner = self._runner
+        if runner is None:
+            with self._lock:
+                if self._runner is None:
+                    from .adk_runner import SynergyAIRunner
+                    self._runner = SynergyAIRunner()
+                runner = self._runner
+        return runner
+
+    def __getattr__(self, name: str):
+        return getattr(self.get(), name)
@@ -0,0 +1,218 @@
+"""
+Metrics
+Minimal Prometheus-style counters, gauges and histograms for routes,
+workflows, sub-agents and session-DB operations. Free of ADK imports so
+the API layer can load without the agent stack; the ADK plugin feeding
+the agent metrics is in metrics_plugin.py.
+"""
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from ..core.config import settings
+
+# Seconds. Workflows make several LLM calls, so the upper buckets go to minutes.
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0)
+DB_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Tuple, extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _fmt(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+
+
+class Counter(_Metric):
+    type_name = "counter"
+
+    def __init__(self, name, documentation, labelnames=()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple, float] = {}
+
+    def inc(self, *labels, amount: float = 1):
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = self.header()
+        for labels, value in list(self._values.items()):
+            lines.append(f"{self.name}{_labels(self.labelnames, labels)} {_fmt(value)}")
+        return lines
+
+
+class Gauge(Counter):
+    type_name = "gauge"
+
+    def dec(self, *labels, amount: float = 1):
+        self.inc(*labels, amount=-amount)
+
+
+class CallbackGauge(_Metric):
+    """Gauge whose (unlabelled) value is read at scrape time."""
+    type_name = "gauge"
+
+    def __init__(self, name, documentation, read: Callable[[], Optional[float]]):
+        super().__init__(name, documentation)
+        self.read = read
+
+    def render(self) -> List[str]:
+        try:
+            value = self.read()
+        except Exception:
+            value = None
+        if value is None:
+            return []
+        return self.header() + [f"{self.name} {_fmt(value)}"]
+
+
+class Histogram(_Metric):
+    type_name = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labels -> [per-bucket counts..., +Inf count, sum]
+        self._series: Dict[Tuple, List[float]] = {}
+
+    def observe(self, value: float, *labels):
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series.setdefault(labels, [0] * (len(self.buckets) + 1) + [0.0])
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def render(self) -> List[str]:
+        lines = self.header()
+        for labels, series in list(self._series.items()):
+            series = list(series)
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series[:-1]):
+                cumulative += count
+                le = _labels(self.labelnames, labels, f'le="{_fmt(bound)}"')
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            label_str = _labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_str} {_fmt(series[-1])}")
+            lines.append(f"{self.name}_count{label_str} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Holds metrics and renders them in the Prometheus text format.
+
+    Updates are plain dict/list operations with no locks: every update runs
+    on the event loop thread (middleware, runner and ADK plugin callbacks),
+    so they never interleave. A scrape copies each series before rendering.
+    """
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._metrics: List[_Metric] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def counter(self, name, documentation, labelnames=()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name, documentation, labelnames=()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def callback_gauge(self, name, documentation, read) -> CallbackGauge:
+        return self.register(CallbackGauge(name, documentation, read))
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry(enabled=settings.METRICS_ENABLED)
+
+# HTTP
+http_requests = registry.counter(
+    "synergy_http_requests_total", "HTTP requests by route, method and status", ("route", "method", "status"))
+http_in_progress = registry.gauge(
+    "synergy_http_requests_in_progress", "HTTP requests currently being served", ("route", "method"))
+http_duration = registry.histogram(
+    "synergy_http_request_duration_seconds", "HTTP request latency (until the response body is sent)",
+    ("route", "method"))
+
+# Workflows (one Runner.run_async per sample)
+workflow_runs = registry.counter(
+    "synergy_workflow_runs_total", "Agent/workflow runs by outcome", ("workflow", "status"))
+workflow_in_progress = registry.gauge(
+    "synergy_workflow_runs_in_progress", "Agent/workflow runs currently executing", ("workflow",))
+workflow_duration = registry.histogram(
+    "synergy_workflow_duration_seconds", "Agent/workflow run latency", ("workflow",))
+
+# Sub-agents inside a workflow
+agent_duration = registry.histogram(
+    "synergy_agent_duration_seconds", "Sub-agent latency inside a workflow", ("workflow", "agent"))
+llm_call_duration = registry.histogram(
+    "synergy_llm_call_duration_seconds", "Model call latency per agent and the model that served it",
+    ("workflow", "agent", "model"))
+
+# Session database
+session_db_ops = registry.counter(
+    "synergy_session_db_operations_total", "Session service calls by operation and outcome", ("operation", "status"))
+session_db_duration = registry.histogram(
+    "synergy_session_db_operation_duration_seconds", "Session service call latency", ("operation",),
+    buckets=DB_BUCKETS)
+
+
+_SESSION_OPS = ("create_session", "get_session", "list_sessions", "delete_session", "append_event")
+
+
+def instrument_session_service(service):
+    """Wrap the session service's public coroutines with timing metrics."""
+    if not registry.enabled:
+        return service
+    for operation in _SESSION_OPS:
+        method = getattr(service, operation, None)
+        if method is not None:
+            setattr(service, operation, _timed(operation, method))
+    return service
+
+
+def _timed(operation: str, method):
+    async def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        status = "error"
+        try:
+            result = await method(*args, **kwargs)
+            status = "ok"
+            return result
+        finally:
+            session_db_duration.observe(time.perf_counter() - started, operation)
+            session_db_ops.inc(operation, status)
+    wrapper.__wrapped__ = method
+    return wrapper
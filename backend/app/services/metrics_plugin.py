@@ -0,0 +1,61 @@
+"""
+Metrics Plugin
+ADK plugin feeding the agent and model-call metrics in metrics.py.
+"""
+import time
+from collections import OrderedDict
+from typing import Tuple
+
+from google.adk.agents import BaseAgent
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.plugins.base_plugin import BasePlugin
+
+from .metrics import registry, agent_duration, llm_call_duration
+
+
+class MetricsPlugin(BasePlugin):
+    """ADK plugin timing every agent (root and sub-agents) of a run, and
+    every model call by the model that served it.
+
+    Start times are kept per (invocation, agent) in a bounded map so runs
+    that fail before `after_agent_callback` cannot grow it without limit.
+    """
+
+    MAX_PENDING = 10000
+
+    def __init__(self):
+        super().__init__(name="synergy_metrics")
+        self._started: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
+
+    async def before_agent_callback(self, *, agent: BaseAgent, callback_context: CallbackContext):
+        if not registry.enabled:
+            return None
+        self._started[(callback_context.invocation_id, agent.name)] = time.perf_counter()
+        if len(self._started) > self.MAX_PENDING:
+            self._started.popitem(last=False)
+        return None
+
+    async def after_agent_callback(self, *, agent: BaseAgent, callback_context: CallbackContext):
+        started = self._started.pop((callback_context.invocation_id, agent.name), None)
+        if started is not None:
+            agent_duration.observe(time.perf_counter() - started, agent.root_agent.name, agent.name)
+        return None
+
+    async def before_model_callback(self, *, callback_context: CallbackContext, llm_request):
+        if not registry.enabled:
+            return None
+        self._started[(callback_context.invocation_id, "llm:" + callback_context.agent_name)] = time.perf_counter()
+        if len(self._started) > self.MAX_PENDING:
+            self._started.popitem(last=False)
+        return None
+
+    async def after_model_callback(self, *, callback_context: CallbackContext, llm_response):
+        if llm_response.partial:
+            return None
+        started = self._started.pop((callback_context.invocation_id, "llm:" + callback_context.agent_name), None)
+        if started is not None:
+            agent = callback_context._invocation_context.agent
+            llm_call_duration.observe(
+                time.perf_counter() - started, agent.root_agent.name, agent.name, agent.canonical_model.model
+            )
+        return None
@@ -0,0 +1,249 @@
+"""
+Response Cache
+Two-tier cache for workflow responses: a normalized exact-key tier and a
+near-duplicate tier based on MinHash signatures over character shingles.
+"""
+import re
+import time
+import hashlib
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# Large Mersenne prime used for the MinHash permutations
+_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 64) - 1
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace."""
+    text = re.sub(r"[^\w\s]", " ", (text or "").lower())
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def request_key(workflow: str, text: str, scope: Tuple = ()) -> str:
+    """Stable key for a workflow request after normalization."""
+    parts = [normalize_text(str(part)) for part in scope]
+    raw = "\x1f".join((workflow, *parts, normalize_text(text)))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _hash64(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class MinHasher:
+    """Computes MinHash signatures over character shingles."""
+
+    def __init__(self, num_perm: int = 64, shingle_size: int = 4, seed: int = 7):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        # Deterministic (a, b) pairs so signatures are stable across restarts
+        self._perms = [
+            (_hash64(f"a{seed}:{i}") % (_PRIME - 1) + 1, _hash64(f"b{seed}:{i}") % _PRIME)
+            for i in range(num_perm)
+        ]
+
+    def shingles(self, text: str) -> Set[str]:
+        k = self.shingle_size
+        if len(text) <= k:
+            return {text}
+        return {text[i:i + k] for i in range(len(text) - k + 1)}
+
+    def signature(self, text: str) -> Tuple[int, ...]:
+        hashes = [_hash64(s) for s in self.shingles(text)]
+        return tuple(
+            min(((a * h + b) % _PRIME) & _MAX_HASH for h in hashes)
+            for a, b in self._perms
+        )
+
+    @staticmethod
+    def similarity(sig_a: Tuple[int, ...], sig_b: Tuple[int, ...]) -> float:
+        """Estimated Jaccard similarity of two signatures."""
+        matches = sum(1 for a, b in zip(sig_a, sig_b) if a == b)
+        return matches / len(sig_a)
+
+
+@dataclass
+class _Entry:
+    workflow: str
+    scope: Tuple[str, ...]
+    value: str
+    signature: Tuple[int, ...]
+    expires_at: float
+
+
+@dataclass
+class CacheStats:
+    exact_hits: int = 0
+    near_hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    def as_dict(self) -> Dict:
+        lookups = self.exact_hits + self.near_hits + self.misses
+        return {
+            "exact_hits": self.exact_hits,
+            "near_hits": self.near_hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": round((self.exact_hits + self.near_hits) / lookups, 4) if lookups else 0.0
+        }
+
+
+class ResponseCache:
+    """Size-bounded LRU cache with TTL and a near-duplicate lookup tier.
+
+    Entries are partitioned by workflow and by a `scope` tuple of fields that
+    must match exactly (e.g. quiz difficulty); only the free-text part of the
+    request is compared fuzzily. Near-duplicate candidates come from an LSH
+    index over signature bands, so lookups do not scan the whole cache.
+
+    All methods are synchronous and never await, so the cache is safe to share
+    between coroutines on the event loop.
+    """
+
+    def __init__(
+        self,
+        workflows: Iterable[str],
+        max_entries: int = 1000,
+        ttl_seconds: float = 3600,
+        similarity_threshold: float = 0.85,
+        num_perm: int = 64,
+        bands: int = 16
+    ):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.workflows = {w.strip() for w in workflows if w.strip()}
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.similarity_threshold = similarity_threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.hasher = MinHasher(num_perm=num_perm)
+
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._buckets: Dict[Tuple, Set[str]] = defaultdict(set)
+        self._stats: Dict[str, CacheStats] = defaultdict(CacheStats)
+
+    def enabled(self, workflow: str) -> bool:
+        return workflow in self.workflows
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def get(self, workflow: str, text: str, scope: Tuple = ()) -> Tuple[Optional[str], Optional[str]]:
+        """Look up a response. Returns (value, tier) where tier is 'exact' or 'near'."""
+        if not self.enabled(workflow):
+            return None, None
+        stats = self._stats[workflow]
+        key = request_key(workflow, text, scope)
+        scope = self._normalize_scope(scope)
+        normalized = normalize_text(text)
+
+        entry = self._live_entry(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            stats.exact_hits += 1
+            return entry.value, "exact"
+
+        signature = self.hasher.signature(normalized)
+        best_key, best_score = None, 0.0
+        for candidate in self._candidates(workflow, scope, signature):
+            entry = self._live_entry(candidate)
+            if entry is None:
+                continue
+            score = MinHasher.similarity(signature, entry.signature)
+            if score > best_score:
+                best_key, best_score = candidate, score
+
+        if best_key is not None and best_score >= self.similarity_threshold:
+            self._entries.move_to_end(best_key)
+            stats.near_hits += 1
+            return self._entries[best_key].value, "near"
+
+        stats.misses += 1
+        return None, None
+
+    def set(self, workflow: str, text: str, value: str, scope: Tuple = ()):
+        """Store a response for a workflow request."""
+        if not self.enabled(workflow) or not value:
+            return
+        key = request_key(workflow, text, scope)
+        scope = self._normalize_scope(scope)
+        normalized = normalize_text(text)
+
+        if key in self._entries:
+            self._remove(key)
+        entry = _Entry(
+            workflow=workflow,
+            scope=scope,
+            value=value,
+            signature=self.hasher.signature(normalized),
+            expires_at=time.monotonic() + self.ttl_seconds
+        )
+        self._entries[key] = entry
+        for bucket in self._bands(workflow, scope, entry.signature):
+            self._buckets[bucket].add(key)
+        self._stats[workflow].stores += 1
+
+        while len(self._entries) > self.max_entries:
+            oldest = next(iter(self._entries))
+            self._stats[self._entries[oldest].workflow].evictions += 1
+            self._remove(oldest)
+
+    def stats(self) -> Dict:
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "workflows": {w: self._stats[w].as_dict() for w in sorted(self.workflows)}
+        }
+
+    def clear(self):
+        self._entries.clear()
+        self._buckets.clear()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _normalize_scope(scope: Tuple) -> Tuple[str, ...]:
+        return tuple(normalize_text(str(part)) for part in scope)
+
+    def _bands(self, workflow: str, scope: Tuple[str, ...], signature: Tuple[int, ...]) -> List[Tuple]:
+        return [
+            (workflow, scope, band, signature[band * self.rows:(band + 1) * self.rows])
+            for band in range(self.bands)
+        ]
+
+    def _candidates(self, workflow: str, scope: Tuple[str, ...], signature: Tuple[int, ...]) -> Set[str]:
+        candidates: Set[str] = set()
+        for bucket in self._bands(workflow, scope, signature):
+            candidates |= self._buckets.get(bucket, set())
+        return candidates
+
+    def _live_entry(self, key: str) -> Optional[_Entry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._stats[entry.workflow].expirations += 1
+            self._remove(key)
+            return None
+        return entry
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for bucket in self._bands(entry.workflow, entry.scope, entry.signature):
+            keys = self._buckets.get(bucket)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._buckets[bucket]
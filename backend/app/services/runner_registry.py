@@ -0,0 +1,76 @@
+"""
+Runner Registry
+Builds one Google ADK Runner per agent/workflow and shares it across requests.
+"""
+from typing import Callable, Dict, List, Optional, Union
+
+from google.adk.agents import BaseAgent
+from google.adk.runners import Runner
+from google.adk.plugins.base_plugin import BasePlugin
+from google.adk.plugins.logging_plugin import LoggingPlugin
+
+
+class RunnerRegistry:
+    """Keyed registry of ADK Runners, built once and reused.
+
+    A Runner only holds references to the root agent, the shared services and
+    a plugin manager; all per-call state lives in the InvocationContext that
+    `run_async` creates. A single Runner can therefore serve any number of
+    concurrent requests on the event loop.
+
+    An agent can be registered as a zero-argument factory instead; it is
+    called (once) when the key is first used, so agents that are never
+    requested are never built.
+    """
+
+    def __init__(self, app_name: str, session_service, memory_service,
+                 plugins: Optional[List[BasePlugin]] = None):
+        self.app_name = app_name
+        self.session_service = session_service
+        self.memory_service = memory_service
+
+        # Plugins are shared by every runner (the logging plugin is stateless)
+        self._plugins = [LoggingPlugin(), *(plugins or [])]
+        self._agents: Dict[str, Union[BaseAgent, Callable[[], BaseAgent]]] = {}
+        self._runners: Dict[str, Runner] = {}
+
+    def register(self, key: str, agent: Union[BaseAgent, Callable[[], BaseAgent]]):
+        """Register an agent/workflow (or a factory for it) under a key (e.g. 'daily_workflow')."""
+        self._agents[key] = agent
+        # Drop a stale runner if the agent was re-registered
+        self._runners.pop(key, None)
+
+    def agent(self, key: str) -> BaseAgent:
+        """The agent registered under a key, building it from its factory on first use."""
+        if key not in self._agents:
+            raise KeyError(f"No agent registered under '{key}'")
+        agent = self._agents[key]
+        if not isinstance(agent, BaseAgent):
+            agent = self._agents[key] = agent()
+        return agent
+
+    def get(self, key: str) -> Runner:
+        """Return the shared Runner for a key, building it on first use.
+
+        There is no await between the lookup and the insert, so concurrent
+        coroutines on the event loop can never build the same runner twice.
+        """
+        runner = self._runners.get(key)
+        if runner is None:
+            runner = Runner(
+                agent=self.agent(key),
+                app_name=self.app_name,
+                session_service=self.session_service,
+                memory_service=self.memory_service,
+                plugins=self._plugins
+            )
+            self._runners[key] = runner
+        return runner
+
+    def warm_up(self):
+        """Build every registered runner up front (e.g. at startup)."""
+        for key in self._agents:
+            self.get(key)
+
+    def keys(self):
+        return list(self._agents.keys())
@@ -0,0 +1,317 @@
+"""
+Search Cache
+Persistent cache in front of the google_search agents.
+
+google_search is a Gemini built-in: the search runs server-side inside the
+model call, so the cacheable unit is the search agent's grounded response.
+An ADK plugin looks each search agent's request up by (agent, instruction,
+normalized query) before the model is called; a hit skips the call (and
+the search round trip) entirely.
+"""
+import os
+import json
+import time
+import asyncio
+import hashlib
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict, defaultdict
+from datetime import datetime
+from typing import Dict, Optional, Set, Tuple
+
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.adk.plugins.base_plugin import BasePlugin
+
+from . import metrics
+from .response_cache import normalize_text
+
+logger = logging.getLogger(__name__)
+
+FRESH, STALE = "hit", "stale"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS search_cache (
+    key          TEXT PRIMARY KEY,
+    domain       TEXT NOT NULL,
+    agent        TEXT NOT NULL,
+    query        TEXT NOT NULL,
+    response     TEXT NOT NULL,
+    created_at   REAL NOT NULL,
+    fresh_until  REAL NOT NULL,
+    stale_until  REAL NOT NULL,
+    last_used_at REAL NOT NULL,
+    hits         INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_search_cache_lru ON search_cache (last_used_at);
+CREATE INDEX IF NOT EXISTS idx_search_cache_stale ON search_cache (stale_until);
+"""
+
+search_cache_requests = metrics.registry.counter(
+    "synergy_search_cache_requests_total", "Search agent lookups by outcome (hit, stale, miss)",
+    ("domain", "outcome"))
+search_cache_refreshes = metrics.registry.counter(
+    "synergy_search_cache_refreshes_total", "Background revalidations of stale search results",
+    ("domain", "status"))
+
+
+def parse_pairs(raw: str) -> Dict[str, str]:
+    """Parse "JobSearchAgent:jobs,InterviewSearchAgent:interview"."""
+    pairs = {}
+    for part in raw.split(","):
+        name, _, value = part.partition(":")
+        if name.strip() and value.strip():
+            pairs[name.strip()] = value.strip()
+    return pairs
+
+
+class SearchCacheStore:
+    """SQLite table of cached search responses (one connection per thread, WAL),
+    bounded to `max_entries` by evicting the least recently used rows."""
+
+    def __init__(self, path: str, max_entries: int = 5000):
+        self.path = path
+        self.max_entries = max_entries
+        self._local = threading.local()
+        self._initialized = False
+        self._init_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5.0)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        if not self._initialized:
+            with self._init_lock:
+                if not self._initialized:
+                    conn.executescript(_SCHEMA)
+                    self._initialized = True
+        return conn
+
+    def get(self, key: str, now: float) -> Optional[Dict]:
+        """Return the entry if it is still servable (fresh or stale) and mark it used."""
+        conn = self._connect()
+        row = conn.execute("SELECT * FROM search_cache WHERE key = ?", (key,)).fetchone()
+        if row is None or row["stale_until"] <= now:
+            return None
+        with conn:
+            conn.execute("UPDATE search_cache SET last_used_at = ?, hits = hits + 1 WHERE key = ?", (now, key))
+        return dict(row)
+
+    def put(self, key: str, domain: str, agent: str, query: str, response: str,
+            ttl_seconds: float, stale_seconds: float):
+        now = time.time()
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO search_cache "
+                "(key, domain, agent, query, response, created_at, fresh_until, stale_until, last_used_at, hits) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, COALESCE((SELECT hits FROM search_cache WHERE key = ?), 0))",
+                (key, domain, agent, query, response, now, now + ttl_seconds,
+                 now + ttl_seconds + stale_seconds, now, key)
+            )
+            conn.execute("DELETE FROM search_cache WHERE stale_until <= ?", (now,))
+            conn.execute(
+                "DELETE FROM search_cache WHERE key IN ("
+                "SELECT key FROM search_cache ORDER BY last_used_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+
+    def counts(self) -> Dict[str, int]:
+        rows = self._connect().execute("SELECT domain, COUNT(*) AS n FROM search_cache GROUP BY domain").fetchall()
+        return {row["domain"]: row["n"] for row in rows}
+
+
+class SearchCachePlugin(BasePlugin):
+    """ADK plugin that serves search agents from the SearchCacheStore.
+
+    `domains` maps search agent names to a domain, and `ttls` gives each
+    domain its freshness in seconds (job listings go stale quickly,
+    interview questions do not). For `stale_ratio` x TTL after that an
+    entry is still served, but the first request to see it starts a
+    background refresh of the same request (stale-while-revalidate).
+
+    Served responses carry `custom_metadata["search_cache"]` and no usage
+    metadata (no tokens were spent), and each one is written to the traces
+    with status "cache_hit" or "cache_stale".
+    """
+
+    MAX_PENDING = 10000
+
+    def __init__(self, store: SearchCacheStore, domains: Dict[str, str], ttls: Dict[str, float],
+                 stale_ratio: float = 1.0, trace_sink=None):
+        super().__init__(name="synergy_search_cache")
+        self.store = store
+        self.domains = domains
+        self.ttls = ttls
+        self.stale_ratio = stale_ratio
+        self.trace_sink = trace_sink
+
+        self._pending: "OrderedDict[Tuple[str, str], Tuple[str, str, str]]" = OrderedDict()
+        self._refreshing: Set[str] = set()
+        self._tasks: Set[asyncio.Task] = set()
+        self._stats: Dict[str, Dict[str, int]] = defaultdict(lambda: {"hits": 0, "stale": 0, "misses": 0})
+
+    # ------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------
+    @staticmethod
+    def query_text(llm_request: LlmRequest) -> str:
+        """The search request: the most recent user message (not relayed context)."""
+        for content in reversed(llm_request.contents or []):
+            if content.role != "user":
+                continue
+            text = " ".join(part.text for part in content.parts or [] if part.text)
+            if text and not text.startswith("For context:"):
+                return text
+        return ""
+
+    @staticmethod
+    def cache_key(agent: str, llm_request: LlmRequest, query: str) -> str:
+        config = llm_request.config
+        instruction = config.system_instruction if config is not None else None
+        raw = "\x1f".join((agent, str(instruction or ""), normalize_text(query)))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    # ------------------------------------------------------------------
+    # Callbacks
+    # ------------------------------------------------------------------
+    async def before_model_callback(self, *, callback_context: CallbackContext, llm_request: LlmRequest):
+        agent = callback_context.agent_name
+        domain = self.domains.get(agent)
+        if domain is None:
+            return None
+        query = self.query_text(llm_request)
+        if not query:
+            return None
+        key = self.cache_key(agent, llm_request, query)
+
+        now = time.time()
+        try:
+            entry = await asyncio.to_thread(self.store.get, key, now)
+        except Exception as e:
+            logger.warning("Search cache lookup failed: %s", e)
+            entry = None
+
+        if entry is None:
+            self._count(domain, "miss")
+            self._pending[(callback_context.invocation_id, agent)] = (key, domain, query)
+            if len(self._pending) > self.MAX_PENDING:
+                self._pending.popitem(last=False)
+            return None
+
+        outcome = FRESH if now < entry["fresh_until"] else STALE
+        self._count(domain, outcome)
+        if outcome == STALE:
+            self._revalidate(callback_context, llm_request, key, domain, query)
+
+        response = LlmResponse.model_validate_json(entry["response"])
+        response.usage_metadata = None
+        response.custom_metadata = {**(response.custom_metadata or {}), "search_cache": outcome}
+        self._trace(agent, domain, query, outcome, now - entry["created_at"])
+        return response
+
+    async def after_model_callback(self, *, callback_context: CallbackContext, llm_response: LlmResponse):
+        if llm_response.partial:
+            return None
+        pending = self._pending.pop((callback_context.invocation_id, callback_context.agent_name), None)
+        if pending is not None:
+            key, domain, query = pending
+            await self._store(key, domain, callback_context.agent_name, query, llm_response)
+        return None
+
+    # ------------------------------------------------------------------
+    # Storage & revalidation
+    # ------------------------------------------------------------------
+    async def _store(self, key: str, domain: str, agent: str, query: str, response: LlmResponse):
+        if response.error_code or not (response.content and response.content.parts):
+            return
+        ttl = self.ttls.get(domain, 0)
+        if ttl <= 0:
+            return
+        payload = response.model_dump_json(exclude_none=True, exclude={"usage_metadata", "custom_metadata"})
+        try:
+            await asyncio.to_thread(
+                self.store.put, key, domain, agent, query, payload, ttl, ttl * self.stale_ratio
+            )
+        except Exception as e:
+            logger.warning("Could not store search result for %s: %s", agent, e)
+
+    def _revalidate(self, callback_context: CallbackContext, llm_request: LlmRequest,
+                    key: str, domain: str, query: str):
+        """Re-run a stale request in the background (once per key at a time)."""
+        if key in self._refreshing:
+            return
+        self._refreshing.add(key)
+        agent = callback_context._invocation_context.agent
+        request = LlmRequest(
+            model=llm_request.model,
+            contents=[content.model_copy(deep=True) for content in llm_request.contents],
+            config=llm_request.config.model_copy(deep=True) if llm_request.config is not None else None
+        )
+
+        async def refresh():
+            status = "error"
+            try:
+                final = None
+                async for response in agent.canonical_model.generate_content_async(request):
+                    if not response.partial:
+                        final = response
+                if final is not None:
+                    await self._store(key, domain, agent.name, query, final)
+                    status = "ok"
+            except Exception as e:
+                logger.warning("Search cache refresh for %s failed: %s", agent.name, e)
+            finally:
+                search_cache_refreshes.inc(domain, status)
+                self._refreshing.discard(key)
+
+        task = asyncio.create_task(refresh())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+    def _count(self, domain: str, outcome: str):
+        search_cache_requests.inc(domain, outcome)
+        self._stats[domain]["hits" if outcome == FRESH else "stale" if outcome == STALE else "misses"] += 1
+
+    def _trace(self, agent: str, domain: str, query: str, outcome: str, age_seconds: float):
+        if self.trace_sink is None:
+            return
+        self.trace_sink.emit({
+            "timestamp": datetime.now().isoformat(),
+            "agent": agent,
+            "input": query[:200] + "...",
+            "output": "",
+            "status": "cache_hit" if outcome == FRESH else "cache_stale",
+            "cache": "search",
+            "domain": domain,
+            "age_seconds": round(age_seconds, 1)
+        })
+
+    def stats(self) -> Dict:
+        try:
+            sizes = self.store.counts()
+        except Exception:
+            sizes = {}
+        return {
+            "size": sum(sizes.values()),
+            "max_entries": self.store.max_entries,
+            "stale_ratio": self.stale_ratio,
+            "refreshing": len(self._refreshing),
+            "domains": {
+                domain: {"ttl_seconds": ttl, "entries": sizes.get(domain, 0), **self._stats[domain]}
+                for domain, ttl in sorted(self.ttls.items())
+            },
+            "agents": dict(sorted(self.domains.items()))
+        }
@@ -0,0 +1,97 @@
+"""
+Session Bootstrap
+Cheap get-or-create for ADK sessions backed by a bounded cache of known keys.
+"""
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+from google.adk.sessions import BaseSessionService
+from google.adk.sessions.base_session_service import GetSessionConfig
+
+# Existence probes only need the session row, not its event history
+_PROBE_CONFIG = GetSessionConfig(num_recent_events=1)
+
+
+class SessionBootstrap:
+    """Ensures a session exists without a failed INSERT per request.
+
+    Keys already seen by this process are answered from an in-memory LRU.
+    Freshly generated session ids skip the lookup and are created directly;
+    caller-supplied ids are looked up first and only created when missing.
+    Database errors are no longer swallowed - they reach the caller.
+    """
+
+    def __init__(self, session_service: BaseSessionService, app_name: str, max_keys: int = 10000):
+        self.session_service = session_service
+        self.app_name = app_name
+        self.max_keys = max_keys
+        self._known: "OrderedDict[Tuple[str, str, str], None]" = OrderedDict()
+
+        self.cache_hits = 0
+        self.db_hits = 0
+        self.creates = 0
+
+    async def ensure(self, user_id: str, session_id: str, new: bool = False):
+        """Make sure (app, user, session) exists.
+
+        Pass `new=True` when the session id was just generated and therefore
+        cannot exist yet.
+        """
+        key = (self.app_name, user_id, session_id)
+        if key in self._known:
+            self._known.move_to_end(key)
+            self.cache_hits += 1
+            return
+
+        if new:
+            await self._create(user_id, session_id)
+        else:
+            session = await self.session_service.get_session(
+                app_name=self.app_name,
+                user_id=user_id,
+                session_id=session_id,
+                config=_PROBE_CONFIG
+            )
+            if session is None:
+                await self._create(user_id, session_id)
+            else:
+                self.db_hits += 1
+        self._remember(key)
+
+    async def _create(self, user_id: str, session_id: str):
+        try:
+            await self.session_service.create_session(
+                app_name=self.app_name,
+                user_id=user_id,
+                session_id=session_id
+            )
+        except Exception:
+            # Lost a race with a concurrent request creating the same session
+            existing = await self.session_service.get_session(
+                app_name=self.app_name,
+                user_id=user_id,
+                session_id=session_id,
+                config=_PROBE_CONFIG
+            )
+            if existing is None:
+                raise
+            self.db_hits += 1
+            return
+        self.creates += 1
+
+    def _remember(self, key: Tuple[str, str, str]):
+        self._known[key] = None
+        if len(self._known) > self.max_keys:
+            self._known.popitem(last=False)
+
+    def forget(self, user_id: str, session_id: str):
+        """Drop a key, e.g. after the session was deleted."""
+        self._known.pop((self.app_name, user_id, session_id), None)
+
+    def stats(self) -> Dict:
+        return {
+            "known_sessions": len(self._known),
+            "cache_hits": self.cache_hits,
+            "db_hits": self.db_hits,
+            "creates": self.creates
+        }
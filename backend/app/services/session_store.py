@@ -0,0 +1,279 @@
+"""
+Session Store
+Tuned DatabaseSessionService for SQLite: WAL + pragmas, a bounded connection
+pool and a single serialized writer that batches event inserts.
+"""
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import event as sa_event
+from google.adk.events import Event
+from google.adk.sessions import BaseSessionService, DatabaseSessionService, Session
+
+try:
+    # ORM models used to commit a whole batch of appends in one transaction
+    from google.adk.sessions.database_session_service import (
+        StorageAppState,
+        StorageEvent,
+        StorageSession,
+        StorageUserState,
+        _extract_state_delta,
+    )
+    _BATCH_SUPPORTED = True
+except ImportError:  # pragma: no cover - depends on the installed ADK version
+    _BATCH_SUPPORTED = False
+
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class TunedSQLiteSessionService(DatabaseSessionService):
+    """DatabaseSessionService tuned for concurrent workflows on SQLite.
+
+    * Every pooled connection gets WAL, `synchronous`, `busy_timeout` and
+      `cache_size` pragmas the first time it is checked out.
+    * The connection pool is bounded (`pool_size` + `max_overflow`).
+    * All writes go through one writer task, so connections in this process
+      never compete for SQLite's write lock. Queued `append_event` calls are
+      drained in batches and, on a synchronous engine, committed in a single
+      transaction on a worker thread instead of blocking the event loop once
+      per event.
+    """
+
+    def __init__(
+        self,
+        db_url: str,
+        synchronous: str = "NORMAL",
+        busy_timeout_ms: int = 5000,
+        cache_size_kb: int = 20000,
+        pool_size: int = 5,
+        max_overflow: int = 5,
+        pool_timeout: float = 30.0,
+        write_batch_size: int = 64,
+        write_queue_size: int = 10000
+    ):
+        super().__init__(
+            db_url=db_url,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+            connect_args={"timeout": busy_timeout_ms / 1000}
+        )
+        self._pragmas = [
+            "PRAGMA journal_mode=WAL",
+            f"PRAGMA synchronous={synchronous}",
+            f"PRAGMA busy_timeout={int(busy_timeout_ms)}",
+            f"PRAGMA cache_size=-{int(cache_size_kb)}",
+            "PRAGMA temp_store=MEMORY",
+        ]
+        # Async engines expose their pool events on the wrapped sync engine
+        sync_engine = getattr(self.db_engine, "sync_engine", self.db_engine)
+        sa_event.listen(sync_engine, "checkout", self._apply_pragmas)
+        self._batch_in_thread = _BATCH_SUPPORTED and sync_engine is self.db_engine
+
+        self.write_batch_size = write_batch_size
+        self.write_queue_size = write_queue_size
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=write_queue_size)
+        self._writer: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self.events_written = 0
+        self.write_batches = 0
+        self.max_batch = 0
+
+    def _apply_pragmas(self, dbapi_connection, connection_record, connection_proxy):
+        # Checkout (not connect) also covers connections opened during __init__
+        if connection_record.info.get("synergy_pragmas"):
+            return
+        cursor = dbapi_connection.cursor()
+        for pragma in self._pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+        connection_record.info["synergy_pragmas"] = True
+
+    # ------------------------------------------------------------------
+    # Serialized writes
+    # ------------------------------------------------------------------
+    async def create_session(self, **kwargs) -> Session:
+        return await self._submit("call", lambda: DatabaseSessionService.create_session(self, **kwargs))
+
+    async def delete_session(self, **kwargs) -> None:
+        return await self._submit("call", lambda: DatabaseSessionService.delete_session(self, **kwargs))
+
+    async def append_event(self, session: Session, event: Event) -> Event:
+        if event.partial:
+            return event
+        return await self._submit("append", (session, event))
+
+    async def _submit(self, kind: str, payload: Any):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # The queue and writer belong to one event loop (matters for test clients)
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=self.write_queue_size)
+            self._writer = None
+        if self._writer is None or self._writer.done():
+            self._writer = asyncio.create_task(self._write_loop(), name="session-writer")
+        future = loop.create_future()
+        # Backpressure: waits (instead of failing) when the write queue is full
+        await self._queue.put((kind, payload, future))
+        return await future
+
+    async def _write_loop(self):
+        while True:
+            item = await self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            while len(batch) < self.write_batch_size and not self._queue.empty():
+                nxt = self._queue.get_nowait()
+                if nxt is None:
+                    await self._process(batch)
+                    return
+                batch.append(nxt)
+            await self._process(batch)
+
+    async def _process(self, batch: List[Tuple[str, Any, asyncio.Future]]):
+        # Keep submission order: consecutive appends form one group
+        group: List[Tuple[Any, asyncio.Future]] = []
+        for kind, payload, future in batch:
+            if kind == "append":
+                group.append((payload, future))
+                continue
+            await self._flush_appends(group)
+            group = []
+            await self._run_call(payload, future)
+        await self._flush_appends(group)
+
+    async def _run_call(self, call: Callable[[], Awaitable[Any]], future: asyncio.Future):
+        try:
+            result = await call()
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        else:
+            if not future.done():
+                future.set_result(result)
+
+    async def _flush_appends(self, group: List[Tuple[Tuple[Session, Event], asyncio.Future]]):
+        if not group:
+            return
+        self.write_batches += 1
+        self.max_batch = max(self.max_batch, len(group))
+
+        if not self._batch_in_thread:
+            for (session, event), future in group:
+                await self._run_call(lambda s=session, e=event: DatabaseSessionService.append_event(self, s, e), future)
+            self.events_written += len(group)
+            return
+
+        pairs = [payload for payload, _ in group]
+        try:
+            errors = await asyncio.to_thread(self._commit_appends, pairs)
+        except Exception as e:
+            for _, future in group:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for ((session, event), future), error in zip(group, errors):
+            if error is not None:
+                future.set_exception(error)
+                continue
+            # Mirror the in-memory update DatabaseSessionService does after its commit
+            await BaseSessionService.append_event(self, session=session, event=event)
+            self.events_written += 1
+            if not future.done():
+                future.set_result(event)
+
+    def _commit_appends(self, pairs: List[Tuple[Session, Event]]) -> List[Optional[Exception]]:
+        """Write a batch of events in one transaction (runs in a worker thread).
+
+        Mirrors DatabaseSessionService.append_event, but shares the ORM
+        session and the commit across the batch. Stale-session errors are
+        reported per event without failing the rest of the batch.
+        """
+        errors: List[Optional[Exception]] = []
+        touched: Dict[Tuple[str, str, str], Tuple[Any, List[Session]]] = {}
+        with self.database_session_factory() as sql_session:
+            for session, event in pairs:
+                key = (session.app_name, session.user_id, session.id)
+                if key in touched:
+                    storage_session = touched[key][0]
+                else:
+                    storage_session = sql_session.get(StorageSession, key)
+                    if storage_session is None:
+                        errors.append(ValueError(f"Session not found: {session.id}"))
+                        continue
+                    if storage_session.update_timestamp_tz > session.last_update_time:
+                        errors.append(ValueError(
+                            "The last_update_time provided in the session object"
+                            f" {datetime.fromtimestamp(session.last_update_time):'%Y-%m-%d %H:%M:%S'} is"
+                            " earlier than the update_time in the storage_session. Please check if it is a"
+                            " stale session."
+                        ))
+                        continue
+                    touched[key] = (storage_session, [])
+
+                app_delta, user_delta, session_delta = ({}, {}, {})
+                if event.actions and event.actions.state_delta:
+                    app_delta, user_delta, session_delta = _extract_state_delta(event.actions.state_delta)
+                if app_delta:
+                    storage_app_state = sql_session.get(StorageAppState, (session.app_name))
+                    if storage_app_state is not None:
+                        storage_app_state.state = {**storage_app_state.state, **app_delta}
+                if user_delta:
+                    storage_user_state = sql_session.get(StorageUserState, (session.app_name, session.user_id))
+                    if storage_user_state is not None:
+                        storage_user_state.state = {**storage_user_state.state, **user_delta}
+                if session_delta:
+                    storage_session.state = {**storage_session.state, **session_delta}
+
+                sql_session.add(StorageEvent.from_event(session, event))
+                touched[key][1].append(session)
+                errors.append(None)
+
+            sql_session.commit()
+            for storage_session, sessions in touched.values():
+                sql_session.refresh(storage_session)
+                for session in sessions:
+                    session.last_update_time = storage_session.update_timestamp_tz
+        return errors
+
+    async def close(self):
+        """Drain the write queue and stop the writer (call on shutdown)."""
+        if self._writer is not None and not self._writer.done():
+            await self._queue.put(None)
+            await self._writer
+        self._writer = None
+
+    def stats(self) -> Dict:
+        return {
+            "queued_writes": self._queue.qsize(),
+            "events_written": self.events_written,
+            "write_batches": self.write_batches,
+            "max_batch": self.max_batch,
+            "batched_commits": self._batch_in_thread
+        }
+
+
+def build_session_service(db_url: str = None) -> DatabaseSessionService:
+    """Create the session service configured in settings."""
+    db_url = db_url or settings.DATABASE_URL
+    is_sqlite_file = db_url.startswith("sqlite") and ":memory:" not in db_url and not db_url.endswith("://")
+    if settings.SESSION_DB_TUNED and is_sqlite_file:
+        return TunedSQLiteSessionService(
+            db_url=db_url,
+            synchronous=settings.SESSION_DB_SYNCHRONOUS,
+            busy_timeout_ms=settings.SESSION_DB_BUSY_TIMEOUT_MS,
+            cache_size_kb=settings.SESSION_DB_CACHE_SIZE_KB,
+            pool_size=settings.SESSION_DB_POOL_SIZE,
+            max_overflow=settings.SESSION_DB_MAX_OVERFLOW,
+            pool_timeout=settings.SESSION_DB_POOL_TIMEOUT_SECONDS,
+            write_batch_size=settings.SESSION_DB_WRITE_BATCH_SIZE,
+            write_queue_size=settings.SESSION_DB_WRITE_QUEUE_SIZE
+        )
+    return DatabaseSessionService(db_url=db_url)
@@ -0,0 +1,50 @@
+"""
+Single-Flight Coalescing
+Concurrent requests with the same key share one in-flight execution.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+
+class SingleFlight:
+    """Deduplicates concurrent executions of the same keyed coroutine.
+
+    The first caller for a key (the leader) starts the work in a task; every
+    caller that arrives while it is running awaits the same task. The task is
+    shielded, so one caller disconnecting does not cancel the run for the
+    others. Keys are forgotten as soon as the run finishes - this is not a
+    cache, see ResponseCache for that.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.executions = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """Run `fn` once per key. Returns (result, shared) where `shared` is
+        True for callers that attached to someone else's run."""
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            return await asyncio.shield(task), True
+
+        task = asyncio.ensure_future(fn())
+        self._inflight[key] = task
+        self.executions += 1
+        task.add_done_callback(lambda _: self._forget(key, task))
+        return await asyncio.shield(task), False
+
+    def _forget(self, key: str, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Retrieve the exception so abandoned tasks don't log "never retrieved"
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict:
+        return {
+            "in_flight": len(self._inflight),
+            "executions": self.executions,
+            "runs_saved": self.coalesced
+        }
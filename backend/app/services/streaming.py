@@ -0,0 +1,85 @@
+"""
+Streaming Helpers
+Turns ADK runner events into Server-Sent Events frames.
+"""
+import json
+import asyncio
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, AsyncIterator, Awaitable, Dict, Optional, Set
+
+if TYPE_CHECKING:
+    from google.adk.events import Event
+
+# Queue of frames for the request currently being streamed (None = not streaming)
+event_sink: ContextVar[Optional[asyncio.Queue]] = ContextVar("event_sink", default=None)
+
+_DONE = object()
+
+
+def publish_event(sink: asyncio.Queue, event: "Event", started: Set[str]):
+    """Translate one ADK event into zero or more stream frames.
+
+    Emits `agent_start` the first time an author is seen, `partial` for every
+    streamed text chunk and `agent_finish` with the author's final text.
+    """
+    author = event.author
+    if not author or author == "user":
+        return
+
+    if author not in started:
+        started.add(author)
+        sink.put_nowait({"event": "agent_start", "agent": author, "branch": event.branch})
+
+    text = ""
+    if event.content and event.content.parts:
+        text = "".join(part.text for part in event.content.parts if part.text)
+
+    if event.partial:
+        if text:
+            sink.put_nowait({"event": "partial", "agent": author, "text": text})
+    elif event.is_final_response():
+        sink.put_nowait({"event": "agent_finish", "agent": author, "branch": event.branch, "text": text})
+
+
+async def stream_frames(run: Awaitable[Dict]) -> AsyncIterator[Dict]:
+    """Run a SynergyAIRunner coroutine and yield its frames as they happen.
+
+    The coroutine runs in its own task with `event_sink` bound, so every
+    agent run inside it publishes frames to this stream. The last frame is
+    `final` (the usual result dict) or `error`.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    token = event_sink.set(queue)
+    try:
+        task = asyncio.ensure_future(run)
+    finally:
+        event_sink.reset(token)
+    task.add_done_callback(lambda _: queue.put_nowait(_DONE))
+
+    try:
+        while True:
+            frame = await queue.get()
+            if frame is _DONE:
+                break
+            yield frame
+
+        try:
+            result = task.result()
+        except Exception as e:
+            yield {"event": "error", "error": str(e)}
+            return
+
+        if isinstance(result, dict) and result.get("success") is False:
+            yield {"event": "error", "error": result.get("error", "Unknown error")}
+        else:
+            yield {"event": "final", "result": result}
+    finally:
+        # Client went away mid-stream: stop burning tokens on its behalf
+        if not task.done():
+            task.cancel()
+
+
+async def sse_encode(frames: AsyncIterator[Dict]) -> AsyncIterator[str]:
+    """Encode frames in the text/event-stream wire format."""
+    async for frame in frames:
+        yield f"event: {frame['event']}\ndata: {json.dumps(frame, default=str)}\n\n"
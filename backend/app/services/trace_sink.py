@@ -0,0 +1,211 @@
+"""
+Trace Sink
+Background, batched writer for agent traces with size/age based rotation.
+"""
+import os
+import glob
+import gzip
+import json
+import time
+import shutil
+import asyncio
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from .trace_store import TraceStore
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class TraceSink:
+    """Non-blocking JSONL trace writer.
+
+    Request handlers call `emit()`, which only enqueues the entry. A single
+    background task drains the bounded queue, batches entries and appends
+    them to disk in a worker thread, so the event loop never touches the
+    file. When the queue is full the entry is dropped and counted instead of
+    stalling the request. Files are rotated by size or age and gzipped,
+    keeping at most `backup_count` archives. Each batch is also appended to
+    the indexed TraceStore, when one is configured, for the query API, along
+    with any token usage rows queued through `emit_usage()`.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_queue: int = 10000,
+        batch_size: int = 200,
+        flush_interval: float = 1.0,
+        max_bytes: int = 50 * 1024 * 1024,
+        max_age_seconds: float = 24 * 3600,
+        backup_count: int = 7,
+        store: Optional[TraceStore] = None
+    ):
+        self.path = path
+        self.store = store
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.backup_count = backup_count
+
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self._task: Optional[asyncio.Task] = None
+        self._opened_at: Optional[float] = None
+        self._file_lock = threading.Lock()
+
+        self.written = 0
+        self.dropped = 0
+        self.batches = 0
+        self.rotations = 0
+        self.write_errors = 0
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    def start(self):
+        """Start the background writer (call from the running event loop)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="trace-sink")
+
+    async def stop(self):
+        """Stop the writer and flush whatever is still queued."""
+        if self._task is not None and not self._task.done():
+            # The writer drains everything queued before the stop marker
+            await self._queue.put(_STOP)
+            await self._task
+        self._task = None
+        await self._flush_remaining()
+
+    # ------------------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------------------
+    def emit(self, entry: Dict) -> bool:
+        """Queue a trace entry. Never blocks; returns False if it was dropped."""
+        return self._put(("trace", entry))
+
+    def emit_usage(self, rows: List[Dict]) -> bool:
+        """Queue token usage rows for the TraceStore (not written to the JSONL file)."""
+        if self.store is None or not rows:
+            return False
+        return self._put(("usage", rows))
+
+    def _put(self, item) -> bool:
+        try:
+            self._queue.put_nowait(item)
+            return True
+        except asyncio.QueueFull:
+            self.dropped += 1
+            return False
+
+    def stats(self) -> Dict:
+        return {
+            "queued": self._queue.qsize(),
+            "written": self.written,
+            "dropped": self.dropped,
+            "batches": self.batches,
+            "rotations": self.rotations,
+            "write_errors": self.write_errors
+        }
+
+    # ------------------------------------------------------------------
+    # Consumer side
+    # ------------------------------------------------------------------
+    async def _run(self):
+        stopping = False
+        while not stopping:
+            item = await self._queue.get()
+            if item is _STOP:
+                return
+            batch = [item]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            await self._write(batch)
+
+    async def _flush_remaining(self):
+        batch = []
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is _STOP:
+                continue
+            batch.append(item)
+            if len(batch) >= self.batch_size:
+                await self._write(batch)
+                batch = []
+        if batch:
+            await self._write(batch)
+
+    async def _write(self, batch: List[Dict]):
+        try:
+            await asyncio.to_thread(self._write_batch, batch)
+            self.written += len(batch)
+            self.batches += 1
+        except Exception as e:
+            self.write_errors += 1
+            logger.error("Failed to write %d traces: %s", len(batch), e)
+
+    def _write_batch(self, batch: List):
+        """Runs in a worker thread."""
+        traces = [payload for kind, payload in batch if kind == "trace"]
+        usage = [row for kind, payload in batch if kind == "usage" for row in payload]
+        if traces:
+            self._write_file(traces)
+        if self.store is not None:
+            if traces:
+                self.store.insert_many(traces)
+            if usage:
+                self.store.insert_usage(usage)
+
+    def _write_file(self, traces: List[Dict]):
+        payload = "".join(json.dumps(entry, default=str) + "\n" for entry in traces)
+        with self._file_lock:
+            self._rotate_if_needed()
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, "a") as f:
+                f.write(payload)
+            if self._opened_at is None:
+                self._opened_at = time.time()
+
+    def _rotate_if_needed(self):
+        try:
+            size = os.path.getsize(self.path)
+        except FileNotFoundError:
+            self._opened_at = None
+            return
+
+        too_big = size >= self.max_bytes
+        too_old = self._opened_at is not None and time.time() - self._opened_at >= self.max_age_seconds
+        if not (too_big or too_old):
+            return
+
+        base, _ = os.path.splitext(self.path)
+        archive = f"{base}.{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}.jsonl.gz"
+        rotated = archive[:-3]
+        os.replace(self.path, rotated)
+        with open(rotated, "rb") as src, gzip.open(archive, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        os.remove(rotated)
+        self._opened_at = None
+        self.rotations += 1
+
+        # Keep only the newest archives
+        archives = sorted(glob.glob(f"{base}.*.jsonl.gz"))
+        for old in archives[:-self.backup_count] if self.backup_count > 0 else archives:
+            os.remove(old)
@@ -0,0 +1,224 @@
+"""
+Trace Store
+Indexed SQLite store for agent traces with filtered, cursor-paginated queries,
+plus per-agent token usage rows and their aggregates.
+"""
+import os
+import json
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS traces (
+    id        INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp TEXT NOT NULL,
+    agent     TEXT NOT NULL,
+    status    TEXT NOT NULL,
+    data      TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_traces_timestamp ON traces (timestamp);
+CREATE INDEX IF NOT EXISTS idx_traces_agent ON traces (agent, id);
+CREATE INDEX IF NOT EXISTS idx_traces_status ON traces (status, id);
+
+CREATE TABLE IF NOT EXISTS usage (
+    id               INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp        TEXT NOT NULL,
+    invocation_id    TEXT,
+    endpoint         TEXT,
+    workflow         TEXT,
+    user_id          TEXT,
+    session_id       TEXT,
+    agent            TEXT,
+    model            TEXT,
+    calls            INTEGER NOT NULL DEFAULT 0,
+    prompt_tokens    INTEGER NOT NULL DEFAULT 0,
+    candidate_tokens INTEGER NOT NULL DEFAULT 0,
+    cached_tokens    INTEGER NOT NULL DEFAULT 0,
+    thoughts_tokens  INTEGER NOT NULL DEFAULT 0,
+    total_tokens     INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_usage_timestamp ON usage (timestamp);
+CREATE INDEX IF NOT EXISTS idx_usage_invocation ON usage (invocation_id);
+"""
+
+_USAGE_COLUMNS = (
+    "timestamp", "invocation_id", "endpoint", "workflow", "user_id", "session_id", "agent", "model",
+    "calls", "prompt_tokens", "candidate_tokens", "cached_tokens", "thoughts_tokens", "total_tokens"
+)
+_USAGE_SUMS = ("calls", "prompt_tokens", "candidate_tokens", "cached_tokens", "thoughts_tokens", "total_tokens")
+USAGE_GROUPS = ("agent", "workflow", "user_id", "endpoint", "model")
+
+
+class TraceStore:
+    """SQLite-backed trace store.
+
+    Rows are appended in batches by the TraceSink worker thread and read by
+    the API through `asyncio.to_thread`. Pagination is keyset-based on the
+    autoincrement id (newest first), so fetching the latest page is an index
+    seek regardless of how many traces exist. Each thread gets its own
+    connection; WAL mode lets readers run while the writer appends.
+    """
+
+    MAX_LIMIT = 500
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        self._initialized = False
+        self._init_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        if not self._initialized:
+            with self._init_lock:
+                if not self._initialized:
+                    conn.executescript(_SCHEMA)
+                    self._initialized = True
+        return conn
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+    def insert_many(self, entries: Iterable[Dict]):
+        rows = [
+            (
+                entry.get("timestamp", ""),
+                entry.get("agent", "unknown"),
+                entry.get("status", "success"),
+                json.dumps(entry, default=str)
+            )
+            for entry in entries
+        ]
+        conn = self._connect()
+        with conn:
+            conn.executemany(
+                "INSERT INTO traces (timestamp, agent, status, data) VALUES (?, ?, ?, ?)",
+                rows
+            )
+
+    def insert_usage(self, rows: Iterable[Dict]):
+        values = [tuple(row.get(column) for column in _USAGE_COLUMNS) for row in rows]
+        if not values:
+            return
+        conn = self._connect()
+        with conn:
+            conn.executemany(
+                f"INSERT INTO usage ({', '.join(_USAGE_COLUMNS)}) "
+                f"VALUES ({', '.join('?' for _ in _USAGE_COLUMNS)})",
+                values
+            )
+
+    def import_jsonl(self, path: str) -> int:
+        """Backfill an empty store from an existing JSONL trace file."""
+        conn = self._connect()
+        if conn.execute("SELECT 1 FROM traces LIMIT 1").fetchone():
+            return 0
+        try:
+            with open(path, "r") as f:
+                entries = [json.loads(line) for line in f if line.strip()]
+        except FileNotFoundError:
+            return 0
+        self.insert_many(entries)
+        return len(entries)
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+    def query(
+        self,
+        agent: Optional[str] = None,
+        status: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        cursor: Optional[int] = None,
+        limit: int = 10
+    ) -> Dict:
+        """Return one page of traces, newest page first.
+
+        `since`/`until` are ISO-8601 timestamps (inclusive/exclusive). Pass the
+        returned `next_cursor` back as `cursor` to fetch the next older page.
+        Traces inside a page are in chronological order.
+        """
+        limit = max(1, min(limit, self.MAX_LIMIT))
+        clauses, params = [], []
+        if agent:
+            clauses.append("agent = ?")
+            params.append(agent)
+        if status:
+            clauses.append("status = ?")
+            params.append(status)
+        if since:
+            clauses.append("timestamp >= ?")
+            params.append(since)
+        if until:
+            clauses.append("timestamp < ?")
+            params.append(until)
+        if cursor is not None:
+            clauses.append("id < ?")
+            params.append(cursor)
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = f"SELECT id, data FROM traces {where} ORDER BY id DESC LIMIT ?"
+        rows = self._connect().execute(sql, (*params, limit + 1)).fetchall()
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        traces: List[Dict] = []
+        for row_id, data in reversed(rows):
+            trace = json.loads(data)
+            trace["id"] = row_id
+            traces.append(trace)
+
+        return {
+            "traces": traces,
+            "next_cursor": rows[-1][0] if has_more else None
+        }
+
+    def aggregate_usage(
+        self,
+        group_by: str = "agent",
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        filters: Optional[Dict[str, str]] = None
+    ) -> List[Dict]:
+        """Sum token usage per `group_by` value (and model, so cost can be priced).
+
+        `filters` maps any of USAGE_GROUPS to a required value.
+        """
+        if group_by not in USAGE_GROUPS:
+            raise ValueError(f"group_by must be one of {', '.join(USAGE_GROUPS)}")
+        clauses, params = [], []
+        if since:
+            clauses.append("timestamp >= ?")
+            params.append(since)
+        if until:
+            clauses.append("timestamp < ?")
+            params.append(until)
+        for column, value in (filters or {}).items():
+            if column in USAGE_GROUPS and value:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        group_cols = [group_by] if group_by == "model" else [group_by, "model"]
+        sums = ", ".join(f"SUM({column})" for column in _USAGE_SUMS)
+        sql = (
+            f"SELECT {', '.join(group_cols)}, COUNT(DISTINCT invocation_id), {sums} "
+            f"FROM usage {where} GROUP BY {', '.join(group_cols)} ORDER BY SUM(total_tokens) DESC"
+        )
+        result = []
+        for row in self._connect().execute(sql, params).fetchall():
+            entry = dict(zip(group_cols, row[:len(group_cols)]))
+            entry["invocations"] = row[len(group_cols)]
+            entry.update(zip(_USAGE_SUMS, row[len(group_cols) + 1:]))
+            result.append(entry)
+        return result
@@ -0,0 +1,105 @@
+"""
+Usage Accounting
+Per-invocation token accounting from ADK event usage metadata.
+"""
+import json
+from contextvars import ContextVar
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from google.adk.agents import BaseAgent
+
+# API route that triggered the current agent run (set by the ASGI middleware)
+current_endpoint: ContextVar[str] = ContextVar("current_endpoint", default="internal")
+
+# Runner key of the workflow being run (set by SynergyAIRunner._run_agent)
+current_workflow: ContextVar[str] = ContextVar("current_workflow", default="unknown")
+
+
+@dataclass
+class AgentUsage:
+    calls: int = 0
+    prompt_tokens: int = 0
+    candidate_tokens: int = 0
+    cached_tokens: int = 0
+    thoughts_tokens: int = 0
+    total_tokens: int = 0
+
+
+class UsageCollector:
+    """Accumulates usage per agent author for one runner invocation."""
+
+    def __init__(self, workflow: str, user_id: str, session_id: str, endpoint: str = None):
+        self.workflow = workflow
+        self.user_id = user_id
+        self.session_id = session_id
+        self.endpoint = endpoint or current_endpoint.get()
+        self.invocation_id: Optional[str] = None
+        self.by_agent: Dict[str, AgentUsage] = {}
+
+    def add(self, event):
+        """Record an event's usage_metadata (partial stream chunks are skipped)."""
+        metadata = event.usage_metadata
+        if metadata is None or event.partial:
+            return
+        self.invocation_id = self.invocation_id or event.invocation_id
+        usage = self.by_agent.setdefault(event.author or "unknown", AgentUsage())
+        usage.calls += 1
+        usage.prompt_tokens += metadata.prompt_token_count or 0
+        usage.candidate_tokens += metadata.candidates_token_count or 0
+        usage.cached_tokens += metadata.cached_content_token_count or 0
+        usage.thoughts_tokens += metadata.thoughts_token_count or 0
+        usage.total_tokens += metadata.total_token_count or 0
+
+    def rows(self, models: Dict[str, str]) -> List[Dict]:
+        """One row per agent, ready for TraceStore.insert_usage."""
+        timestamp = datetime.now().isoformat()
+        return [
+            {
+                "timestamp": timestamp,
+                "invocation_id": self.invocation_id,
+                "endpoint": self.endpoint,
+                "workflow": self.workflow,
+                "user_id": self.user_id,
+                "session_id": self.session_id,
+                "agent": agent,
+                "model": models.get(agent, "unknown"),
+                **asdict(usage)
+            }
+            for agent, usage in self.by_agent.items()
+        ]
+
+
+def model_name(root_agent: "BaseAgent", author: str) -> str:
+    """Model id used by the agent named `author` inside a workflow tree."""
+    agent = root_agent.find_agent(author)
+    model = getattr(agent, "model", None)
+    if model is None:
+        return "unknown"
+    return model if isinstance(model, str) else getattr(model, "model", type(model).__name__)
+
+
+def parse_pricing(raw: str) -> Dict[str, Dict[str, float]]:
+    """Parse MODEL_PRICING: {"model": {"input": usd, "output": usd, "cached": usd}} per 1M tokens."""
+    try:
+        return json.loads(raw) if raw else {}
+    except ValueError:
+        return {}
+
+
+def estimate_cost(row: Dict, pricing: Dict[str, Dict[str, float]]) -> Optional[float]:
+    """USD cost of an aggregated usage row, or None if its model has no price."""
+    price = pricing.get(row.get("model"))
+    if not price:
+        return None
+    cached = row.get("cached_tokens") or 0
+    fresh_input = max(0, (row.get("prompt_tokens") or 0) - cached)
+    output = (row.get("candidate_tokens") or 0) + (row.get("thoughts_tokens") or 0)
+    cost = (
+        fresh_input * price.get("input", 0)
+        + cached * price.get("cached", price.get("input", 0))
+        + output * price.get("output", 0)
+    ) / 1_000_000
+    return round(cost, 6)
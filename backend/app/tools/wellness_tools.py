@@ -13,7 +13,10 @@ def get_personalized_wellness_tip(stress_level: int = 0) -> dict:
     current_hour = datetime.now().hour
     time_advice = "Morning tip" if current_hour < 12 else "Afternoon tip" if current_hour < 17 else "Evening tip"
     
-    tips = tips_by_stress.get(stress_level, tips_by_stress[1])
+    # Unknown levels get the level-1 tips; report the level actually used
+    if stress_level not in tips_by_stress:
+        stress_level = 1
+    tips = tips_by_stress[stress_level]
     selected_tip = random.choice(tips)
     
     return {
@@ -0,0 +1,161 @@
+"""
+Benchmark: backend import and startup time.
+Runs `python -X importtime -c "import app.main"` in fresh interpreters and
+reports the median cumulative time of the app, the slowest modules and the
+time per top-level package, then measures (also in fresh interpreters) how
+long it takes until the runner is built and until every agent is built.
+
+Usage (from backend/):
+    python -m benchmarks.bench_import_time --runs 5
+    python -m benchmarks.bench_import_time --output benchmarks/baselines/import_time.json
+"""
+import argparse
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+STARTUP_SCRIPT = """
+import json, time
+started = time.perf_counter()
+import app.main
+from app.api.routes import runner
+imported = time.perf_counter()
+runner.get()
+runner_ready = time.perf_counter()
+runner.runners.warm_up()
+agents_ready = time.perf_counter()
+print(json.dumps({"import_app_main": imported - started, "runner_ready": runner_ready - started,
+                  "all_agents_built": agents_ready - started}))
+"""
+
+
+def child_env(tmp: str) -> Dict[str, str]:
+    env = dict(os.environ)
+    env.setdefault("GOOGLE_API_KEY", "benchmark-dummy-key")
+    env.update({
+        "PYTHONPATH": BACKEND_DIR,
+        "PYTHONWARNINGS": "ignore",
+        "LLM_BACKEND": "fake",
+        "DATABASE_URL": f"sqlite:///{tmp}/sessions.db",
+        "TRACE_FILE_PATH": f"{tmp}/traces.jsonl",
+        "TRACE_DB_PATH": f"{tmp}/traces.db",
+        "JOB_DB_PATH": f"{tmp}/jobs.db",
+        "SEARCH_CACHE_DB_PATH": f"{tmp}/search_cache.db",
+        "INTERVIEW_RESEARCH_DB_PATH": f"{tmp}/interview_research.db",
+    })
+    return env
+
+
+def import_profile(env: Dict[str, str]) -> Dict[str, Dict[str, int]]:
+    """module -> {"self": us, "cumulative": us} for one `import app.main`."""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", "import app.main"],
+                          cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True)
+    modules = {}
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            modules[match.group(4)] = {"self": int(match.group(1)), "cumulative": int(match.group(2))}
+    return modules
+
+
+def startup_times(env: Dict[str, str]) -> Dict[str, float]:
+    proc = subprocess.run([sys.executable, "-c", STARTUP_SCRIPT], cwd=BACKEND_DIR, env=env,
+                          capture_output=True, text=True, check=True)
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def median_ms(values: List[float]) -> float:
+    return round(statistics.median(values) / 1e3, 1)
+
+
+def summarize(profiles: List[Dict[str, Dict[str, int]]], top: int) -> Dict:
+    modules = {name for profile in profiles for name in profile}
+    self_ms = {name: median_ms([p[name]["self"] for p in profiles if name in p]) for name in modules}
+    cumulative_ms = {name: median_ms([p[name]["cumulative"] for p in profiles if name in p]) for name in modules}
+
+    packages = defaultdict(list)
+    for profile in profiles:
+        totals = defaultdict(int)
+        for name, times in profile.items():
+            parts = name.split(".")
+            group = ".".join(parts[:2]) if parts[0] == "google" else parts[0]
+            totals[group] += times["self"]
+        for group, total in totals.items():
+            packages[group].append(total)
+
+    return {
+        "app_main_ms": cumulative_ms.get("app.main"),
+        "modules_imported": round(statistics.median(len(p) for p in profiles)),
+        "slowest_modules_cumulative_ms": dict(sorted(cumulative_ms.items(), key=lambda kv: -kv[1])[:top]),
+        "slowest_modules_self_ms": dict(sorted(self_ms.items(), key=lambda kv: -kv[1])[:top]),
+        "packages_self_ms": dict(sorted(((group, median_ms(values)) for group, values in packages.items()),
+                                        key=lambda kv: -kv[1])[:top]),
+        "app_modules_cumulative_ms": dict(sorted((name, ms) for name, ms in cumulative_ms.items()
+                                                 if name == "app" or name.startswith("app."))),
+    }
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True, cwd=BACKEND_DIR).stdout.strip()
+    except Exception:
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--output", help="write results as JSON to this path")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = child_env(tmp)
+        # One untimed run so .pyc files and the OS page cache are warm
+        import_profile(env)
+        profiles = [import_profile(env) for _ in range(args.runs)]
+        startups = [startup_times(env) for _ in range(args.runs)]
+
+    report = summarize(profiles, args.top)
+    report["startup_s"] = {
+        key: round(statistics.median(run[key] for run in startups), 3) for key in startups[0]
+    }
+
+    print(f"import app.main: {report['app_main_ms']:.0f} ms ({report['modules_imported']} modules, median of {args.runs})")
+    for key, seconds in report["startup_s"].items():
+        print(f"  {key:<20}{seconds:>8.2f} s")
+    print(f"\n{'package':<40}{'self ms':>10}")
+    for group, ms in report["packages_self_ms"].items():
+        print(f"{group:<40}{ms:>10.1f}")
+    print(f"\n{'module':<56}{'cumulative ms':>14}")
+    for name, ms in report["slowest_modules_cumulative_ms"].items():
+        print(f"{name:<56}{ms:>14.1f}")
+
+    if args.output:
+        report.update({
+            "config": {"runs": args.runs, "LLM_BACKEND": "fake"},
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "environment": {"platform": platform.platform(), "python": platform.python_version()},
+            "revision": git_revision(),
+        })
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+        print(f"\nWrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Benchmark: Gemini calls against a quota-enforcing fake endpoint.
+Starts a local HTTP server that speaks the generateContent API, allows
+`--quota` requests per second and answers everything above it with a 429
+RESOURCE_EXHAUSTED (plus optional scripted 429s), then fires a burst of
+concurrent calls through the plain Gemini model and through
+RateLimitedGemini with its model's adaptive limiter.
+
+Usage (from backend/):
+    python -m benchmarks.bench_rate_limiter --calls 200 --quota 20 --rpm 1800
+"""
+import argparse
+import asyncio
+import json
+import os
+import threading
+import time
+import warnings
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+os.environ.setdefault("GOOGLE_API_KEY", "benchmark-dummy-key")
+warnings.filterwarnings("ignore")
+
+
+class FakeGemini:
+    """Fixed-window quota plus a script of forced 429s (by request number)."""
+
+    def __init__(self, quota_per_second: int, scripted_429s=()):
+        self.quota = quota_per_second
+        self.scripted = set(scripted_429s)
+        self.lock = threading.Lock()
+        self.window = 0
+        self.in_window = 0
+        self.received = 0
+        self.throttled = 0
+
+    def admit(self) -> bool:
+        with self.lock:
+            self.received += 1
+            window = int(time.monotonic())
+            if window != self.window:
+                self.window, self.in_window = window, 0
+            self.in_window += 1
+            if self.received in self.scripted or self.in_window > self.quota:
+                self.throttled += 1
+                return False
+            return True
+
+    def handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                if fake.admit():
+                    status, body = 200, {
+                        "candidates": [{"content": {"role": "model", "parts": [{"text": "ok"}]},
+                                        "finishReason": "STOP"}],
+                        "usageMetadata": {"promptTokenCount": 40, "candidatesTokenCount": 10,
+                                          "totalTokenCount": 50}
+                    }
+                else:
+                    status, body = 429, {"error": {
+                        "code": 429, "status": "RESOURCE_EXHAUSTED", "message": "Quota exceeded",
+                        "details": [{"@type": "type.googleapis.com/google.rpc.RetryInfo", "retryDelay": "1s"}]
+                    }}
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        return Handler
+
+
+async def fire(model, calls: int):
+    from google.adk.models.llm_request import LlmRequest
+    from google.genai import types
+
+    async def one(i):
+        request = LlmRequest(
+            model="gemini-2.5-flash",
+            contents=[types.Content(role="user", parts=[types.Part(text=f"question {i}")])],
+            config=types.GenerateContentConfig(max_output_tokens=64)
+        )
+        try:
+            async for _ in model.generate_content_async(request):
+                pass
+            return True
+        except Exception:
+            return False
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*[one(i) for i in range(calls)])
+    return sum(results), time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--quota", type=int, default=20, help="fake server requests per second")
+    parser.add_argument("--rpm", type=int, default=1800, help="limiter budget (set above the real quota)")
+    parser.add_argument("--scripted", type=str, default="5,6,7", help="request numbers that always get 429")
+    args = parser.parse_args()
+
+    fake = FakeGemini(args.quota, [int(n) for n in args.scripted.split(",") if n])
+    server = ThreadingHTTPServer(("127.0.0.1", 0), fake.handler())
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    os.environ["GEMINI_BASE_URL"] = f"http://127.0.0.1:{server.server_port}"
+    os.environ["GEMINI_RPM"] = str(args.rpm)
+    os.environ["GEMINI_RATE_LIMIT_BACKOFF_SECONDS"] = "1"
+    os.environ["GEMINI_RATE_LIMIT_MAX_RETRIES"] = "8"
+
+    from google.adk.models.google_llm import Gemini
+    from app.llm.retry_config import retry_config
+    from app.llm.rate_limiter import RateLimitedGemini, gemini_rate_limiters
+
+    plain = Gemini(model="gemini-2.5-flash", retry_options=retry_config)
+    plain.__dict__["api_client"] = RateLimitedGemini(model="gemini-2.5-flash", retry_options=retry_config).api_client
+    limited = RateLimitedGemini(model="gemini-2.5-flash", retry_options=retry_config)
+
+    print(f"{args.calls} concurrent calls, fake quota {args.quota} req/s, limiter budget {args.rpm} RPM\n")
+    for name, model in (("plain Gemini", plain), ("RateLimitedGemini", limited)):
+        time.sleep(1.1)
+        fake.received = fake.throttled = 0
+        ok, elapsed = asyncio.run(fire(model, args.calls))
+        print(f"{name:<20} succeeded {ok:>4}/{args.calls}  server 429s {fake.throttled:>4}  "
+              f"requests sent {fake.received:>4}  {elapsed:6.2f}s")
+    print(f"\nlimiter: {gemini_rate_limiters.get(limited.model).stats()}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
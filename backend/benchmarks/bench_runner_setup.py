@@ -0,0 +1,68 @@
+"""
+Benchmark: per-request Runner setup cost.
+Compares building a fresh Runner + LoggingPlugin per call (old behaviour)
+against looking up the shared Runner in the RunnerRegistry.
+
+Usage (from backend/):
+    python -m benchmarks.bench_runner_setup --iterations 5000
+"""
+import argparse
+import os
+import time
+import warnings
+
+os.environ.setdefault("GOOGLE_API_KEY", "benchmark-dummy-key")
+warnings.filterwarnings("ignore", category=DeprecationWarning)
+
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.adk.memory import InMemoryMemoryService
+from google.adk.plugins.logging_plugin import LoggingPlugin
+
+from app.agents.mock_interview import interactive_interviewer
+from app.agents.workflows import daily_workflow
+from app.services.runner_registry import RunnerRegistry
+
+APP_NAME = "synergy_ai_benchmark"
+
+
+def bench_fresh_runner(agent, session_service, memory_service, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        Runner(
+            agent=agent,
+            app_name=APP_NAME,
+            session_service=session_service,
+            memory_service=memory_service,
+            plugins=[LoggingPlugin()]
+        )
+    return (time.perf_counter() - start) / iterations
+
+
+def bench_registry(registry: RunnerRegistry, key: str, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        registry.get(key)
+    return (time.perf_counter() - start) / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=5000)
+    args = parser.parse_args()
+
+    session_service = InMemorySessionService()
+    memory_service = InMemoryMemoryService()
+    registry = RunnerRegistry(APP_NAME, session_service, memory_service)
+    registry.register("interactive_interviewer", interactive_interviewer)
+    registry.register("daily_workflow", daily_workflow)
+
+    print(f"{'agent':<26}{'fresh (us)':>14}{'registry (us)':>16}{'speedup':>10}")
+    for key, agent in [("interactive_interviewer", interactive_interviewer), ("daily_workflow", daily_workflow)]:
+        fresh = bench_fresh_runner(agent, session_service, memory_service, args.iterations)
+        shared = bench_registry(registry, key, args.iterations)
+        print(f"{key:<26}{fresh * 1e6:>14.2f}{shared * 1e6:>16.3f}{fresh / shared:>9.0f}x")
+
+
+if __name__ == "__main__":
+    main()
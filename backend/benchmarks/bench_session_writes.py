@@ -0,0 +1,91 @@
+"""
+Benchmark: concurrent session event appends.
+Simulates many sessions appending events at once against the stock
+DatabaseSessionService and the tuned SQLite service (WAL + pragmas +
+single batched writer), each on a fresh database file.
+
+Usage (from backend/):
+    python -m benchmarks.bench_session_writes --sessions 50 --events 40
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import warnings
+
+os.environ.setdefault("GOOGLE_API_KEY", "benchmark-dummy-key")
+warnings.filterwarnings("ignore")
+
+from google.adk.events import Event, EventActions
+from google.adk.sessions import DatabaseSessionService
+from google.genai import types
+
+from app.services.session_store import TunedSQLiteSessionService
+
+APP_NAME = "synergy_ai_benchmark"
+
+
+async def simulate_session(service, index: int, events: int, latencies: list, errors: list):
+    session = await service.create_session(app_name=APP_NAME, user_id=f"user_{index}", session_id=f"bench_{index}")
+    for i in range(events):
+        event = Event(
+            invocation_id=f"inv_{index}",
+            author="BenchAgent",
+            content=types.Content(role="model", parts=[types.Part(text=f"chunk {i} " * 20)]),
+            actions=EventActions(state_delta={"progress": i})
+        )
+        start = time.perf_counter()
+        try:
+            await service.append_event(session, event)
+        except Exception as e:
+            errors.append(str(e))
+        latencies.append(time.perf_counter() - start)
+        # Yield so sessions interleave like concurrent workflows do
+        await asyncio.sleep(0)
+
+
+async def loop_lag_probe(stop: asyncio.Event, lags: list):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.005)
+        lags.append(time.perf_counter() - start - 0.005)
+
+
+async def run(name: str, service, sessions: int, events: int):
+    latencies, errors, lags = [], [], []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(loop_lag_probe(stop, lags))
+    start = time.perf_counter()
+    await asyncio.gather(*(simulate_session(service, i, events, latencies, errors) for i in range(sessions)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await probe
+    if hasattr(service, "close"):
+        await service.close()
+
+    latencies.sort()
+    total = sessions * events
+    print(
+        f"{name:<10}{total / elapsed:>12.0f}{latencies[len(latencies) // 2] * 1e3:>10.2f}"
+        f"{latencies[int(len(latencies) * 0.99) - 1] * 1e3:>10.2f}"
+        f"{max(lags) * 1e3 if lags else 0:>14.2f}{len(errors):>8}"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=50)
+    parser.add_argument("--events", type=int, default=40)
+    args = parser.parse_args()
+
+    print(f"{'service':<10}{'events/s':>12}{'p50 ms':>10}{'p99 ms':>10}{'max lag ms':>14}{'errors':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        stock = DatabaseSessionService(db_url=f"sqlite:///{tmp}/stock.db")
+        await run("stock", stock, args.sessions, args.events)
+        tuned = TunedSQLiteSessionService(db_url=f"sqlite:///{tmp}/tuned.db")
+        await run("tuned", tuned, args.sessions, args.events)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,399 @@
+"""
+Load test: every /api route end to end against an offline LLM backend.
+Runs the FastAPI app in-process (LLM_BACKEND=fake by default, fresh
+temporary databases) and drives each route in turn with `--concurrency`
+clients, reporting throughput, p50/p95/p99 latency, failures and event-loop
+lag. With `--url` it drives an already running server instead (start it
+with LLM_BACKEND=fake); event-loop lag is then the load generator's own.
+
+`--record DIR` captures every model call into cassettes (run it once with
+`--backend gemini` and a real key); `--backend replay --cassettes DIR`
+then serves them back by request fingerprint, deterministically and
+without network access, with recorded or zero model latency.
+
+Results are written as JSON (`--output`) so they can be checked in as a
+baseline and diffed against later runs (`--compare`).
+
+Usage (from backend/):
+    python -m benchmarks.load_test --requests 40 --concurrency 8 \
+        --output benchmarks/baselines/load_test.json
+    python -m benchmarks.load_test --compare benchmarks/baselines/load_test.json
+    python -m benchmarks.load_test --backend gemini --record benchmarks/cassettes
+    python -m benchmarks.load_test --backend replay --cassettes benchmarks/cassettes
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, List, Optional
+
+os.environ.setdefault("GOOGLE_API_KEY", "benchmark-dummy-key")
+warnings.filterwarnings("ignore")
+
+import httpx
+
+SCHEMA_VERSION = 1
+MIN_LATENCY_DELTA_MS = 5.0
+
+
+@dataclass
+class Scenario:
+    method: str
+    path: str
+    body: Optional[Callable[[int, Dict], Dict]] = None
+    # Untimed setup per request (e.g. start an interview to continue it)
+    prepare: Optional[Callable[[httpx.AsyncClient, int], Awaitable[Dict]]] = None
+    kind: str = "json"  # json | sse | ndjson | job
+
+    @property
+    def name(self) -> str:
+        return f"{self.method} {self.path}"
+
+
+def quiz(i, _):
+    return {"user_id": f"load_{i}", "topic": f"Topic {i}", "notes": "Key facts to test.", "difficulty": "medium"}
+
+
+def daily_plan(i, _):
+    return {"user_id": f"load_{i}", "goals": f"Finish chapter {i} and apply to two jobs", "stress_level": 3}
+
+
+def interview(i, _):
+    return {"user_id": f"load_{i}", "role": f"Engineer {i}", "company": f"Company {i}"}
+
+
+def job_search(i, _):
+    return {"user_id": f"load_{i}", "role": f"Engineer {i}", "level": "mid", "experience": 3, "location": "Remote"}
+
+
+def mock_start(i, _):
+    return {"user_id": f"load_{i}", "role": "Engineer", "company": f"Company {i}", "common_topics": ["APIs"]}
+
+
+def mock_turn(i, ctx):
+    return {"user_id": f"load_{i}", "session_id": ctx["session_id"], "user_response": "I would add a cache."}
+
+
+def mock_session(i, ctx):
+    return {"user_id": f"load_{i}", "session_id": ctx["session_id"]}
+
+
+def resume(i, _):
+    return {"user_id": f"load_{i}", "resume_text": "Python, FastAPI, SQL. " * 20, "job_description": "Backend role"}
+
+
+def evaluation(i, _):
+    return {"user_prompt": f"Question {i}", "ai_response": "An answer to grade."}
+
+
+def quiz_batch(i, _):
+    return {"user_id": f"load_{i}", "items": [{"topic": f"Topic {i}.{n}"} for n in range(5)]}
+
+
+def eval_batch(i, _):
+    return {"items": [evaluation(f"{i}.{n}", None) for n in range(5)]}
+
+
+async def started_interview(client: httpx.AsyncClient, i: int) -> Dict:
+    response = await client.post("/api/mock-interview/start", json=mock_start(i, None))
+    response.raise_for_status()
+    return {"session_id": response.json()["session_id"]}
+
+
+SCENARIOS = [
+    Scenario("POST", "/api/daily-plan", daily_plan),
+    Scenario("POST", "/api/daily-plan/stream", daily_plan, kind="sse"),
+    Scenario("POST", "/api/interview-prep", interview),
+    Scenario("POST", "/api/interview-prep/stream", interview, kind="sse"),
+    Scenario("POST", "/api/quiz", quiz),
+    Scenario("POST", "/api/quiz/stream", quiz, kind="sse"),
+    Scenario("POST", "/api/quiz/batch", quiz_batch, kind="ndjson"),
+    Scenario("POST", "/api/job-search", job_search),
+    Scenario("POST", "/api/job-search/stream", job_search, kind="sse"),
+    Scenario("POST", "/api/mock-interview/start", mock_start),
+    Scenario("POST", "/api/mock-interview/start/stream", mock_start, kind="sse"),
+    Scenario("POST", "/api/mock-interview/continue", mock_turn, prepare=started_interview),
+    Scenario("POST", "/api/mock-interview/continue/stream", mock_turn, prepare=started_interview, kind="sse"),
+    Scenario("POST", "/api/mock-interview/evaluate", mock_session, prepare=started_interview),
+    Scenario("POST", "/api/mock-interview/evaluate/stream", mock_session, prepare=started_interview, kind="sse"),
+    Scenario("POST", "/api/resume-analyze", resume),
+    Scenario("POST", "/api/resume-analyze/stream", resume, kind="sse"),
+    Scenario("POST", "/api/evaluate", evaluation),
+    Scenario("POST", "/api/evaluate/stream", evaluation, kind="sse"),
+    Scenario("POST", "/api/evaluate/batch", eval_batch, kind="ndjson"),
+    Scenario("POST", "/api/jobs/daily-plan", daily_plan, kind="job"),
+    Scenario("POST", "/api/jobs/interview-prep", interview, kind="job"),
+    Scenario("POST", "/api/jobs/job-search", job_search, kind="job"),
+    Scenario("GET", "/api/traces"),
+    Scenario("GET", "/api/traces/stats"),
+    Scenario("GET", "/api/usage"),
+    Scenario("GET", "/api/cache/stats"),
+    Scenario("GET", "/api/search-cache/stats"),
+    Scenario("GET", "/api/interview-research/stats"),
+    Scenario("GET", "/api/models"),
+    Scenario("GET", "/api/context-cache/stats"),
+    Scenario("GET", "/api/sessions/stats"),
+    Scenario("GET", "/api/admission/stats"),
+    Scenario("GET", "/api/rate-limit/stats"),
+    Scenario("GET", "/api/coalescing/stats"),
+    Scenario("GET", "/api/jobs/stats"),
+    Scenario("GET", "/api/agents"),
+]
+
+
+def failure(scenario: Scenario, response: httpx.Response) -> Optional[str]:
+    """Why a response counts as failed, or None (streams report errors in-band)."""
+    if response.status_code >= 400:
+        return str(response.status_code)
+    if scenario.kind == "sse" and "event: final" not in response.text:
+        return "stream_error"
+    if scenario.kind == "ndjson":
+        summary = json.loads(response.text.strip().splitlines()[-1])
+        if summary.get("failed"):
+            return "batch_item_failed"
+    return None
+
+
+async def call(client: httpx.AsyncClient, scenario: Scenario, i: int, ctx: Dict) -> Optional[str]:
+    body = scenario.body(i, ctx) if scenario.body else None
+    response = await client.request(scenario.method, scenario.path, json=body)
+    if scenario.kind != "job" or response.status_code != 202:
+        return failure(scenario, response)
+    # Jobs are timed until the result is available
+    poll_url = response.json()["poll_url"]
+    while True:
+        job = (await client.get(poll_url, params={"wait": 30})).json()
+        if job["status"] in ("succeeded", "failed"):
+            return None if job["status"] == "succeeded" else "job_failed"
+
+
+def percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(q * len(ordered)) - 1))]
+
+
+async def loop_lag_probe(stop: asyncio.Event, lags: list, interval: float = 0.01):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - start - interval)
+
+
+async def run_scenario(client: httpx.AsyncClient, scenario: Scenario, requests: int, concurrency: int) -> Dict:
+    contexts = [await scenario.prepare(client, i) if scenario.prepare else {} for i in range(requests)]
+    latencies, failures, lags = [], {}, []
+    next_index = iter(range(requests))
+
+    async def worker():
+        for i in next_index:
+            start = time.perf_counter()
+            try:
+                reason = await call(client, scenario, i, contexts[i])
+            except Exception as e:
+                reason = type(e).__name__
+            latencies.append(time.perf_counter() - start)
+            if reason:
+                failures[reason] = failures.get(reason, 0) + 1
+
+    stop = asyncio.Event()
+    probe = asyncio.create_task(loop_lag_probe(stop, lags))
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, requests))))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await probe
+
+    return {
+        "requests": requests,
+        "failed": sum(failures.values()),
+        "failures": failures,
+        "elapsed_seconds": round(elapsed, 3),
+        "throughput_rps": round(requests / elapsed, 2),
+        "latency_ms": {q: round(percentile(latencies, p) * 1e3, 1)
+                       for q, p in (("p50", 0.50), ("p95", 0.95), ("p99", 0.99))},
+        "loop_lag_ms": {
+            "p50": round(percentile(lags, 0.50) * 1e3, 2),
+            "p99": round(percentile(lags, 0.99) * 1e3, 2),
+            "max": round(max(lags, default=0.0) * 1e3, 2)
+        }
+    }
+
+
+def backend_settings(args) -> Dict[str, str]:
+    env = {"LLM_BACKEND": args.backend, "GEMINI_RATE_LIMIT_ENABLED": "false"}
+    if args.backend == "fake":
+        env.update({
+            "FAKE_LLM_LATENCY": args.latency,
+            "FAKE_LLM_MODEL_LATENCY": args.model_latency,
+            "FAKE_LLM_SEARCH_LATENCY": args.search_latency,
+            "FAKE_LLM_OUTPUT_TOKENS": args.output_tokens,
+            "FAKE_LLM_ERROR_RATE": str(args.error_rate),
+            "FAKE_LLM_SEED": str(args.seed),
+        })
+    elif args.backend == "replay":
+        env.update({"LLM_CASSETTE_DIR": args.cassettes, "LLM_REPLAY_LATENCY_SCALE": str(args.replay_latency_scale)})
+    else:
+        # Real calls: keep the client-side pacing
+        env["GEMINI_RATE_LIMIT_ENABLED"] = "true"
+    if args.record:
+        env.update({"LLM_CASSETTE_RECORD": "true", "LLM_CASSETTE_DIR": args.record})
+    if not args.with_caches:
+        # Measure the full orchestration path on every request
+        env["RESPONSE_CACHE_WORKFLOWS"] = ""
+        env["COALESCE_WORKFLOWS"] = ""
+        env["SEARCH_CACHE_ENABLED"] = "false"
+        env["INTERVIEW_RESEARCH_ENABLED"] = "false"
+        env["CONTEXT_CACHE_ENABLED"] = "false"
+    return env
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except Exception:
+        return None
+
+
+async def drive(args, client: httpx.AsyncClient, out=None) -> Dict[str, Dict]:
+    selected = [s for s in SCENARIOS if not args.only or any(part in s.name for part in args.only)]
+    results = {}
+    out = out or sys.stdout
+    print(f"{'route':<46}{'req/s':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'lag p99':>9}{'failed':>8}", file=out)
+    for scenario in selected:
+        result = await run_scenario(client, scenario, args.requests, args.concurrency)
+        results[scenario.name] = result
+        latency = result["latency_ms"]
+        print(f"{scenario.name:<46}{result['throughput_rps']:>8.1f}{latency['p50']:>9.1f}{latency['p95']:>9.1f}"
+              f"{latency['p99']:>9.1f}{result['loop_lag_ms']['p99']:>9.2f}{result['failed']:>8}", file=out, flush=True)
+    return results
+
+
+async def run_in_process(args) -> Dict[str, Dict]:
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ.update(backend_settings(args))
+        os.environ.update({
+            "DATABASE_URL": f"sqlite:///{tmp}/sessions.db",
+            "TRACE_FILE_PATH": f"{tmp}/traces.jsonl",
+            "TRACE_DB_PATH": f"{tmp}/traces.db",
+            "JOB_DB_PATH": f"{tmp}/jobs.db",
+            "SEARCH_CACHE_DB_PATH": f"{tmp}/search_cache.db",
+            "INTERVIEW_RESEARCH_DB_PATH": f"{tmp}/interview_research.db",
+        })
+        import logging
+        logging.disable(logging.WARNING)
+        out = sys.stdout
+        # The agent logging plugin prints every LLM call; keep the report readable
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            from app.main import app, wait_until_ready
+
+            await app.router.startup()
+            # Don't bill the background warm-up (runner and agent builds) to the first route
+            await wait_until_ready()
+            try:
+                transport = httpx.ASGITransport(app=app)
+                async with httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=None) as client:
+                    return await drive(args, client, out)
+            finally:
+                await app.router.shutdown()
+
+
+async def run_remote(args) -> Dict[str, Dict]:
+    limits = httpx.Limits(max_connections=args.concurrency * 2)
+    async with httpx.AsyncClient(base_url=args.url, timeout=None, limits=limits) as client:
+        return await drive(args, client)
+
+
+def compare(current: Dict, baseline: Dict, tolerance: float) -> int:
+    """Print per-route deltas; returns the number of regressions beyond `tolerance`."""
+    print(f"\nvs baseline {baseline.get('git_revision')} ({baseline.get('created_at')}), tolerance {tolerance:.0%}")
+    print(f"{'route':<46}{'req/s':>16}{'p95 ms':>18}{'p99 ms':>18}")
+    regressions = 0
+    for name, result in current["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            print(f"{name:<46}{'(new)':>16}")
+            continue
+        rps_change = result["throughput_rps"] / before["throughput_rps"] - 1 if before["throughput_rps"] else 0.0
+        cells = [f"{rps_change:+.1%}"]
+        worse = rps_change < -tolerance or result["failed"] > before["failed"]
+        for q in ("p95", "p99"):
+            old, new = before["latency_ms"][q], result["latency_ms"][q]
+            change = new / old - 1 if old else 0.0
+            # Ignore jitter on sub-millisecond routes
+            worse |= change > tolerance and new - old > MIN_LATENCY_DELTA_MS
+            cells.append(f"{old:.0f}->{new:.0f} {change:+.0%}")
+        regressions += worse
+        print(f"{name:<46}{cells[0]:>16}{cells[1]:>18}{cells[2]:>18}{'  REGRESSION' if worse else ''}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=40, help="requests per route")
+    parser.add_argument("--concurrency", type=int, default=8, help="concurrent clients per route")
+    parser.add_argument("--only", nargs="*", help="run routes whose 'METHOD /path' contains any of these")
+    parser.add_argument("--url", help="drive a running server instead of the in-process app")
+    parser.add_argument("--backend", choices=("fake", "replay", "gemini"), default="fake",
+                        help="LLM backend for the in-process app (gemini needs a real GOOGLE_API_KEY)")
+    parser.add_argument("--cassettes", default="benchmarks/cassettes", help="cassette directory for --backend replay")
+    parser.add_argument("--replay-latency-scale", type=float, default=0.0,
+                        help="1 = recorded model latency, 0 = none (orchestration only)")
+    parser.add_argument("--record", help="also record every LLM call into cassettes in this directory")
+    parser.add_argument("--latency", default="fixed:0.05", help="fake LLM latency distribution")
+    parser.add_argument("--model-latency", default="",
+                        help='per-model fake latency as JSON, e.g. {"gemini-2.5-flash-lite": "fixed:0.03"}')
+    parser.add_argument("--search-latency", default="fixed:0.05", help="extra latency for google_search agents")
+    parser.add_argument("--output-tokens", default="uniform:200,600")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fake LLM error injection rate")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--with-caches", action="store_true", help="keep the response/search/context caches, interview research store and coalescing enabled")
+    parser.add_argument("--output", help="write results as JSON to this path")
+    parser.add_argument("--compare", help="baseline JSON to diff the results against")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="relative change counted as a regression")
+    args = parser.parse_args()
+
+    runner = run_remote if args.url else run_in_process
+    backend = {"fake": f"fake LLM latency {args.latency}",
+               "replay": f"replaying {args.cassettes} at latency x{args.replay_latency_scale:g}",
+               "gemini": "live Gemini"}[args.backend]
+    print(f"{'server at ' + args.url if args.url else 'in-process app'}, {backend}, "
+          f"{args.requests} requests/route at concurrency {args.concurrency}\n")
+    results = asyncio.run(runner(args))
+
+    report = {
+        "schema_version": SCHEMA_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git_revision": git_revision(),
+        "environment": {"python": platform.python_version(), "platform": platform.platform(),
+                        "target": args.url or "in-process", "loop_lag_scope": "client" if args.url else "server"},
+        "config": {"requests": args.requests, "concurrency": args.concurrency,
+                   "with_caches": args.with_caches, **backend_settings(args)},
+        "results": results
+    }
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"\nwrote {args.output}")
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if compare(report, baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
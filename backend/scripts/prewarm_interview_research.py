@@ -0,0 +1,92 @@
+"""
+Pre-warm the shared interview research store.
+
+Runs the research steps of the interview workflow (search + processing) for
+a list of target companies/roles, so interview prep for them only runs the
+final personalization step. Meant to run offline (cron, deploy hook) against
+the same INTERVIEW_RESEARCH_DB_PATH as the API.
+
+Usage (from backend/):
+    python -m scripts.prewarm_interview_research --targets targets.csv --top 50
+    python -m scripts.prewarm_interview_research --from-store --top 50
+
+targets.csv has rows of "company,role[,requests]"; with --top, the N rows
+with the most requests are used. --from-store refreshes the N entries that
+have been reused most.
+"""
+import argparse
+import asyncio
+import csv
+import sys
+import time
+from typing import List, Tuple
+
+from app.services.adk_runner import SynergyAIRunner
+
+
+def read_targets(path: str) -> List[Tuple[str, str, int]]:
+    targets = []
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.reader(f):
+            if len(row) < 2 or not row[0].strip() or row[0].strip().lower() == "company":
+                continue
+            count = int(row[2]) if len(row) > 2 and row[2].strip().isdigit() else 0
+            targets.append((row[0].strip(), row[1].strip(), count))
+    return targets
+
+
+async def prewarm(runner: SynergyAIRunner, targets: List[Tuple[str, str]], concurrency: int, force: bool) -> int:
+    semaphore = asyncio.Semaphore(concurrency)
+    failed = 0
+
+    async def one(company: str, role: str):
+        nonlocal failed
+        async with semaphore:
+            if not force and await asyncio.to_thread(runner.interview_research.get_fresh, company, role, False):
+                print(f"fresh    {company} / {role}")
+                return
+            started = time.perf_counter()
+            result = await runner.refresh_interview_research(company, role)
+            if result["success"]:
+                print(f"stored   {company} / {role} ({time.perf_counter() - started:.1f}s)")
+            else:
+                failed += 1
+                print(f"failed   {company} / {role}: {result.get('error')}", file=sys.stderr)
+
+    runner.trace_sink.start()
+    try:
+        await asyncio.gather(*(one(company, role) for company, role in targets))
+    finally:
+        await runner.trace_sink.stop()
+    return failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--targets", help="CSV of company,role[,requests]")
+    parser.add_argument("--from-store", action="store_true", help="refresh the most reused stored entries")
+    parser.add_argument("--top", type=int, default=50, help="number of targets to pre-warm")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--force", action="store_true", help="re-research entries that are still fresh")
+    args = parser.parse_args()
+
+    runner = SynergyAIRunner()
+    if runner.interview_research is None:
+        parser.error("INTERVIEW_RESEARCH_ENABLED is false")
+    if args.from_store:
+        targets = [(row["company"], row["role"]) for row in runner.interview_research.top(args.top)]
+        # Stored entries are refreshed whether or not they are still fresh
+        args.force = True
+    elif args.targets:
+        rows = sorted(read_targets(args.targets), key=lambda row: row[2], reverse=True)
+        targets = [(company, role) for company, role, _ in rows[:args.top]]
+    else:
+        parser.error("pass --targets or --from-store")
+
+    print(f"Pre-warming {len(targets)} targets")
+    failed = asyncio.run(prewarm(runner, targets, args.concurrency, args.force))
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()